@@ -0,0 +1,133 @@
+"""
+benchmarks/generators.py
+
+Générateurs de systèmes d'argumentation synthétiques pour les benchmarks.
+Chaque famille construit un AS de taille n à partir d'une graine (même graine => même AS) :
+    - random : graphe aléatoire avec en moyenne DEGREE attaques par argument.
+    - grid : grille carrée, chaque case attaque ou est attaquée par ses voisines de droite et du bas (sens tiré au hasard).
+    - chain : chaîne a0 -> a1 -> ... (résolue entièrement par l'extension fondée).
+    - cycles : CYCLES cycles de longueur n / CYCLES (pairs ou impairs), chacun attaqué par le précédent.
+    - dense : noyau dense (une attaque sur deux) de DENSE_CORE arguments entouré d'arguments peu attaqués.
+Utilisable en ligne de commande pour écrire un fichier .apx :
+    python3 -m benchmarks.generators grid 400 --seed 1 > grid.apx
+"""
+import argparse
+import random
+import sys
+from math import isqrt
+from src.systeme_argumentation import AS
+
+DEGREE = 2          # Nombre moyen d'attaques par argument (famille random).
+CYCLES = 8          # Nombre de cycles (famille cycles).
+DENSE_CORE = 24     # Taille maximale du noyau dense (famille dense).
+
+def _names(n: int) -> list[str]:
+    return [f"a{i}" for i in range(n)]
+
+def random_af(n: int, rnd: random.Random) -> AS:
+    """
+    Graphe aléatoire : n * DEGREE attaques tirées uniformément.
+    """
+    A = _names(n)
+    R = {(rnd.choice(A), rnd.choice(A)) for _ in range(int(n * DEGREE))}
+    return AS(set(A), R)
+
+def grid_af(n: int, rnd: random.Random) -> AS:
+    """
+    Grille de côté isqrt(n) : une attaque entre deux cases voisines, dans un sens tiré au hasard.
+    """
+    side = max(1, isqrt(n))
+    A = _names(side * side)
+    R = set()
+    for r in range(side):
+        for c in range(side):
+            x = A[r * side + c]
+            for r2, c2 in ((r, c + 1), (r + 1, c)):
+                if r2 < side and c2 < side:
+                    y = A[r2 * side + c2]
+                    R.add((x, y) if rnd.random() < 0.5 else (y, x))
+    return AS(set(A), R)
+
+def chain_af(n: int, rnd: random.Random) -> AS:
+    """
+    Chaîne d'attaques a0 -> a1 -> ... -> a(n-1).
+    """
+    A = _names(n)
+    return AS(set(A), {(A[i], A[i + 1]) for i in range(n - 1)})
+
+def cycles_af(n: int, rnd: random.Random) -> AS:
+    """
+    CYCLES cycles de longueur n / CYCLES (plus ou moins un, au hasard), chacun attaqué par le précédent.
+    """
+    A = _names(n)
+    R = set()
+    start, prev = 0, None
+    while start < n:
+        length = min(max(1, n // CYCLES) + rnd.randint(0, 1), n - start)
+        ring = A[start:start + length]
+        for i, x in enumerate(ring):
+            R.add((x, ring[(i + 1) % length]))
+        if prev is not None:
+            R.add((prev, ring[0]))
+        prev = ring[-1]
+        start += length
+    return AS(set(A), R)
+
+def dense_af(n: int, rnd: random.Random) -> AS:
+    """
+    Noyau dense de min(n, DENSE_CORE) arguments, les autres arguments attaquent ou sont attaqués par le noyau.
+    """
+    A = _names(n)
+    k = min(n, DENSE_CORE)
+    core = A[:k]
+    R = {(x, y) for x in core for y in core if x != y and rnd.random() < 0.5}
+    for x in A[k:]:
+        if rnd.random() < 0.5:
+            R.add((x, rnd.choice(core)))
+        else:
+            R.add((rnd.choice(core), x))
+    return AS(set(A), R)
+
+FAMILIES = {
+    "random": random_af,
+    "grid": grid_af,
+    "chain": chain_af,
+    "cycles": cycles_af,
+    "dense": dense_af,
+}
+
+def generate(family: str, n: int, seed: int = 0) -> AS:
+    """
+    Construit un AS synthétique.
+    Args:
+        - family: nom de la famille (clé de FAMILIES).
+        - n: nombre d'arguments (arrondi au carré inférieur pour grid).
+        - seed: graine du tirage aléatoire.
+    Returns: Le système d'argumentation.
+    Raises: ValueError: si la famille est inconnue.
+    """
+    if family not in FAMILIES:
+        raise ValueError(f"Famille inconnue: {family}")
+    return FAMILIES[family](n, random.Random(f"{family}-{n}-{seed}"))
+
+def write_apx(systeme_argumentation: AS, stream):
+    """
+    Ecrit un AS au format .apx.
+    """
+    af = systeme_argumentation
+    for a in af.names:
+        stream.write(f"arg({a}).\n")
+    for i, targets in enumerate(af.succ):
+        for j in targets:
+            stream.write(f"att({af.names[i]},{af.names[j]}).\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Génère un système d'argumentation synthétique au format .apx.")
+    parser.add_argument("family", choices=sorted(FAMILIES))
+    parser.add_argument("n", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_apx(generate(args.family, args.n, args.seed), sys.stdout)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+benchmarks/parse.py
+
+Mesure du temps de lecture d'un gros fichier .apx, comparé au parseur d'origine (lecture ligne par ligne,
+reproduit ici dans baseline_parse_apx) :
+    - baseline : parseur d'origine, ensembles A et R.
+    - parse_apx : mêmes ensembles A et R (src/apx_parser.py).
+    - parse_apx_indexed : noms et tableaux d'identifiants (attaquant, attaqué).
+    - load_apx : AS complet (listes d'adjacence avant et arrière), prêt pour les solveurs.
+    - baseline+AS : parseur d'origine suivi de la construction du même AS (AS(A, R)).
+Le fichier de test est un graphe aléatoire (famille random de benchmarks/generators.py) de --lines lignes,
+ou un fichier .apx existant (--file). Chaque scénario donne le meilleur temps de --repeat lectures
+et l'accélération par rapport au parseur d'origine. Le rapport est écrit en JSON.
+    python3 -m benchmarks.parse --output parse.json
+    python3 -m benchmarks.parse --file grand.apx --repeat 3
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from src.systeme_argumentation import AS
+from src.apx_parser import parse_apx, parse_apx_indexed, load_apx
+from benchmarks.generators import DEGREE, generate, write_apx
+
+LINES = 900_000         # Nombre de lignes du fichier généré (arguments et attaques).
+REPEAT = 3
+
+def baseline_parse_apx(path: str) -> tuple[set[str], set[tuple[str, str]]]:
+    """
+    Parseur d'origine (une itération Python par ligne), conservé comme référence.
+    """
+    A = set()
+    R = set()
+    with open(path, 'r', encoding='utf-8') as fichier:
+        for ligne in fichier:
+            ligne = ligne.strip()
+            if ligne.startswith("arg("):
+                A.add(ligne[4:-2].lower())
+            elif ligne.startswith("att("):
+                args = ligne[4:-2]
+                args = args.split(',')
+                x = args[0].lower()
+                y = args[1].lower()
+                if x not in A or y not in A:
+                    raise ValueError("Error: Argument utilisé dans une attaque avant d’être déclaré.")
+                else:
+                    R.add((x, y))
+    return A, R
+
+SCENARIOS = {
+    "baseline": baseline_parse_apx,
+    "parse_apx": parse_apx,
+    "parse_apx_indexed": parse_apx_indexed,
+    "load_apx": load_apx,
+    "baseline+AS": lambda path: AS(*baseline_parse_apx(path)),
+}
+
+def measure(fn, path: str, repeat: int) -> float:
+    """
+    Lit repeat fois le fichier.
+    Returns: Le meilleur temps en secondes.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        res = fn(path)
+        best = min(best, time.perf_counter() - start)
+        del res         # Libéré avant la mesure suivante.
+    return best
+
+def run(path: str, repeat: int) -> list[dict]:
+    """
+    Mesure tous les scénarios sur un fichier.
+    Returns: Liste des scénarios mesurés (dictionnaires).
+    """
+    scenarios = []
+    reference = None
+    for name, fn in SCENARIOS.items():
+        best = measure(fn, path, repeat)
+        if reference is None:
+            reference = best        # Le premier scénario est le parseur d'origine.
+        scenarios.append({"scenario": name, "wall_time": best, "speedup": reference / best})
+        print(f"{name:18} {best:8.3f}s  x{reference / best:.2f}", file=sys.stderr)
+    return scenarios
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Temps de lecture d'un gros fichier .apx.")
+    parser.add_argument("--lines", type=int, default=LINES, help="taille du fichier généré")
+    parser.add_argument("--file", help="fichier .apx à lire (au lieu d'un fichier généré)")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--output", help="fichier du rapport JSON (sortie standard par défaut)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = os.path.join(tmp, "random.apx")
+            with open(path, 'w', encoding='utf-8') as f:
+                write_apx(generate("random", int(args.lines / (1 + DEGREE))), f)
+        with open(path, 'rb') as f:
+            lines = sum(1 for _ in f)
+        print(f"{path}: {lines} lignes", file=sys.stderr)
+        scenarios = run(path, args.repeat)
+    report = {"python": platform.python_version(), "machine": platform.machine(), "lines": lines, "scenarios": scenarios}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+benchmarks/run.py
+
+Banc de mesure du solveur sur des systèmes synthétiques (benchmarks/generators.py).
+Pour chaque famille, taille et moteur, on mesure :
+    - chaque problème accepté par la ligne de commande (VE / DC / DS x PR / ST / GR / CO / SST / ID) que le moteur
+      résout lui-même : sat et parallel n'encodent que PR / ST et passeraient la main à src/queries.py pour
+      les autres sémantiques, ces couples ne sont donc pas mesurés (ils seraient attribués au mauvais moteur) ;
+    - l'énumération complète des extensions de chaque sémantique (EE-PR, EE-ST), qui donne les extensions par seconde.
+Chaque mesure donne le temps (le meilleur de --repeat exécutions), le pic mémoire (tracemalloc, exécution à part)
+et le nombre d'extensions par seconde (énumérations seulement). Le rapport est écrit en JSON.
+Avec --baseline, les mesures sont comparées à un rapport précédent : le programme échoue (code 1)
+si un scénario est plus lent que sa référence au-delà de la tolérance.
+    python3 -m benchmarks.run --output bench.json
+    python3 -m benchmarks.run --baseline bench.json
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from src.cli import PROBLEMS
+from src.systeme_argumentation import AS
+from src.cache import ExtensionCache
+from src import queries, semantics, parallel, sat
+from benchmarks.generators import FAMILIES, generate
+
+SIZES = [50, 200, 1000]
+TOLERANCE = 0.25        # Ralentissement toléré par rapport à la référence (25 %).
+NOISE = 0.005           # En dessous de cet écart (en secondes), une différence de temps est du bruit.
+JOBS = 2                # Nombre de processus du moteur parallel.
+
+def _search_extensions(af: AS, semantic: str) -> list[set[str]]:
+    return semantics.preferred_extensions(af) if semantic == 'PR' else semantics.stable_extensions(af)
+
+BACKENDS = {    # Moteur -> (énumération des extensions, résolution d'une requête).
+    "search": (_search_extensions,
+               lambda problem, af, query: queries.solve_query(problem, af, query)),
+    "enumeration": (_search_extensions,
+                    lambda problem, af, query: queries.solve_query(problem, af, query, ExtensionCache(af))),
+    "parallel": (lambda af, semantic: parallel.extensions(af, semantic, JOBS),
+                 lambda problem, af, query: parallel.solve_query(problem, af, query, JOBS)),
+    "sat": (sat.extensions, sat.solve_query),
+}
+NATIVE = {      # Moteur -> sémantiques qu'il résout lui-même (toutes si le moteur n'y est pas).
+    "parallel": ('PR', 'ST'),
+    "sat": ('PR', 'ST'),
+}
+
+def _queries(af: AS) -> dict:
+    """
+    Choisit une requête par problème : VE sur une extension trouvée (réponse YES),
+    DC / DS sur l'argument le plus attaqué parmi ceux que l'extension fondée ne tranche pas.
+    """
+    undecided = sorted(set(af.A) - semantics.grounded_extension(af)) or sorted(af.A)
+    target = max(undecided, key=lambda a: (len(af.attackers_of(a)), a))
+    res = {}
+    for problem in PROBLEMS:
+        kind, _, semantic = problem.partition('-')
+        if kind == 'VE':
+            match semantic:
+                case 'PR':
+                    found = next(semantics.iter_preferred_extensions(af), None)
+                case 'ST':
+                    found = next(semantics.iter_stable_extensions(af), None)
+                case 'SST':
+                    found = next(iter(semantics.semi_stable_extensions(af)), None)
+                case 'ID':
+                    found = semantics.ideal_extension(af)
+                case _:     # GR, CO : l'extension fondée est complète.
+                    found = semantics.grounded_extension(af)
+            res[problem] = found or semantics.grounded_extension(af) or {target}
+        else:
+            res[problem] = target
+    return res
+
+def measure(fn, repeat: int) -> tuple[float, int, object]:
+    """
+    Mesure un appel sans argument.
+    Returns: Triplet (meilleur temps en secondes, pic mémoire en octets, résultat).
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        res = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, res
+
+def run(families: list[str], sizes: list[int], backends: list[str], repeat: int, seed: int):
+    """
+    Exécute tous les scénarios.
+    Returns: Liste des scénarios mesurés (dictionnaires).
+    """
+    scenarios = []
+    for family in families:
+        for n in sizes:
+            af = generate(family, n, seed)
+            requetes = _queries(af)
+            for backend in backends:
+                enumerate_fn, solve_fn = BACKENDS[backend]
+                jobs = [(f"EE-{sem}", None, lambda sem=sem: enumerate_fn(af, sem)) for sem in ('PR', 'ST')]
+                native = NATIVE.get(backend)
+                jobs += [(p, requetes[p], lambda p=p: solve_fn(p, af, requetes[p])) for p in PROBLEMS
+                         if native is None or p.partition('-')[2] in native]
+                for problem, query, fn in jobs:
+                    wall, peak, res = measure(fn, repeat)
+                    scenario = {
+                        "family": family, "size": n, "seed": seed, "backend": backend, "problem": problem,
+                        "arguments": len(af.A), "attacks": af.nb_attacks,
+                        "query": sorted(query) if isinstance(query, set) else query,
+                        "wall_time": wall, "peak_memory": peak,
+                        "result": len(res) if problem.startswith("EE-") else res,
+                        "extensions_per_second": len(res) / wall if problem.startswith("EE-") and wall > 0 else None,
+                    }
+                    scenarios.append(scenario)
+                    print(f"{family:8} {n:6} {backend:12} {problem:6} {wall:9.4f}s {peak / 1e6:8.2f}Mo", file=sys.stderr)
+    return scenarios
+
+def key(scenario: dict) -> tuple:
+    return scenario["family"], scenario["size"], scenario["seed"], scenario["backend"], scenario["problem"]
+
+def compare(scenarios: list[dict], baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compare les mesures à un rapport de référence.
+    Returns: Liste des régressions (scénario plus lent que sa référence au-delà de la tolérance).
+    """
+    old = {key(s): s for s in baseline["scenarios"]}
+    res = []
+    for s in scenarios:
+        ref = old.get(key(s))
+        if ref is None:
+            continue
+        if s["wall_time"] > ref["wall_time"] * (1 + tolerance) and s["wall_time"] - ref["wall_time"] > NOISE:
+            res.append(f"{'/'.join(map(str, key(s)))}: {ref['wall_time']:.4f}s -> {s['wall_time']:.4f}s")
+    return res
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks du solveur sur des systèmes synthétiques.")
+    parser.add_argument("--families", default=",".join(FAMILIES))
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="fichier du rapport JSON (sortie standard par défaut)")
+    parser.add_argument("--baseline", help="rapport de référence : échec si un scénario est plus lent")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+    families = args.families.split(",")
+    backends = args.backends.split(",")
+    for name, known in ((families, FAMILIES), (backends, BACKENDS)):
+        unknown = [x for x in name if x not in known]
+        if unknown:
+            parser.error(f"inconnu(s): {', '.join(unknown)}")
+
+    scenarios = run(families, [int(n) for n in args.sizes.split(",")], backends, args.repeat, args.seed)
+    report = {"python": platform.python_version(), "machine": platform.machine(), "scenarios": scenarios}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1)
+    elif not args.baseline:
+        json.dump(report, sys.stdout, indent=1)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(scenarios, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"Régression: {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
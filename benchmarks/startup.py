@@ -0,0 +1,116 @@
+"""
+benchmarks/startup.py
+
+Mesure du temps de démarrage de program.py : chaque problème est résolu sur un petit système
+(famille chain de benchmarks/generators.py), en lançant un nouveau processus à chaque exécution.
+Sur un si petit système, le temps mesuré est presque entièrement celui du démarrage (interpréteur, imports,
+lecture de la ligne de commande). Le temps de "python3 -c pass" est mesuré à part : c'est le plancher
+de l'interpréteur, la colonne overhead donne le temps propre au programme au-dessus de ce plancher.
+Chaque scénario donne le meilleur temps et le temps médian de --repeat exécutions. Le rapport est écrit en JSON
+et peut être comparé à un rapport précédent avec --baseline (échec, code 1, en cas de régression).
+    python3 -m benchmarks.startup --output startup.json
+    python3 -m benchmarks.startup --baseline startup.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from src.cli import PROBLEMS
+from benchmarks.generators import generate, write_apx
+from benchmarks.run import TOLERANCE, NOISE
+
+SIZE = 20               # Nombre d'arguments du système de test.
+REPEAT = 20
+PROGRAM = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "program.py")
+
+def _commands(path: str) -> dict:
+    """
+    Donne la ligne de commande de chaque scénario (chaîne a0 -> a1 -> ... : a0 est accepté, a1 rejeté).
+    """
+    res = {"interpreter": [sys.executable, "-c", "pass"]}
+    for problem in PROBLEMS:
+        query = "a0,a2" if problem.startswith("VE-") else "a1"
+        res[problem] = [sys.executable, PROGRAM, "-p", problem, "-f", path, "-a", query]
+    res["EE-PR"] = [sys.executable, PROGRAM, "-p", "EE-PR", "-f", path]
+    return res
+
+def measure(command: list[str], repeat: int) -> tuple[float, float]:
+    """
+    Lance repeat fois une commande.
+    Returns: Couple (meilleur temps, temps médian) en secondes.
+    Raises: RuntimeError: si la commande échoue.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        done = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        times.append(time.perf_counter() - start)
+        if done.returncode != 0:
+            raise RuntimeError(f"{' '.join(command)}: {done.stderr.decode(errors='replace').strip()}")
+    return min(times), statistics.median(times)
+
+def run(repeat: int) -> list[dict]:
+    """
+    Mesure tous les scénarios.
+    Returns: Liste des scénarios mesurés (dictionnaires).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "chain.apx")
+        with open(path, 'w', encoding='utf-8') as f:
+            write_apx(generate("chain", SIZE, 0), f)
+        scenarios = []
+        floor = None
+        for name, command in _commands(path).items():
+            best, median = measure(command, repeat)
+            if floor is None:
+                floor = median      # Le premier scénario est l'interpréteur seul.
+            scenarios.append({"problem": name, "wall_time": best, "median": median, "overhead": median - floor})
+            print(f"{name:12} {best * 1e3:8.2f}ms {median * 1e3:8.2f}ms (+{(median - floor) * 1e3:.2f}ms)", file=sys.stderr)
+    return scenarios
+
+def compare(scenarios: list[dict], baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compare les temps médians à un rapport de référence.
+    Returns: Liste des régressions.
+    """
+    old = {s["problem"]: s for s in baseline["scenarios"]}
+    res = []
+    for s in scenarios:
+        ref = old.get(s["problem"])
+        if ref is None:
+            continue
+        if s["median"] > ref["median"] * (1 + tolerance) and s["median"] - ref["median"] > NOISE:
+            res.append(f"{s['problem']}: {ref['median'] * 1e3:.2f}ms -> {s['median'] * 1e3:.2f}ms")
+    return res
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Temps de démarrage de program.py.")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--output", help="fichier du rapport JSON (sortie standard par défaut)")
+    parser.add_argument("--baseline", help="rapport de référence : échec si un scénario est plus lent")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+
+    scenarios = run(args.repeat)
+    report = {"python": platform.python_version(), "machine": platform.machine(), "scenarios": scenarios}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1)
+    elif not args.baseline:
+        json.dump(report, sys.stdout, indent=1)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(scenarios, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"Régression: {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
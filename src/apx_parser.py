@@ -3,7 +3,98 @@ src/parse_apx.py
 
 Parsing des fichiers .apx décrivant une AS.
 Lecture des arguments et des attaques.
+Le fichier est lu par gros blocs et chaque bloc (décodé et mis en minuscule d'un seul coup) est parcouru
+par des expressions régulières compilées : il n'est jamais découpé ligne par ligne en chaînes Python,
+et la mémoire utilisée ne dépend que de la taille d'un bloc et du nombre d'arguments / d'attaques.
+Les noms reçoivent un identifiant entier dès leur première apparition,
+les attaques sont stockées dans deux tableaux d'entiers (attaquant, attaqué).
+Toute ligne non vide doit être une ligne arg() ou att() (un texte quelconque peut suivre le point final).
+Une attaque peut apparaître avant la déclaration de ses arguments : la vérification
+que tout argument utilisé a bien été déclaré est faite à la fin du fichier.
 """
+import re
+from array import array
+from collections import defaultdict
+from itertools import chain, count
+from src.systeme_argumentation import AS
+
+CHUNK_SIZE = 1 << 22    # Taille des blocs lus dans le fichier (4 Mo).
+ARG = re.compile(r'\n[ \t]*arg\(([^,()\r\n]+)\)\.')                    # arg(x). (indentation permise)
+ATT = re.compile(r'\n[ \t]*att\(([^,()\r\n]+),([^,()\r\n]+)\)\.')    # att(x,y).
+BLANK = re.compile(r'\n[ \t\r]*(?=\n)')                                   # Ligne vide.
+# Les motifs commencent par le retour à la ligne qui précède la ligne (le bloc commence par un retour à la ligne ajouté) :
+# la recherche saute directement d'une ligne à la suivante au lieu d'essayer chaque position comme avec ^ et MULTILINE.
+
+def _check_lines(texte: str, reconnues: int, debut: int):
+    """
+    Vérifie que chaque ligne non vide d'un bloc est une ligne arg() ou att().
+    Chaque ligne donne au plus une correspondance de ARG ou ATT : si le nombre de lignes non vides
+    est égal au nombre de correspondances, toutes les lignes sont reconnues.
+    Args:
+        - texte: retour à la ligne suivi de lignes complètes (terminées par un retour à la ligne).
+        - reconnues: nombre de correspondances de ARG et ATT dans le bloc.
+        - debut: numéro de la première ligne du bloc dans le fichier.
+    Returns: None
+    Raises: ValueError: avec le numéro de la première ligne qui n'est ni vide, ni arg(), ni att().
+    """
+    lignes = texte.count('\n') - 1
+    if lignes == reconnues or lignes - len(BLANK.findall(texte)) == reconnues:
+        return
+    for numero, ligne in enumerate(texte[1:].split('\n'), debut):
+        if ligne.strip() and not ARG.match('\n' + ligne) and not ATT.match('\n' + ligne):
+            raise ValueError(f"Error: Ligne {numero} mal formée: {ligne.strip()}")
+
+def _blocks(path: str):
+    """
+    Lit un fichier .apx par blocs de lignes complètes, en minuscule, et vérifie chaque ligne.
+    Args:
+        - path: chemin du fichier .apx.
+    Yields: Couple (noms déclarés par arg(), couples (attaquant, attaqué) des lignes att()) pour chaque bloc.
+    Raises: ValueError: si une ligne n'est ni vide, ni arg(), ni att().
+    """
+    reste = b''             # Fin de bloc incomplète (ligne coupée), reportée au bloc suivant.
+    numero = 1              # Numéro de la première ligne du bloc.
+    with open(path, 'rb') as fichier:
+        while True:
+            lu = fichier.read(CHUNK_SIZE)
+            bloc = reste + lu
+            if lu:
+                coupe = bloc.rfind(b'\n') + 1      # On ne traite que des lignes complètes (un retour à la ligne ne coupe pas un caractère UTF-8).
+                bloc, reste = bloc[:coupe], bloc[coupe:]
+            elif bloc and not bloc.endswith(b'\n'):
+                bloc += b'\n'      # La dernière ligne peut ne pas finir par un retour à la ligne.
+            texte = '\n' + bloc.decode('utf-8').lower()     # Noms en minuscule.
+            arguments = ARG.findall(texte)
+            attaques = ATT.findall(texte)
+            _check_lines(texte, len(arguments) + len(attaques), numero)
+            numero += texte.count('\n') - 1
+            yield arguments, attaques
+            if not lu:          # Fin du fichier.
+                break
+
+def parse_apx_indexed(path: str) -> tuple[list[str], array, array]:
+    """
+    Parse un fichier .apx en identifiants entiers.
+    Args:
+        - path: chemin du fichier .apx.
+    Returns:
+        - names: nom de chaque argument (en minuscule), la position est son identifiant.
+        - src: identifiants des attaquants (array d'entiers).
+        - dst: identifiants des attaqués (array d'entiers), src[k] attaque dst[k].
+    Raises: ValueError: si une attaque utilise un argument non déclaré, ou si une ligne est mal formée.
+    """
+    ids = defaultdict(count().__next__)     # Nom -> identifiant, attribué (en C) à la première apparition.
+    declared = set()        # Identifiants déclarés par arg().
+    src, dst = array('i'), array('i')
+    for arguments, attaques in _blocks(path):
+        declared.update(map(ids.__getitem__, arguments))
+        couples = array('i', map(ids.__getitem__, chain.from_iterable(attaques)))  # attaquant, attaqué, attaquant...
+        src.extend(couples[0::2])
+        dst.extend(couples[1::2])
+    if len(declared) != len(ids):     # Validation différée : tout argument utilisé doit être déclaré.
+        raise ValueError("Error: Argument utilisé dans une attaque sans être déclaré.")
+    return list(ids), src, dst
+
 def parse_apx(path: str) -> tuple[set[str], set[tuple[str, str]]]:
     """
     Parse un fichier .apx et construit la AS.
@@ -12,24 +103,22 @@ def parse_apx(path: str) -> tuple[set[str], set[tuple[str, str]]]:
     Returns:
         - A: ensemble des arguments (set[str]).
         - R: ensemble des attaques (set[(str, str)]).
-    Raises: ValueError: si une attaque utilise un argument non déclaré.
-    """
-    A = set()   # Initialisation de l'ensemble des arguments.
-    R = set()   # Initialisation de l'ensemble des relations entre les arguments.
-    
-    # Ouverture du fichier .apx :
-    with open(path, 'r', encoding= 'utf-8') as fichier:
-        for ligne in fichier:       # Lecture ligne par lignes.
-            ligne = ligne.strip()   # Enlève les espaces et les retours à la ligne s'il y'en a. (Ca n'est pas obligatoire mais si jamais.)
-            if ligne.startswith("arg("):        # Si la ligne définie un argument.
-                A.add(ligne[4:-2].lower())  # On ajout le nom de l'argument (en minuscule) à l'ensemble des arguments.
-            elif ligne.startswith("att("):      # Si la ligne définie une relation entre deux arguments.
-                args = ligne[4:-2]
-                args = args.split(',')      # Séparation des deux arguments en relation.
-                x = args[0].lower()     # x = attaquant.
-                y = args[1].lower()     # y = attaqué.
-                if x not in A or y not in A:    # Vérification que les arguments x et y sont bien dans l'ensemble des arguments.
-                    raise ValueError(f"Error: Argument utilisé dans une attaque avant d’être déclaré.")
-                else :      # Si pas les arguments sont bien dans l'ensemble.
-                    R.add((x, y))   # Ajout de la relation dans l'ensemble des relations.
+    Raises: ValueError: si une attaque utilise un argument non déclaré, ou si une ligne est mal formée.
+    """
+    A, R = set(), set()
+    for arguments, attaques in _blocks(path):
+        A.update(arguments)
+        R.update(attaques)
+    if not A.issuperset(chain.from_iterable(R)):     # Validation différée : tout argument utilisé doit être déclaré.
+        raise ValueError("Error: Argument utilisé dans une attaque sans être déclaré.")
     return A, R
+
+def load_apx(path: str) -> AS:
+    """
+    Parse un fichier .apx et construit directement l'AS à partir des tableaux d'adjacence.
+    Args:
+        - path: chemin du fichier .apx.
+    Returns: Le système d'argumentation.
+    Raises: ValueError: si une attaque utilise un argument non déclaré, ou si une ligne est mal formée.
+    """
+    return AS.from_arrays(*parse_apx_indexed(path))
@@ -0,0 +1,217 @@
+"""
+src/bitset.py
+
+Moteur d'extensions à base de masques de bits.
+Chaque argument de l'AS est une position de bit (son identifiant entier),
+un ensemble d'arguments est un entier Python (bit i à 1 <=> argument i dans l'ensemble).
+Pour chaque argument on précalcule :
+    - att[i] : masque des arguments attaqués par i.
+    - atk[i] : masque des attaquants de i.
+Les tests (sans conflit, défense, admissibilité, stabilité) deviennent quelques opérations sur ces masques,
+et les candidats sont produits paresseusement (sans construire l'ensemble des parties).
+Un encodage peut aussi être restreint à une partie des arguments (Bitset.restricted) : les positions
+de bits sont alors 0..k-1 et names donne l'identifiant de l'argument dans l'AS. C'est ce qu'utilise
+src/decomposition.py pour que la taille des masques dépende de la composante et non de tout l'AS.
+"""
+from src.systeme_argumentation import AS
+from src import stats
+
+class Bitset:
+    __slots__ = ("names", "index", "n", "full", "att", "atk", "self_attacking")
+
+    def __init__(self, systeme_argumentation: AS):
+        """
+        Encode un AS sous forme de masques de bits.
+        Args:
+            - systeme_argumentation: système d'argumentation <A, R>.
+        Returns: None
+        """
+        self.names = systeme_argumentation.names    # Nom de chaque position de bit.
+        self.index = systeme_argumentation.index    # Position de bit de chaque argument.
+        self.n = len(self.names)                    # Nombre de positions (arguments retirés compris).
+        self.full = (1 << self.n) - 1               # Masque contenant tous les arguments présents.
+        for i, name in enumerate(self.names):
+            if name is None:                        # Argument retiré.
+                self.full &= ~(1 << i)
+        self.att = [0] * self.n                     # Masques des arguments attaqués.
+        self.atk = [0] * self.n                     # Masques des attaquants.
+        self.self_attacking = 0                     # Masque des arguments qui s'attaquent eux-mêmes.
+        for i, targets in enumerate(systeme_argumentation.succ):
+            for j in targets:
+                self.att[i] |= 1 << j
+                self.atk[j] |= 1 << i
+            if (self.att[i] >> i) & 1:
+                self.self_attacking |= 1 << i
+
+    @classmethod
+    def restricted(cls, systeme_argumentation: AS, ids: list[int]) -> "Bitset":
+        """
+        Encode la restriction de l'AS aux arguments ids (seules les attaques entre eux sont gardées).
+        Args:
+            - systeme_argumentation: système d'argumentation <A, R>.
+            - ids: identifiants des arguments gardés, ids[p] est à la position de bit p.
+        Returns: L'encodage restreint (names[p] = ids[p]).
+        """
+        self = cls.__new__(cls)
+        self.names = ids
+        self.index = {i: p for p, i in enumerate(ids)}
+        self.n = len(ids)
+        self.full = (1 << self.n) - 1
+        self.att = [0] * self.n
+        self.atk = [0] * self.n
+        self.self_attacking = 0
+        index, succ = self.index, systeme_argumentation.succ
+        for p, i in enumerate(ids):
+            for j in succ[i]:
+                q = index.get(j)
+                if q is not None:
+                    self.att[p] |= 1 << q
+                    self.atk[q] |= 1 << p
+            if (self.att[p] >> p) & 1:
+                self.self_attacking |= 1 << p
+        return self
+
+    def to_mask(self, S) -> int:
+        """
+        Transforme un ensemble d'arguments en masque.
+        Args:
+            - S: ensemble d'arguments.
+        Returns: Le masque de S.
+        Raises: ValueError: si S contient un argument inconnu.
+        """
+        m = 0
+        for a in S:
+            i = self.index.get(a)
+            if i is None:
+                raise ValueError("S contient un argument inconnu.")
+            m |= 1 << i
+        return m
+
+    def to_set(self, m: int) -> set[str]:
+        """
+        Transforme un masque en ensemble d'arguments.
+        Args:
+            - m: masque d'arguments.
+        Returns: L'ensemble des arguments dont le bit est à 1.
+        """
+        names = self.names
+        return {names[i] for i in bits(m)}
+
+    def attacked_by(self, m: int) -> int:
+        """
+        Donne le masque des arguments attaqués par au moins un argument de m.
+        """
+        att = self.att
+        res = 0
+        for i in bits(m):
+            res |= att[i]
+        return res
+
+    def attackers_of(self, m: int) -> int:
+        """
+        Donne le masque des arguments qui attaquent au moins un argument de m.
+        """
+        atk = self.atk
+        res = 0
+        for i in bits(m):
+            res |= atk[i]
+        return res
+
+    def is_conflict_free(self, m: int) -> bool:
+        """
+        Vérifie qu'aucun argument de m n'attaque un argument de m.
+        """
+        stats.count("conflict_free_checks")
+        return self.attacked_by(m) & m == 0
+
+    def defends(self, m: int, i: int) -> bool:
+        """
+        Vérifie que tous les attaquants de l'argument i sont attaqués par m.
+        """
+        stats.count("defence_checks")
+        return self.atk[i] & ~self.attacked_by(m) == 0
+
+    def is_admissible(self, m: int) -> bool:
+        """
+        Vérifie que m est sans conflit et que m contre-attaque tous ses attaquants.
+        """
+        stats.count("conflict_free_checks")
+        stats.count("defence_checks")
+        plus = self.attacked_by(m)      # Arguments attaqués par m.
+        return plus & m == 0 and self.attackers_of(m) & ~plus == 0
+
+    def is_stable(self, m: int) -> bool:
+        """
+        Vérifie que m est sans conflit et attaque tous les arguments hors de m.
+        """
+        stats.count("conflict_free_checks")
+        plus = self.attacked_by(m)      # Arguments attaqués par m.
+        return plus & m == 0 and (self.full & ~m) & ~plus == 0
+
+    def iter_conflict_free(self):
+        """
+        Génère paresseusement tous les ensembles sans conflit par retour arrière.
+        Chaque ensemble n'est étendu qu'avec des arguments d'indice supérieur
+        qui ne sont ni attaqués par lui, ni attaquants d'un de ses arguments.
+        Returns: Générateur de masques.
+        """
+        att, atk = self.att, self.atk
+        forbidden0 = self.self_attacking
+        stack = [(0, forbidden0, self.full & ~forbidden0)]  # (ensemble courant, arguments interdits, candidats restants).
+        st = stats.current
+        yield 0
+        while stack:
+            m, forbidden, cand = stack[-1]
+            if not cand:        # Plus de candidat pour cet ensemble, on remonte.
+                stack.pop()
+                continue
+            low = cand & -cand              # Plus petit candidat restant.
+            i = low.bit_length() - 1
+            stack[-1] = (m, forbidden, cand & ~low)
+            m2 = m | low
+            forbidden2 = forbidden | att[i] | atk[i]
+            if st is not None:
+                st.subsets += 1
+            yield m2
+            above = ~((low << 1) - 1)       # Seuls les arguments d'indice supérieur à i sont encore candidats.
+            stack.append((m2, forbidden2, cand & above & ~forbidden2))
+
+
+def encode(systeme_argumentation: AS) -> Bitset:
+    """
+    Donne l'encodage en masques de l'AS (calculé une seule fois puis conservé).
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+    Returns: L'encodage Bitset de l'AS.
+    """
+    bs = systeme_argumentation.bitset
+    if bs is None:
+        bs = Bitset(systeme_argumentation)
+        systeme_argumentation.bitset = bs
+    return bs
+
+def bits(m: int):
+    """
+    Itère sur les positions des bits à 1 d'un masque (du plus faible au plus fort).
+    """
+    while m:
+        low = m & -m
+        yield low.bit_length() - 1
+        m ^= low
+
+def popcount(m: int) -> int:
+    """
+    Donne le nombre de bits à 1 d'un masque.
+    """
+    return bin(m).count("1")
+
+
+# ******** Recherche des extensions: ********
+
+def iter_admissible(bs: Bitset):
+    """
+    Génère les masques des ensembles admissibles.
+    """
+    for m in bs.iter_conflict_free():
+        if bs.attackers_of(m) & ~bs.attacked_by(m) == 0:
+            yield m
@@ -0,0 +1,129 @@
+"""
+src/bulk.py
+
+Vérification groupée d'ensembles candidats : absence de conflit, admissibilité et stabilité
+de tous les candidats en une seule passe sur les attaques.
+Les candidats forment une matrice d'appartenance (une ligne par argument, une colonne par candidat)
+et les attaques une matrice creuse (tableaux attaquant / attaqué). Pour chaque argument j :
+    - attacked[j] : candidats qui attaquent j (OU des lignes de ses attaquants).
+    - conflit : un candidat contient j et l'attaque.
+    - défense : pour chaque attaque z -> j, un candidat qui contient j doit attaquer z.
+    - stabilité : un candidat contient j ou l'attaque.
+Avec NumPy, les lignes sont des tableaux booléens (candidats traités par blocs pour borner la mémoire) ;
+sans NumPy, chaque ligne est un entier Python dont le bit c correspond au candidat c.
+"""
+from itertools import chain
+from src.systeme_argumentation import AS
+
+try:
+    import numpy as np
+except ImportError:     # NumPy est optionnel.
+    np = None
+
+BLOCK = 1 << 24         # Nombre maximal de cases des matrices intermédiaires (NumPy).
+
+def _ids(systeme_argumentation: AS, candidates) -> list:
+    """
+    Traduit les candidats en identifiants (None pour un candidat qui contient un argument inconnu).
+    """
+    lookup = systeme_argumentation.index.__getitem__
+    res = []
+    for S in candidates:
+        try:
+            res.append(list(map(lookup, S)))
+        except KeyError:
+            res.append(None)
+    return res
+
+def _attacks(systeme_argumentation: AS) -> tuple[list[int], list[int]]:
+    """
+    Donne les attaques sous forme de deux listes (attaquant, attaqué).
+    """
+    src, dst = [], []
+    for i, targets in enumerate(systeme_argumentation.succ):
+        src.extend([i] * len(targets))
+        dst.extend(targets)
+    return src, dst
+
+def _check_ints(af: AS, ids: list) -> tuple[int, int, int]:
+    """
+    Vérification avec des entiers Python comme lignes de bits.
+    Returns: Masques des candidats (conflictuels, non défendus, non stables).
+    """
+    n, k = len(af.names), len(ids)
+    member = [0] * n
+    for c, S in enumerate(ids):
+        for i in S or ():
+            member[i] |= 1 << c
+    attacked = [0] * n
+    pred = af.pred
+    for j in af.ids():
+        m = 0
+        for x in pred[j]:
+            m |= member[x]
+        attacked[j] = m
+    everyone = (1 << k) - 1
+    conflict = undefended = unstable = 0
+    for j in af.ids():
+        mj = member[j]
+        conflict |= mj & attacked[j]
+        for z in pred[j]:
+            undefended |= mj & ~attacked[z]
+        unstable |= everyone & ~(mj | attacked[j])
+    return conflict, undefended, unstable
+
+def _check_numpy(af: AS, ids: list) -> tuple:
+    """
+    Vérification avec des matrices NumPy, par blocs de candidats.
+    Returns: Tableaux booléens des candidats (conflictuels, non défendus, non stables).
+    """
+    n, k = len(af.names), len(ids)
+    src, dst = _attacks(af)
+    src, dst = np.asarray(src, dtype=np.intp), np.asarray(dst, dtype=np.intp)
+    order = np.argsort(dst, kind='stable')     # Attaques groupées par attaqué, pour un OU par segment.
+    src_sorted, dst_sorted = src[order], dst[order]
+    targets, starts = np.unique(dst_sorted, return_index=True)
+    present = np.zeros(n, dtype=bool)
+    present[list(af.ids())] = True
+    conflict = np.zeros(k, dtype=bool)
+    undefended = np.zeros(k, dtype=bool)
+    unstable = np.zeros(k, dtype=bool)
+    step = max(1, BLOCK // max(len(src), n, 1))
+    for lo in range(0, k, step):
+        block = ids[lo:lo + step]
+        member = np.zeros((n, len(block)), dtype=bool)
+        sizes = [len(S) if S else 0 for S in block]
+        rows = np.fromiter(chain.from_iterable(S for S in block if S), dtype=np.intp, count=sum(sizes))
+        member[rows, np.repeat(np.arange(len(block)), sizes)] = True
+        attacked = np.zeros_like(member)
+        if len(src):
+            attacked[targets] = np.logical_or.reduceat(member[src_sorted], starts, axis=0)
+        conflict[lo:lo + len(block)] = (member & attacked).any(axis=0)
+        if len(src):
+            undefended[lo:lo + len(block)] = (member[dst] & ~attacked[src]).any(axis=0)
+        unstable[lo:lo + len(block)] = (~(member | attacked))[present].any(axis=0)
+    return conflict, undefended, unstable
+
+def check(systeme_argumentation: AS, candidates) -> tuple[list[bool], list[bool], list[bool]]:
+    """
+    Vérifie d'un coup une liste d'ensembles candidats.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - candidates: liste d'ensembles d'arguments.
+    Returns: Triplet de listes (sans conflit, admissible, stable), une valeur par candidat.
+        Un candidat qui contient un argument inconnu n'est ni sans conflit, ni admissible, ni stable.
+    """
+    af = systeme_argumentation
+    ids = _ids(af, candidates)
+    if np is not None:
+        conflict, undefended, unstable = (x.tolist() for x in _check_numpy(af, ids))
+    else:
+        masks = _check_ints(af, ids)
+        conflict, undefended, unstable = ([(m >> c) & 1 == 1 for c in range(len(ids))] for m in masks)
+    cf, adm, st = [], [], []
+    for c, S in enumerate(ids):
+        ok = S is not None and not conflict[c]
+        cf.append(ok)
+        adm.append(ok and not undefended[c])
+        st.append(ok and not unstable[c])
+    return cf, adm, st
@@ -0,0 +1,99 @@
+"""
+src/cache.py
+
+Cache des extensions d'un système d'argumentation, utilisé quand plusieurs requêtes
+portent sur le même AS (mode batch).
+Pour chaque sémantique (PR / ST / GR / CO / SST / ID), les extensions sont calculées une seule fois
+et gardées dans une collection compacte (src/store.py : matrice de bits, ou ZDD si elle est plus petite), avec :
+    - leur union : arguments crédulement acceptés (DC).
+    - leur intersection : arguments sceptiquement acceptés (DS).
+Avec jobs > 1, les extensions sont calculées sur plusieurs processus (voir src/parallel.py),
+avec backend 'sat' elles sont calculées par le moteur SAT (voir src/sat.py) ; cela ne concerne que PR et ST,
+les semi-stables et l'extension idéale étant déduites des extensions préférées du cache.
+"""
+from src.systeme_argumentation import AS
+from src.store import ExtensionStore, compact
+import src.semantics as semantics
+
+class ExtensionCache:
+    __slots__ = ("systeme_argumentation", "jobs", "backend", "extensions")
+
+    def __init__(self, systeme_argumentation: AS, jobs: int = 1, backend: str = "labelling"):
+        """
+        Initialise un cache vide pour un AS.
+        Args:
+            - systeme_argumentation: système d'argumentation <A, R>.
+            - jobs: nombre de processus utilisés pour calculer les extensions.
+            - backend: moteur utilisé pour calculer les extensions ('labelling' ou 'sat').
+        Returns: None
+        """
+        self.systeme_argumentation = systeme_argumentation
+        self.jobs = jobs
+        self.backend = backend
+        self.extensions = {}    # Sémantique -> collection des extensions (avec leur union et leur intersection).
+
+    def get(self, semantic: str) -> ExtensionStore:
+        """
+        Donne les extensions d'une sémantique, en les calculant à la première demande.
+        Args:
+            - semantic: 'PR', 'ST', 'GR', 'CO', 'SST' ou 'ID'.
+        Returns: Collection des extensions.
+        Raises: ValueError: si la sémantique est inconnue.
+        """
+        exts = self.extensions.get(semantic)
+        if exts is None and self.backend == "sat" and semantic in ('PR', 'ST'):
+            from src import sat
+            exts = sat.extensions(self.systeme_argumentation, semantic)
+            self.seed(semantic, exts)
+        if exts is None and self.jobs > 1 and semantic in ('PR', 'ST'):
+            from src import parallel    # Importé seulement si besoin (parallel dépend de src/queries.py).
+            exts = parallel.extensions(self.systeme_argumentation, semantic, self.jobs)
+            self.seed(semantic, exts)
+        if exts is None:
+            match semantic:
+                case 'PR':
+                    exts = semantics.preferred_extensions(self.systeme_argumentation)
+                case 'ST':
+                    exts = semantics.stable_extensions(self.systeme_argumentation)
+                case 'GR':
+                    exts = ExtensionStore(self.systeme_argumentation)
+                    exts.add(semantics.grounded_extension(self.systeme_argumentation))
+                case 'CO':
+                    exts = semantics.complete_extensions(self.systeme_argumentation)
+                case 'SST':     # Les stables s'il y en a, sinon les préférées dont S ∪ S+ est maximal.
+                    exts = self.get('ST') or semantics.semi_stable_extensions(self.systeme_argumentation, self.get('PR'))
+                case 'ID':      # Plus grand ensemble admissible inclus dans l'intersection des préférées.
+                    exts = ExtensionStore(self.systeme_argumentation)
+                    exts.add(semantics.ideal_extension(self.systeme_argumentation, self.get('PR')))
+                case _:
+                    raise ValueError(f"Sémantique inconnue: {semantic}")
+            self.seed(semantic, exts)
+        return self.extensions[semantic]
+
+    def seed(self, semantic: str, exts: ExtensionStore):
+        """
+        Remplit le cache avec des extensions déjà connues (par exemple lues dans le cache binaire).
+        Args:
+            - semantic: 'PR', 'ST', 'GR', 'CO', 'SST' ou 'ID'.
+            - exts: extensions de cette sémantique.
+        Returns: None
+        """
+        self.extensions[semantic] = compact(exts)
+
+    def is_credulous(self, semantic: str, a: str) -> bool:
+        """
+        Vérifie que 'a' appartient à au moins une extension (DC).
+        """
+        return self.get(semantic).is_credulous(a)
+
+    def is_skeptical(self, semantic: str, a: str) -> bool:
+        """
+        Vérifie que 'a' appartient à toutes les extensions (DS), vrai s'il n'y a aucune extension.
+        """
+        return self.get(semantic).is_skeptical(a)
+
+    def contains(self, semantic: str, S: set[str]) -> bool:
+        """
+        Vérifie que S est une des extensions (VE).
+        """
+        return S in self.get(semantic)
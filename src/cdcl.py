@@ -0,0 +1,314 @@
+"""
+src/cdcl.py
+
+Solveur SAT CDCL en Python pur, utilisé par le moteur SAT (src/sat.py).
+Les variables sont des entiers 1..n, un littéral est v (vrai) ou -v (faux), une clause est une liste de littéraux.
+    - propagation unitaire avec deux littéraux surveillés par clause.
+    - analyse des conflits au premier point d'implication unique (1UIP), clause apprise et retour arrière non chronologique.
+    - choix de variable par activité (VSIDS, tas paresseux) et mémorisation de la dernière valeur de chaque variable.
+    - redémarrages géométriques.
+Le solveur est incrémental : on peut ajouter des clauses entre deux appels et résoudre sous hypothèses
+(littéraux imposés pour un seul appel), les clauses apprises sont conservées.
+Un appel peut recevoir une échéance (time.monotonic()) : elle est vérifiée à chaque conflit.
+Si le module pycosat est installé, make_solver() renvoie à la place une enveloppe de même interface autour de lui.
+"""
+import heapq
+import time
+
+RESTART_FIRST = 100     # Nombre de conflits avant le premier redémarrage.
+RESTART_GROWTH = 1.5    # Facteur d'augmentation de l'intervalle entre deux redémarrages.
+DECAY = 0.95            # Décroissance de l'activité des variables à chaque conflit.
+
+class Solver:
+    __slots__ = ("nvars", "clauses", "watches", "assign", "level", "reason", "trail", "trail_lim",
+                 "qhead", "activity", "bump", "heap", "phase", "ok")
+
+    def __init__(self):
+        """
+        Initialise un solveur sans variable ni clause.
+        """
+        self.nvars = 0
+        self.clauses = []       # Clauses de plus de un littéral (données et apprises).
+        self.watches = [[], []] # Littéral (indice 2v ou 2v+1) -> clauses qui le surveillent.
+        self.assign = [0]       # Valeur de chaque variable : 1 vrai, -1 faux, 0 non affectée.
+        self.level = [0]        # Niveau de décision de chaque variable affectée.
+        self.reason = [None]    # Clause qui a forcé la variable (None pour une décision).
+        self.trail = []         # Littéraux affectés, dans l'ordre.
+        self.trail_lim = []     # Début de chaque niveau de décision dans trail.
+        self.qhead = 0          # Prochain littéral de trail à propager.
+        self.activity = [0.0]
+        self.bump = 1.0
+        self.heap = []          # Tas (-activité, variable), entrées périmées ignorées à la lecture.
+        self.phase = [False]    # Dernière valeur prise par chaque variable.
+        self.ok = True          # False si les clauses sont insatisfiables sans hypothèse.
+
+    def new_var(self) -> int:
+        """
+        Crée une nouvelle variable.
+        Returns: Son numéro.
+        """
+        self.nvars += 1
+        self.watches += [[], []]
+        self.assign.append(0)
+        self.level.append(0)
+        self.reason.append(None)
+        self.activity.append(0.0)
+        self.phase.append(False)
+        heapq.heappush(self.heap, (0.0, self.nvars))
+        return self.nvars
+
+    def set_phase(self, lit: int):
+        """
+        Indique la valeur à essayer en premier pour la variable de lit (à la prochaine décision sur elle).
+        """
+        self.phase[abs(lit)] = lit > 0
+
+    def _value(self, lit: int) -> int:
+        v = self.assign[abs(lit)]
+        return v if lit > 0 else -v
+
+    def _enqueue(self, lit: int, reason):
+        v = abs(lit)
+        self.assign[v] = 1 if lit > 0 else -1
+        self.level[v] = len(self.trail_lim)
+        self.reason[v] = reason
+        self.trail.append(lit)
+
+    def add_clause(self, lits) -> bool:
+        """
+        Ajoute une clause (hors d'un appel à solve).
+        Returns: False si les clauses deviennent insatisfiables.
+        """
+        if not self.ok:
+            return False
+        self._backtrack(0)
+        clause = []
+        for lit in set(lits):
+            value = self._value(lit)
+            if value == 1 or -lit in clause:    # Clause déjà satisfaite (au niveau 0) ou tautologie.
+                return True
+            if value == 0:
+                clause.append(lit)
+        if not clause:
+            self.ok = False
+        elif len(clause) == 1:
+            self._enqueue(clause[0], None)
+            self.ok = self._propagate() is None
+        else:
+            self._attach(clause)
+        return self.ok
+
+    def _attach(self, clause: list[int]):
+        self.clauses.append(clause)
+        for lit in clause[:2]:
+            self.watches[2 * abs(lit) + (lit < 0)].append(clause)
+
+    def _backtrack(self, lvl: int):
+        if len(self.trail_lim) <= lvl:
+            return
+        start = self.trail_lim[lvl]
+        assign, phase, heap, activity = self.assign, self.phase, self.heap, self.activity
+        for lit in self.trail[start:]:
+            v = abs(lit)
+            phase[v] = lit > 0
+            assign[v] = 0
+            heapq.heappush(heap, (-activity[v], v))
+        del self.trail[start:]
+        del self.trail_lim[lvl:]
+        self.qhead = start
+
+    def _propagate(self):
+        """
+        Propagation unitaire de tous les littéraux en attente.
+        Returns: La clause en conflit, ou None.
+        """
+        assign, watches, trail = self.assign, self.watches, self.trail
+        while self.qhead < len(trail):
+            false_lit = -trail[self.qhead]
+            self.qhead += 1
+            ws = watches[2 * abs(false_lit) + (false_lit < 0)]
+            i = 0
+            while i < len(ws):
+                c = ws[i]
+                if c[0] == false_lit:               # Le littéral faux surveillé est mis en position 1.
+                    c[0], c[1] = c[1], c[0]
+                first = c[0]
+                v = assign[abs(first)]
+                if (v if first > 0 else -v) == 1:   # Clause déjà satisfaite.
+                    i += 1
+                    continue
+                for k in range(2, len(c)):          # Recherche d'un autre littéral non faux à surveiller.
+                    lit = c[k]
+                    v = assign[abs(lit)]
+                    if (v if lit > 0 else -v) != -1:
+                        c[1], c[k] = lit, false_lit
+                        watches[2 * abs(lit) + (lit < 0)].append(c)
+                        ws[i] = ws[-1]
+                        ws.pop()
+                        break
+                else:
+                    v = assign[abs(first)]
+                    if (v if first > 0 else -v) == -1:  # Tous les littéraux sont faux : conflit.
+                        self.qhead = len(trail)
+                        return c
+                    self._enqueue(first, c)         # Clause unitaire : first est forcé.
+                    i += 1
+        return None
+
+    def _bump(self, v: int):
+        self.activity[v] += self.bump
+        if self.activity[v] > 1e100:                # Remise à l'échelle pour éviter les débordements.
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.bump *= 1e-100
+            self.heap = [(-self.activity[u], u) for u in range(1, self.nvars + 1) if self.assign[u] == 0]
+            heapq.heapify(self.heap)
+        if self.assign[v] == 0:
+            heapq.heappush(self.heap, (-self.activity[v], v))
+
+    def _analyze(self, confl: list[int]) -> tuple[list[int], int]:
+        """
+        Analyse un conflit jusqu'au premier point d'implication unique.
+        Returns: Couple (clause apprise, niveau de retour arrière), le littéral assertif en tête de clause.
+        """
+        level, trail, current = self.level, self.trail, len(self.trail_lim)
+        seen = set()
+        learnt = [0]
+        counter = 0
+        p = 0
+        idx = len(trail) - 1
+        while True:
+            for q in confl:
+                v = abs(q)
+                if q != p and v not in seen and level[v] > 0:
+                    seen.add(v)
+                    self._bump(v)
+                    if level[v] == current:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+            while abs(trail[idx]) not in seen:
+                idx -= 1
+            p = trail[idx]
+            idx -= 1
+            seen.discard(abs(p))
+            counter -= 1
+            if counter == 0:
+                break
+            confl = self.reason[abs(p)]
+        learnt[0] = -p
+        if len(learnt) == 1:
+            return learnt, 0
+        best = max(range(1, len(learnt)), key=lambda k: level[abs(learnt[k])])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, level[abs(learnt[1])]
+
+    def _decide(self) -> int:
+        """
+        Choisit la variable non affectée la plus active.
+        Returns: Le littéral de décision (0 si toutes les variables sont affectées).
+        """
+        heap, assign = self.heap, self.assign
+        while heap:
+            _, v = heapq.heappop(heap)
+            if assign[v] == 0:
+                return v if self.phase[v] else -v
+        return 0
+
+    def solve(self, assumptions=(), deadline: float = None) -> list[bool]:
+        """
+        Cherche une affectation qui satisfait toutes les clauses et les hypothèses.
+        Args:
+            - assumptions: littéraux imposés pour cet appel seulement.
+            - deadline: échéance en secondes de time.monotonic() (aucune par défaut).
+        Returns: Le modèle (model[v] vaut True si v est vraie, model[0] inutilisé), ou None si insatisfiable.
+        Raises: TimeoutError: si l'échéance est dépassée.
+        """
+        if not self.ok:
+            return None
+        self._backtrack(0)
+        assumptions = list(assumptions)
+        conflicts, limit = 0, RESTART_FIRST
+        while True:
+            confl = self._propagate()
+            if confl is not None:
+                if not self.trail_lim:      # Conflit sans décision : insatisfiable.
+                    self.ok = False
+                    return None
+                learnt, lvl = self._analyze(confl)
+                self._backtrack(lvl)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    self._attach(learnt)
+                    self._enqueue(learnt[0], learnt)
+                self.bump /= DECAY
+                conflicts += 1
+                if deadline is not None and time.monotonic() > deadline:
+                    self._backtrack(0)
+                    raise TimeoutError("Error: délai de recherche dépassé.")
+                if conflicts >= limit:      # Redémarrage (les clauses apprises sont gardées).
+                    conflicts, limit = 0, int(limit * RESTART_GROWTH)
+                    self._backtrack(0)
+                continue
+            lit = 0
+            while len(self.trail_lim) < len(assumptions):   # Les hypothèses sont les premières décisions.
+                a = assumptions[len(self.trail_lim)]
+                value = self._value(a)
+                if value == -1:             # Hypothèse contredite : insatisfiable sous ces hypothèses.
+                    self._backtrack(0)
+                    return None
+                self.trail_lim.append(len(self.trail))
+                if value == 0:
+                    lit = a
+                    break
+            if not lit:
+                lit = self._decide()
+                if not lit:                 # Toutes les variables sont affectées : modèle trouvé.
+                    model = [False] + [value == 1 for value in self.assign[1:]]
+                    self._backtrack(0)
+                    return model
+                self.trail_lim.append(len(self.trail))
+            self._enqueue(lit, None)
+
+
+class PycosatSolver:
+    """
+    Même interface que Solver, au-dessus de pycosat (non incrémental : chaque appel repart des clauses).
+    Un appel à pycosat ne peut pas être interrompu : l'échéance n'est pas vérifiée pendant solve.
+    """
+    __slots__ = ("nvars", "clauses", "pycosat")
+
+    def __init__(self, pycosat):
+        self.nvars = 0
+        self.clauses = []
+        self.pycosat = pycosat
+
+    def new_var(self) -> int:
+        self.nvars += 1
+        return self.nvars
+
+    def set_phase(self, lit: int):
+        pass
+
+    def add_clause(self, lits) -> bool:
+        self.clauses.append(list(lits))
+        return True
+
+    def solve(self, assumptions=(), deadline: float = None) -> list[bool]:
+        res = self.pycosat.solve(self.clauses + [[a] for a in assumptions], vars=self.nvars)
+        if res == "UNSAT":
+            return None
+        model = [False] * (self.nvars + 1)
+        for lit in res:
+            model[abs(lit)] = lit > 0
+        return model
+
+def make_solver():
+    """
+    Donne un solveur vide : pycosat s'il est installé, le solveur CDCL de ce module sinon.
+    """
+    try:
+        import pycosat
+    except ImportError:
+        return Solver()
+    return PycosatSolver(pycosat)
@@ -3,11 +3,55 @@ src/cli.py
 
 Gestion de la ligne de commande.
 Lecture et validation syntaxique des options :
-    - -p : type de problème.
+    - -p : type de problème (décision VE / DC / DS pour PR, ST, GR, CO, SST ou ID, ou énumération EE / SE pour PR et ST).
     - -f : chemin du fichier .apx.
     - -a : arguments de la requête.
+    - -b : fichier de requêtes pour le mode batch ('-' pour l'entrée standard).
+    - -c : fichier d'ensembles candidats pour une vérification VE groupée ('-' pour l'entrée standard).
+    - --cache : utilisation du cache binaire <fichier>.afc (voir src/compiled.py).
+    - --jobs : nombre de processus pour la recherche d'extensions (voir src/parallel.py).
+    - --backend : moteur de résolution, labelling (par défaut) ou sat (voir src/sat.py).
+    - --stats : affichage des statistiques du solveur sur stderr (voir src/stats.py).
+    - --profile : répertoire où écrire un profil cProfile / tracemalloc de l'exécution.
+    - --limit : nombre maximal d'extensions énumérées (EE / SE).
+    - --timeout : délai maximal de l'énumération en secondes (EE / SE).
+    - --count : affichage du nombre d'extensions au lieu des extensions (EE / SE).
+    - --connect : adresse d'un démon de résolution (voir src/daemon.py) auquel envoyer la requête.
+La forme la plus courante (exactement -p, -f et -a) est reconnue sans argparse, qui n'est importé
+que pour les autres formes (et pour les messages d'erreur).
 """
-import argparse
+
+PROBLEMS = ['VE-PR', 'DC-PR', 'DS-PR', 'VE-ST', 'DC-ST', 'DS-ST',   # Problèmes gérés par le programme.
+            'VE-GR', 'DC-GR', 'DS-GR', 'VE-CO', 'DC-CO', 'DS-CO',
+            'VE-SST', 'DC-SST', 'DS-SST', 'VE-ID', 'DC-ID', 'DS-ID']
+ENUMERATIONS = ['EE-PR', 'EE-ST', 'SE-PR', 'SE-ST']     # Problèmes d'énumération (toutes / une extension).
+BACKENDS = ['labelling', 'sat']     # Moteurs de résolution.
+
+DEFAULTS = {    # Valeurs des options absentes (voir parse_args).
+    "batch": None, "candidates": None, "cache": False, "jobs": 1, "backend": "labelling", "stats": False,
+    "profile": None, "limit": None, "timeout": None, "count": False, "connect": None,
+}
+
+def parse_simple(argv):
+    """
+    Reconnaît sans argparse la forme "-p PROBLEME -f FICHIER -a ARGUMENTS" (options dans n'importe quel ordre,
+    sans -a pour une énumération EE / SE).
+    Args:
+        - argv: liste des arguments de la ligne de commande (sans le nom du programme).
+    Returns: Le dictionnaire de parse_args, ou None si argv n'a pas exactement cette forme
+        (option en plus ou en double, valeur commençant par '-', problème inconnu).
+    """
+    if len(argv) not in (4, 6):
+        return None
+    values = {}
+    for flag, value in zip(argv[::2], argv[1::2]):
+        if flag not in ("-p", "-f", "-a") or flag in values or value.startswith("-"):
+            return None
+        values[flag] = value
+    problem = values.get("-p")
+    if not (problem in PROBLEMS and len(argv) == 6 or problem in ENUMERATIONS and "-a" not in values and "-f" in values):
+        return None
+    return dict(DEFAULTS, probleme=problem, file=values["-f"], arguments=values.get("-a"))
 
 def parse_args(argv):
     """
@@ -15,19 +59,85 @@ def parse_args(argv):
     Args:
         - argv: liste des arguments de la ligne de commande (sans le nom du programme).
     Returns: Dictionnaire contenant :
-        - "probleme": type de problème (ex: VE-PR, DC-ST).
+        - "probleme": type de problème (ex: VE-PR, DC-ST, EE-PR), None en mode batch.
         - "file": chemin du fichier .apx.
-        - "arguments": arguments de la requête sous forme de chaîne.
+        - "arguments": arguments de la requête sous forme de chaîne, None en mode batch et en énumération.
+        - "batch": fichier de requêtes du mode batch, None sinon.
+        - "candidates": fichier des candidats d'une vérification groupée, None sinon.
+        - "cache": True si le cache binaire doit être utilisé.
+        - "jobs": nombre de processus (1 par défaut).
+        - "backend": moteur de résolution ('labelling' par défaut).
+        - "stats": True si les statistiques doivent être affichées.
+        - "profile": répertoire des profils, None sinon.
+        - "limit": nombre maximal d'extensions énumérées, None sinon.
+        - "timeout": délai maximal de l'énumération en secondes, None sinon.
+        - "count": True si seul le nombre d'extensions doit être affiché.
+        - "connect": adresse du démon de résolution, None sinon.
     """
+    res = parse_simple(argv)    # Forme courante : pas besoin d'argparse.
+    if res is not None:
+        return res
+    import argparse
     parser = argparse.ArgumentParser()              # Séparation des arguments de ligne de commande.
-    parser.add_argument("-p", required= True, choices=['VE-PR', 'DC-PR', 'DS-PR', 'VE-ST', 'DC-ST', 'DS-ST']) # Récupération du nom du problème. (On vérifie que l'on gère ce problème.)
+    parser.add_argument("-p", choices=PROBLEMS + ENUMERATIONS)  # Récupération du nom du problème. (On vérifie que l'on gère ce problème.)
     parser.add_argument("-f", required= True)       # Récupération du nom du fichier .apx.
-    parser.add_argument("-a", required= True)       # Récupération de(s) argument(s).
+    parser.add_argument("-a")                       # Récupération de(s) argument(s).
+    parser.add_argument("-b")                       # Récupération du fichier de requêtes (mode batch).
+    parser.add_argument("-c")                       # Récupération du fichier de candidats (vérification groupée).
+    parser.add_argument("--cache", action="store_true")     # Utilisation du cache binaire à côté du fichier .apx.
+    parser.add_argument("--jobs", type=int, default=1)      # Nombre de processus pour la recherche.
+    parser.add_argument("--backend", choices=BACKENDS, default="labelling")     # Moteur de résolution.
+    parser.add_argument("--stats", action="store_true")     # Statistiques du solveur sur stderr.
+    parser.add_argument("--profile")                        # Répertoire des profils cProfile / tracemalloc.
+    parser.add_argument("--limit", type=int)                # Nombre maximal d'extensions énumérées.
+    parser.add_argument("--timeout", type=float)            # Délai maximal de l'énumération (secondes).
+    parser.add_argument("--count", action="store_true")     # Nombre d'extensions seulement.
+    parser.add_argument("--connect")                        # Adresse du démon de résolution.
 
     args = parser.parse_args(argv)
+    if args.c is not None:      # Vérification groupée : les ensembles viennent du fichier de candidats.
+        if args.a is not None or args.b is not None:
+            parser.error("l'option -c ne s'utilise pas avec -a ni -b.")
+        if args.p not in ('VE-PR', 'VE-ST'):
+            parser.error("l'option -c demande un problème de vérification (-p VE-PR ou -p VE-ST).")
+    elif args.p in ENUMERATIONS:    # Enumération : pas de requête, les extensions sont affichées.
+        if args.a is not None:
+            parser.error(f"l'option -a ne s'utilise pas avec -p {args.p}.")
+        if args.jobs > 1:
+            parser.error("l'option --jobs ne s'utilise pas avec les problèmes EE / SE.")
+    elif args.b is None and (args.p is None or args.a is None):   # Hors mode batch, -p et -a sont obligatoires.
+        parser.error("les options -p et -a sont obligatoires (sauf avec -b).")
+    if args.b is not None and (args.p is not None or args.a is not None):  # En mode batch, les requêtes viennent du fichier.
+        parser.error("les options -p et -a ne s'utilisent pas avec -b.")
+    if args.jobs < 1:
+        parser.error("l'option --jobs doit être au moins 1.")
+    if args.jobs > 1 and args.backend != "labelling":   # La recherche parallèle découpe la recherche par étiquetages.
+        parser.error("l'option --jobs ne s'utilise qu'avec --backend labelling.")
+    if (args.limit is not None or args.timeout is not None or args.count) and args.p not in ENUMERATIONS:
+        parser.error("les options --limit, --timeout et --count ne s'utilisent qu'avec les problèmes EE / SE.")
+    if args.limit is not None and args.limit < 1:
+        parser.error("l'option --limit doit être au moins 1.")
+    if args.timeout is not None and args.timeout <= 0:
+        parser.error("l'option --timeout doit être positive.")
+    if args.connect is not None:    # Le démon résout les requêtes seules, avec ses propres caches.
+        if args.p not in PROBLEMS or args.a is None or args.c is not None:
+            parser.error("l'option --connect ne s'utilise qu'avec -p (VE / DC / DS) et -a.")
+        if args.cache or args.jobs > 1 or args.backend != "labelling" or args.stats or args.profile is not None:
+            parser.error("l'option --connect ne s'utilise pas avec --cache, --jobs, --backend, --stats ni --profile.")
 
     return {
         "probleme" : args.p,
         "file" : args.f,
-        "arguments" : args.a
+        "arguments" : args.a,
+        "batch" : args.b,
+        "candidates" : args.c,
+        "cache" : args.cache,
+        "jobs" : args.jobs,
+        "backend" : args.backend,
+        "stats" : args.stats,
+        "profile" : args.profile,
+        "limit" : args.limit,
+        "timeout" : args.timeout,
+        "count" : args.count,
+        "connect" : args.connect
     }   # On retourne un dictionnaire avec les infos dont on à besoin.
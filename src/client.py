@@ -0,0 +1,80 @@
+"""
+src/client.py
+
+Client léger du démon de résolution (src/daemon.py) : il n'importe que socket et json,
+pour que l'envoi d'une requête ne paie ni le parsing du fichier .apx ni le chargement du solveur.
+Adresse du démon :
+    - un chemin : socket Unix (ex: /tmp/solveur.sock).
+    - un port ou hôte:port : TCP (ex: 7000 ou 127.0.0.1:7000, localhost par défaut).
+Protocole : une requête JSON par ligne, une réponse JSON par ligne, dans l'ordre des requêtes.
+    - requête : {"problem": "DC-PR", "file": "/chemin/af.apx", "query": "a"} ("query" est une liste pour les VE,
+      noms normalisés comme l'option -a : espaces retirés, minuscules),
+      un champ "id" optionnel est recopié dans la réponse.
+    - réponse : {"result": true} ou {"error": "message"}.
+    - {"op": "status"} donne l'état des registres des processus du démon.
+"""
+import json
+import socket
+
+def parse_address(address: str):
+    """
+    Interprète l'adresse du démon.
+    Args:
+        - address: chemin de socket Unix, port ou hôte:port.
+    Returns: Couple (famille de socket, adresse au format du module socket).
+    """
+    host, sep, port = address.rpartition(":")
+    if port.isdigit() and "/" not in address:
+        return socket.AF_INET, (host if sep else "127.0.0.1", int(port))
+    return socket.AF_UNIX, address
+
+def connect(address: str) -> socket.socket:
+    """
+    Ouvre une connexion au démon.
+    Raises: OSError: si le démon ne répond pas à cette adresse.
+    """
+    family, addr = parse_address(address)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.connect(addr)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+def request(address: str, message: dict) -> dict:
+    """
+    Envoie une requête au démon et attend sa réponse (une connexion par appel).
+    Args:
+        - address: adresse du démon.
+        - message: requête (dictionnaire sérialisable en JSON).
+    Returns: La réponse du démon.
+    Raises: ConnectionError: si le démon ferme la connexion sans répondre.
+    """
+    with connect(address) as sock:
+        sock.sendall(json.dumps(message).encode('utf-8') + b"\n")
+        with sock.makefile('rb') as flux:
+            line = flux.readline()
+    if not line:
+        raise ConnectionError("Error: le démon a fermé la connexion sans répondre.")
+    return json.loads(line)
+
+def solve(address: str, problem: str, path: str, query) -> bool:
+    """
+    Résout une requête VE / DC / DS par le démon.
+    Args:
+        - address: adresse du démon.
+        - problem: type de problème.
+        - path: chemin du fichier .apx (tel que le démon le voit).
+        - query: ensemble S (pour les VE) ou argument a (pour DC / DS).
+    Returns:
+        - True si la requête est satisfaite.
+        - False sinon.
+    Raises: ValueError: si le démon renvoie une erreur.
+    """
+    if isinstance(query, set):
+        query = sorted(query)
+    res = request(address, {"problem": problem, "file": path, "query": query})
+    if "error" in res:
+        raise ValueError(res["error"])
+    return res["result"]
@@ -0,0 +1,181 @@
+"""
+src/compiled.py
+
+Cache binaire persistant d'un fichier .apx (fichier <chemin>.afc écrit à côté de la source).
+Le cache est associé au contenu de la source par son empreinte SHA-256 : si le fichier .apx change,
+le cache est ignoré puis réécrit.
+Format (entiers de l'en-tête en little-endian, tableaux en entiers 32 bits dans l'ordre natif indiqué par l'en-tête) :
+    - en-tête : magic, version, ordre des octets, empreinte, nombre d'arguments n, nombre d'attaques m, taille des noms.
+    - succ_off (n+1), succ_adj (m) : attaques au format CSR (voisins de i = succ_adj[succ_off[i]:succ_off[i+1]]).
+    - pred_off (n+1), pred_adj (m) : même chose pour les attaquants.
+    - noms des arguments en UTF-8 séparés par des retours à la ligne (complétés à un multiple de 4 octets).
+    - extensions déjà calculées (optionnel) : pour chaque sémantique, ses extensions au format CSR.
+Au chargement, le fichier est projeté en mémoire (mmap) et les listes de voisins de l'AS sont
+des vues (memoryview) sur cette projection : les attaques ne sont pas recopiées.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from src.systeme_argumentation import AS
+from src.apx_parser import load_apx
+from src.bitset import bits
+from src.store import ExtensionStore
+
+MAGIC = b'AFC1'
+VERSION = 2
+HEADER = struct.Struct('<4sBB2x32sIII4x')    # magic, version, ordre natif (1 = little), empreinte, n, m, taille des noms.
+SEMANTIC = struct.Struct('<4sII')           # sémantique (complétée par des octets nuls), nombre d'extensions, nombre total d'arguments.
+LITTLE = 1 if sys.byteorder == 'little' else 0
+
+def cache_path(path: str) -> str:
+    """
+    Donne le chemin du cache binaire associé à un fichier .apx.
+    """
+    return path + '.afc'
+
+def file_hash(path: str) -> bytes:
+    """
+    Calcule l'empreinte SHA-256 du contenu d'un fichier (lu par blocs).
+    """
+    h = hashlib.sha256()
+    with open(path, 'rb') as fichier:
+        for bloc in iter(lambda: fichier.read(1 << 20), b''):
+            h.update(bloc)
+    return h.digest()
+
+def _csr(lists) -> tuple[array, array]:
+    """
+    Transforme une liste de listes d'entiers en tableaux (offsets, valeurs).
+    """
+    off, adj = array('i', [0]), array('i')
+    for values in lists:
+        adj.extend(values)
+        off.append(len(adj))
+    return off, adj
+
+def write_compiled(path: str, systeme_argumentation: AS, digest: bytes, extensions: dict = None):
+    """
+    Ecrit le cache binaire d'un AS (écriture atomique via un fichier temporaire).
+    Args:
+        - path: chemin du fichier .apx source.
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - digest: empreinte du contenu de la source.
+        - extensions: sémantique -> collection des extensions à conserver (optionnel).
+    Returns: None
+    Raises: OSError: si le cache ne peut pas être écrit.
+    """
+    af = systeme_argumentation
+    succ_off, succ_adj = _csr(af.succ)
+    pred_off, pred_adj = _csr(af.pred)
+    noms = '\n'.join(af.names).encode('utf-8')
+    noms += b'\0' * (-len(noms) % 4)        # Alignement des sections suivantes sur 4 octets.
+    tmp = cache_path(path) + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, LITTLE, digest, len(af.names), len(succ_adj), len(noms)))
+        for tab in (succ_off, succ_adj, pred_off, pred_adj):
+            tab.tofile(f)
+        f.write(noms)
+        for semantic, exts in sorted((extensions or {}).items()):
+            off, ids = _csr(list(bits(m)) for m in exts.masks())
+            f.write(SEMANTIC.pack(semantic.encode('ascii'), len(exts), len(ids)))
+            off.tofile(f)
+            ids.tofile(f)
+    os.replace(tmp, cache_path(path))
+
+def read_compiled(path: str, digest: bytes):
+    """
+    Charge le cache binaire d'un fichier .apx s'il existe et correspond à son contenu.
+    Args:
+        - path: chemin du fichier .apx source.
+        - digest: empreinte du contenu actuel de la source.
+    Returns:
+        - (AS, extensions) si le cache est valide, extensions étant un dictionnaire sémantique -> collection d'extensions.
+        - None sinon (cache absent, périmé, tronqué ou illisible). Un fichier coupé juste entre deux sections
+          d'extensions reste valide : seules les sémantiques complètes sont rendues.
+    """
+    try:
+        with open(cache_path(path), 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(data) < HEADER.size:
+        return None
+    magic, version, little, stored, n, m, taille = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or little != LITTLE or stored != digest:
+        return None
+    vue = memoryview(data)
+    pos = HEADER.size
+
+    def ints(count: int) -> memoryview:
+        """
+        Donne une vue (sans copie) sur count entiers à partir de la position courante.
+        Raises: ValueError: si la section dépasse la fin du fichier (cache tronqué).
+        """
+        nonlocal pos
+        if pos + 4 * count > len(data):
+            raise ValueError("cache tronqué")
+        res = vue[pos:pos + 4 * count].cast('i')
+        pos += 4 * count
+        return res
+
+    try:
+        succ_off, succ_adj = ints(n + 1), ints(m)
+        pred_off, pred_adj = ints(n + 1), ints(m)
+        if succ_off[n] != m or pred_off[n] != m or pos + taille > len(data):
+            raise ValueError("cache incohérent")
+        names = bytes(vue[pos:pos + taille]).rstrip(b'\0').decode('utf-8').split('\n') if n else []
+        if len(names) != n:
+            raise ValueError("cache incohérent")
+        pos += taille
+        af = AS.from_csr(names, succ_off, succ_adj, pred_off, pred_adj)
+        extensions = {}
+        while pos < len(data):     # Extensions déjà calculées.
+            if pos + SEMANTIC.size > len(data):
+                raise ValueError("cache tronqué")
+            semantic, k, total = SEMANTIC.unpack_from(data, pos)
+            pos += SEMANTIC.size
+            off, ids = ints(k + 1), ints(total)
+            if off[k] != total or total and (min(ids) < 0 or max(ids) >= n):
+                raise ValueError("cache incohérent")
+            extensions[semantic.rstrip(b'\0').decode('ascii')] = ExtensionStore(af, (ids[off[e]:off[e + 1]] for e in range(k)))
+    except ValueError:      # Cache tronqué ou abîmé : il sera réécrit à partir de la source.
+        return None
+    return af, extensions
+
+def load(path: str):
+    """
+    Charge un fichier .apx en passant par son cache binaire, créé ou mis à jour si besoin.
+    Args:
+        - path: chemin du fichier .apx.
+    Returns: Triplet (AS, extensions déjà calculées par sémantique, empreinte de la source lue).
+    Raises: ValueError: si le fichier .apx est invalide.
+    """
+    digest = file_hash(path)
+    res = read_compiled(path, digest)
+    if res is not None:
+        return (*res, digest)
+    af = load_apx(path)
+    try:
+        write_compiled(path, af, digest)
+    except OSError:     # Répertoire en lecture seule par exemple : on continue sans cache.
+        pass
+    return af, {}, digest
+
+def save_extensions(path: str, systeme_argumentation: AS, digest: bytes, extensions: dict):
+    """
+    Réécrit le cache binaire en y ajoutant les extensions calculées.
+    Args:
+        - path: chemin du fichier .apx source.
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - digest: empreinte donnée par load() : celle de la source dont l'AS a été lu,
+          même si le fichier a changé depuis (le cache sera alors reconstruit au prochain chargement).
+        - extensions: sémantique -> collection des extensions.
+    Returns: None
+    """
+    try:
+        write_compiled(path, systeme_argumentation, digest, extensions)
+    except OSError:
+        pass
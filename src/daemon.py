@@ -0,0 +1,322 @@
+"""
+src/daemon.py
+
+Démon de résolution : un processus de longue durée qui répond aux requêtes VE / DC / DS sur une socket locale
+(socket Unix ou TCP sur localhost, protocole JSON par lignes décrit dans src/client.py).
+    - la boucle asyncio ne fait que lire les requêtes et écrire les réponses ;
+    - les recherches sont faites par un groupe de processus : chaque fichier est toujours envoyé au même processus
+      (choisi par une empreinte du chemin), qui garde les AS déjà lus et leurs extensions (cache de src/cache.py) ;
+    - dans chaque processus, un registre LRU borne la mémoire : les AS les moins récemment utilisés sont oubliés
+      dès que leur taille estimée dépasse le budget du processus (budget total / nombre de processus) ;
+    - un fichier modifié (date ou taille) est relu à la requête suivante.
+Les requêtes d'une même connexion sont traitées en parallèle et leurs réponses envoyées dans l'ordre.
+    python3 -m src.daemon /tmp/solveur.sock --workers 4 --memory 1024
+    python3 program.py --connect /tmp/solveur.sock -p DC-PR -f af.apx -a a
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import sys
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from src.systeme_argumentation import AS
+from src.apx_parser import load_apx
+from src.cache import ExtensionCache
+from src.cli import PROBLEMS
+from src.client import connect, parse_address
+from src.queries import solve_query
+
+DEFAULT_WORKERS = 2     # Nombre de processus de recherche.
+DEFAULT_MEMORY = 512    # Budget mémoire total des registres (Mo).
+PIPELINE = 64           # Requêtes d'une connexion en cours de traitement au plus.
+LINE_LIMIT = 1 << 24    # Taille maximale d'une ligne de requête (octets).
+
+def footprint(systeme_argumentation: AS, cache: ExtensionCache) -> int:
+    """
+    Estime la mémoire occupée par un AS et ses extensions calculées (en octets).
+    """
+    af = systeme_argumentation
+    size = sys.getsizeof(af.names) + sys.getsizeof(af.index) + sys.getsizeof(af.A)
+    size += sum(sys.getsizeof(name) for name in af.names if name is not None)
+    size += sum(sys.getsizeof(adj) for adj in af.succ) + sum(sys.getsizeof(adj) for adj in af.pred)
+    if af.bitset is not None:       # Masques de bits construits par la recherche.
+        size += sum(sys.getsizeof(m) for m in af.bitset.att) + sum(sys.getsizeof(m) for m in af.bitset.atk)
+    for exts in cache.extensions.values():     # Collections compactes (voir src/store.py).
+        size += exts.nbytes()
+    return size
+
+class Entry:
+    __slots__ = ("systeme_argumentation", "cache", "stamp", "size")
+
+    def __init__(self, systeme_argumentation: AS, stamp: tuple[int, int]):
+        """
+        Initialise l'entrée du registre d'un AS lu depuis un fichier.
+        Args:
+            - systeme_argumentation: système d'argumentation <A, R>.
+            - stamp: (date de modification, taille) du fichier au moment de la lecture.
+        Returns: None
+        """
+        self.systeme_argumentation = systeme_argumentation
+        self.cache = ExtensionCache(systeme_argumentation)
+        self.stamp = stamp
+        self.size = footprint(systeme_argumentation, self.cache)
+
+class Registry:
+    __slots__ = ("budget", "entries", "used")
+
+    def __init__(self, budget: int):
+        """
+        Initialise un registre vide.
+        Args:
+            - budget: mémoire maximale des AS conservés (octets).
+        Returns: None
+        """
+        self.budget = budget
+        self.entries = OrderedDict()    # Chemin -> entrée, de la moins à la plus récemment utilisée.
+        self.used = 0                   # Somme des tailles estimées des entrées.
+
+    def get(self, path: str) -> Entry:
+        """
+        Donne l'entrée d'un fichier, lue (ou relue s'il a changé) si besoin.
+        Raises: OSError / ValueError: si le fichier est illisible ou mal formé.
+        """
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        entry = self.entries.get(path)
+        if entry is not None and entry.stamp == stamp:
+            self.entries.move_to_end(path)
+            return entry
+        if entry is not None:       # Fichier modifié depuis la lecture.
+            self.used -= self.entries.pop(path).size
+        entry = self.entries[path] = Entry(load_apx(path), stamp)
+        self.used += entry.size
+        self._evict()
+        return entry
+
+    def update(self, path: str):
+        """
+        Met à jour la taille d'une entrée (ses extensions ont pu être calculées) et fait de la place si besoin.
+        """
+        entry = self.entries.get(path)
+        if entry is None:
+            return
+        size = footprint(entry.systeme_argumentation, entry.cache)
+        self.used += size - entry.size
+        entry.size = size
+        self._evict()
+
+    def _evict(self):
+        """
+        Oublie les entrées les moins récemment utilisées tant que le budget est dépassé (la plus récente est gardée).
+        """
+        while self.used > self.budget and len(self.entries) > 1:
+            _, entry = self.entries.popitem(last=False)
+            self.used -= entry.size
+
+    def status(self) -> dict:
+        """
+        Donne l'état du registre (sérialisable en JSON).
+        """
+        return {
+            "budget": self.budget,
+            "memory": self.used,
+            "frameworks": [{"file": path, "arguments": len(e.systeme_argumentation.A),
+                            "attacks": e.systeme_argumentation.nb_attacks,
+                            "semantics": sorted(e.cache.extensions), "memory": e.size}
+                           for path, e in self.entries.items()],
+        }
+
+
+# --- Processus de recherche ---
+
+_registry = None        # Registre du processus de recherche.
+
+def _init_worker(budget: int):
+    """
+    Crée le registre du processus (une seule fois).
+    """
+    global _registry
+    _registry = Registry(budget)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)    # L'arrêt est décidé par le processus principal.
+
+def _solve(problem: str, path: str, query) -> bool:
+    """
+    Résout une requête dans un processus de recherche, avec l'AS et les extensions de son registre.
+    """
+    entry = _registry.get(path)
+    res = solve_query(problem, entry.systeme_argumentation, query, entry.cache)
+    _registry.update(path)
+    return res
+
+def _status() -> dict:
+    return _registry.status()
+
+
+# --- Boucle asyncio ---
+
+def parse_request(message) -> tuple[str, str, object]:
+    """
+    Valide une requête de résolution.
+    Les arguments sont normalisés comme l'option -a de la ligne de commande (espaces retirés, minuscules,
+    voir parse_and_validate_query dans src/main.py), le parseur mettant les noms en minuscules.
+    Returns: Triplet (problème, chemin, requête), la requête étant un ensemble pour les VE.
+    Raises: ValueError: si la requête est mal formée.
+    """
+    if not isinstance(message, dict):
+        raise ValueError("Error: la requête doit être un objet JSON.")
+    problem, path, query = message.get("problem"), message.get("file"), message.get("query")
+    if problem not in PROBLEMS:
+        raise ValueError(f"Error: problème inconnu '{problem}'.")
+    if not isinstance(path, str) or path == "":
+        raise ValueError("Error: le champ file doit être un chemin.")
+    if problem.startswith("VE-"):
+        if not isinstance(query, list) or not all(isinstance(a, str) for a in query):
+            raise ValueError("Error: query doit être une liste d'arguments non vide pour les VE.")
+        query = {a.strip().lower() for a in query} - {""}
+        if not query:
+            raise ValueError("Error: query doit être une liste d'arguments non vide pour les VE.")
+        return problem, path, query
+    if not isinstance(query, str) or query.strip() == "":
+        raise ValueError("Error: query doit être un argument pour les DC / DS.")
+    if "," in query:
+        raise ValueError("Error: query doit contenir un seul argument pour les DC / DS.")
+    return problem, path, query.strip().lower()
+
+class Daemon:
+    __slots__ = ("pools", "requests")
+
+    def __init__(self, workers: int, budget: int):
+        """
+        Démarre les processus de recherche (un groupe d'un processus par registre).
+        Args:
+            - workers: nombre de processus.
+            - budget: mémoire totale des registres (octets), partagée entre les processus.
+        Returns: None
+        """
+        self.pools = [ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(budget // workers,))
+                      for _ in range(workers)]
+        # Processus créés tout de suite : créés à la première requête (fork), ils hériteraient de la socket
+        # du client en cours, dont la connexion ne serait alors jamais fermée.
+        for pool in self.pools:
+            pool.submit(os.getpid).result()
+        self.requests = 0       # Nombre de requêtes traitées.
+
+    def pool_for(self, path: str) -> ProcessPoolExecutor:
+        """
+        Donne le processus chargé d'un fichier (toujours le même pour un chemin donné).
+        """
+        return self.pools[zlib.crc32(path.encode('utf-8')) % len(self.pools)]
+
+    async def answer(self, line: bytes) -> dict:
+        """
+        Traite une ligne de requête.
+        Returns: La réponse (avec le champ "id" de la requête s'il y en a un).
+        """
+        loop = asyncio.get_running_loop()
+        res = {}
+        try:
+            message = json.loads(line)
+            if isinstance(message, dict) and "id" in message:
+                res["id"] = message["id"]
+            if isinstance(message, dict) and message.get("op") == "status":
+                workers = await asyncio.gather(*(loop.run_in_executor(pool, _status) for pool in self.pools))
+                res.update(requests=self.requests, workers=workers)
+            else:
+                problem, path, query = parse_request(message)
+                res["result"] = await loop.run_in_executor(self.pool_for(path), _solve, problem, path, query)
+                self.requests += 1
+        except Exception as e:      # L'erreur est renvoyée au client, le démon continue.
+            res["error"] = str(e)
+        return res
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Sert une connexion : les requêtes sont lancées dès leur lecture, les réponses écrites dans l'ordre.
+        """
+        pending = asyncio.Queue(PIPELINE)
+
+        async def respond():
+            while True:
+                task = await pending.get()
+                if task is None:
+                    return
+                writer.write(json.dumps(await task).encode('utf-8') + b"\n")
+                await writer.drain()
+
+        responder = asyncio.ensure_future(respond())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    await pending.put(asyncio.ensure_future(self.answer(line)))
+            await pending.put(None)
+            await responder
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):     # Client parti ou ligne trop longue.
+            responder.cancel()
+        finally:
+            writer.close()
+
+    def close(self):
+        for pool in self.pools:
+            pool.shutdown(cancel_futures=True)
+
+async def serve(address: str, workers: int = DEFAULT_WORKERS, budget: int = DEFAULT_MEMORY << 20):
+    """
+    Lance le démon et répond aux requêtes jusqu'à SIGINT / SIGTERM.
+    Args:
+        - address: chemin de socket Unix, port ou hôte:port (voir src/client.py).
+        - workers: nombre de processus de recherche.
+        - budget: mémoire totale des registres (octets).
+    Returns: None
+    Raises: OSError: si l'adresse est déjà utilisée.
+    """
+    family, addr = parse_address(address)
+    if family == socket.AF_UNIX and os.path.exists(addr):  # Socket restée d'un démon arrêté (ou démon encore actif).
+        try:
+            connect(addr).close()
+        except OSError:
+            os.unlink(addr)
+        else:
+            raise OSError(f"Error: un démon répond déjà sur {addr}.")
+    daemon = Daemon(workers, budget)
+    try:
+        if family == socket.AF_INET:
+            server = await asyncio.start_server(daemon.handle, *addr, limit=LINE_LIMIT)
+        else:
+            server = await asyncio.start_unix_server(daemon.handle, addr, limit=LINE_LIMIT)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        async with server:
+            print(f"Démon à l'écoute sur {address}", file=sys.stderr, flush=True)
+            await stop.wait()
+    finally:
+        daemon.close()
+        if family == socket.AF_UNIX and os.path.exists(addr):
+            os.unlink(addr)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Démon de résolution VE / DC / DS sur une socket locale.")
+    parser.add_argument("address", help="chemin de socket Unix, port ou hôte:port")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--memory", type=int, default=DEFAULT_MEMORY, help="budget mémoire des registres (Mo)")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("l'option --workers doit être au moins 1.")
+    if args.memory < 1:
+        parser.error("l'option --memory doit être au moins 1.")
+    try:
+        asyncio.run(serve(args.address, args.workers, args.memory << 20))
+    except OSError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+src/decomposition.py
+
+Prétraitement des recherches d'extensions :
+    - calcul de l'extension fondée (grounded) en temps linéaire (voir src/fixpoint.py) : ses arguments sont IN,
+      les arguments qu'elle attaque sont OUT, dans toutes les extensions préférées et stables.
+    - découpage des arguments restants en composantes fortement connexes (SCC, algorithme de Tarjan).
+    - résolution des SCC dans l'ordre topologique : chaque SCC est résolue par src/labelling.py
+      en tenant compte des étiquettes des SCC en amont (un argument attaqué par un IN est OUT,
+      un argument attaqué par un UNDEC ne peut pas être IN), puis les résultats sont combinés.
+Chaque SCC est encodée à part (Bitset.restricted) : les masques ont la taille de la SCC, pas celle de l'AS.
+Les étiquettes globales sont gardées dans un bytearray (UNDEC, IN, OUT) mis à jour SCC par SCC.
+Si l'AS a un memo (raisonnement incrémental), l'encodage de chaque SCC et ses solutions pour
+ses derniers contextes amont y sont conservés et réutilisés tant que la SCC n'est pas modifiée.
+Les solutions sont conservées sans contrainte : les arguments imposés / interdits d'une requête
+sont appliqués en filtrant la liste (sauf un interdit en préféré, qui change les ensembles maximaux).
+"""
+from src.systeme_argumentation import AS
+from src.bitset import Bitset, bits
+from src import labelling, stats
+from src.fixpoint import UNDEC, IN, OUT, grounded_labelling  # Extension fondée : plus petit point fixe de F.
+
+CONTEXTS = 32           # Nombre de contextes amont dont les solutions sont conservées par SCC (memo).
+
+def strongly_connected_components(systeme_argumentation: AS, ids) -> list[list[int]]:
+    """
+    Découpe les arguments ids en composantes fortement connexes (Tarjan itératif).
+    Seules les attaques entre arguments de ids sont prises en compte.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - ids: identifiants des arguments à découper.
+    Returns: Liste des SCC (listes triées d'identifiants) dans l'ordre topologique (les SCC attaquantes d'abord).
+    """
+    succ = systeme_argumentation.succ
+    n = len(succ)
+    ids = list(ids)
+    inside = bytearray(n)
+    for i in ids:
+        inside[i] = 1
+    num = [-1] * n              # Numéro de visite.
+    low = [0] * n               # Plus petit numéro atteignable.
+    on_stack = bytearray(n)
+    stack = []
+    res = []
+    counter = 0
+    for root in ids:
+        if num[root] != -1:
+            continue
+        work = [(root, 0)]      # Pile d'appels simulée : (argument, position dans ses successeurs).
+        while work:
+            v, k = work[-1]
+            if k == 0 and num[v] == -1:
+                num[v] = low[v] = counter
+                counter += 1
+                stack.append(v)
+                on_stack[v] = 1
+            targets = succ[v]
+            while k < len(targets):
+                w = targets[k]
+                k += 1
+                if not inside[w]:
+                    continue
+                if num[w] == -1:
+                    work[-1] = (v, k)
+                    work.append((w, 0))
+                    break
+                if on_stack[w] and num[w] < low[v]:
+                    low[v] = num[w]
+            else:
+                work.pop()
+                if work:        # Remontée vers le parent.
+                    u = work[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                if low[v] == num[v]:    # v est la racine d'une SCC.
+                    scc = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        scc.append(w)
+                        if w == v:
+                            break
+                    scc.sort()
+                    res.append(scc)
+    res.reverse()               # Tarjan donne les SCC puits en premier.
+    return res
+
+class Component:
+    __slots__ = ("ids", "bs", "borders", "solutions")
+
+    def __init__(self, systeme_argumentation: AS, ids: list[int]):
+        """
+        Prépare la résolution d'une SCC.
+        Args:
+            - systeme_argumentation: système d'argumentation <A, R>.
+            - ids: identifiants triés des arguments de la SCC.
+        Returns: None
+        """
+        self.ids = ids
+        self.bs = Bitset.restricted(systeme_argumentation, ids)    # Encodage local de la SCC.
+        pred, index = systeme_argumentation.pred, self.bs.index
+        self.borders = [[j for j in pred[i] if j not in index] for i in ids]   # Attaquants venant des SCC en amont.
+        self.solutions = {}     # Contexte amont -> liste des étiquetages locaux (IN, OUT) (memo seulement, au plus CONTEXTS).
+
+    def context(self, label: bytearray) -> tuple[int, int]:
+        """
+        Lit les étiquettes des attaquants en amont.
+        Returns: Couple (masque local des arguments attaqués par un IN, masque local de ceux attaqués par un UNDEC).
+        """
+        out = forbidden = 0
+        for p, border in enumerate(self.borders):
+            for j in border:
+                if label[j] == IN:
+                    out |= 1 << p
+                    break
+                if label[j] == UNDEC:
+                    forbidden |= 1 << p
+        return out, forbidden & ~out
+
+    def solve(self, preferred: bool, out: int, forbidden: int, req: int, excl: int, deadline: float = None, stop=None):
+        """
+        Génère les étiquetages locaux de la SCC pour un contexte amont.
+        Returns: Générateur de couples (IN, OUT) de masques locaux.
+        """
+        bs = self.bs
+        if req & (out | forbidden) or not bs.is_conflict_free(req):    # Un argument imposé ne peut pas être IN.
+            return
+        out |= bs.attacked_by(req)      # Les arguments attaqués par les imposés sont OUT.
+        yield from labelling.search(bs, preferred, in_=req, out=out, undec=(forbidden | excl) & ~out,
+                                    deadline=deadline, stop=stop)
+
+    def cached(self, preferred: bool, out: int, forbidden: int, deadline: float = None, stop=None) -> list[tuple[int, int]]:
+        """
+        Donne les étiquetages locaux de la SCC pour un contexte amont, calculés une seule fois par contexte.
+        Les CONTEXTS contextes utilisés le plus récemment sont conservés.
+        Returns: Liste des couples (IN, OUT) de masques locaux, sans argument imposé ni interdit.
+        """
+        key = (preferred, out, forbidden)
+        sols = self.solutions.pop(key, None)
+        if sols is None:
+            sols = list(self.solve(preferred, out, forbidden, 0, 0, deadline, stop))
+            if len(self.solutions) >= CONTEXTS:
+                del self.solutions[next(iter(self.solutions))]     # Le contexte utilisé le moins récemment.
+        self.solutions[key] = sols      # Réinséré en dernier : le dictionnaire est rangé du plus ancien au plus récent.
+        return sols
+
+def _local(systeme_argumentation: AS, ids: list[int]) -> Component:
+    """
+    Donne la composante ids, reprise du memo de l'AS si elle y est (et enregistrée sinon).
+    """
+    memo = systeme_argumentation.memo
+    if memo is None:
+        return Component(systeme_argumentation, ids)
+    key = frozenset(ids)
+    comp = memo.get(key)
+    if comp is None:
+        comp = memo[key] = Component(systeme_argumentation, ids)
+    return comp
+
+def iter_extensions(systeme_argumentation: AS, preferred: bool, required: set[int] = frozenset(), excluded: set[int] = frozenset(),
+                    deadline: float = None, stop=None):
+    """
+    Génère les extensions préférées ou stables avec le prétraitement fondé + SCC.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - preferred: True pour les extensions préférées, False pour les stables.
+        - required: identifiants des arguments imposés dans l'extension.
+        - excluded: identifiants des arguments interdits dans l'extension (en préféré, les extensions produites
+          sont alors les ensembles admissibles maximaux parmi ceux qui évitent excluded).
+        - deadline: échéance en secondes de time.monotonic() (aucune par défaut).
+        - stop: événement (méthode is_set) qui interrompt la recherche, vérifié à chaque noeud (aucun par défaut).
+    Returns: Générateur des extensions (listes d'identifiants des arguments IN).
+    Raises: TimeoutError: si l'échéance est dépassée ou si stop est positionné pendant la recherche.
+    """
+    af = systeme_argumentation
+    with stats.phase("grounded"):
+        label = grounded_labelling(af)
+    if any(label[i] == OUT for i in required) or any(label[i] == IN for i in excluded):    # Contraintes contraires à l'extension fondée.
+        return
+    g_in = [i for i in af.ids() if label[i] == IN]
+    rest = [i for i in af.ids() if label[i] == UNDEC]      # Arguments non décidés par l'extension fondée.
+    with stats.phase("scc"):
+        comps = [_local(af, ids) for ids in strongly_connected_components(af, rest)]
+        if af.memo is not None and len(af.memo) > len(comps):  # Les composantes qui n'existent plus sont oubliées.
+            current = {frozenset(comp.ids) for comp in comps}
+            for key in [key for key in af.memo if key not in current]:
+                del af.memo[key]
+    st = stats.current
+    if not comps:
+        if st is not None:
+            st.extensions += 1
+            st.emit("extension")
+        yield g_in
+        return
+    use_memo = af.memo is not None
+
+    def local(k: int):
+        """
+        Résout la SCC numéro k sachant les étiquettes des SCC en amont.
+        Returns: Générateur des listes d'identifiants IN de la SCC (les étiquettes de la SCC sont écrites dans label).
+        """
+        comp = comps[k]
+        out, forbidden = comp.context(label)
+        req = comp.bs.to_mask(i for i in comp.ids if i in required) if required else 0
+        excl = comp.bs.to_mask(i for i in comp.ids if i in excluded) if excluded else 0
+        if use_memo and not (preferred and excl):     # Solutions conservées pour ce contexte, filtrées selon req / excl.
+            sols = comp.cached(preferred, out, forbidden, deadline, stop)
+            if req or excl:
+                sols = [(in2, out2) for in2, out2 in sols if in2 & req == req and not in2 & excl]
+        else:
+            sols = comp.solve(preferred, out, forbidden, req, excl, deadline, stop)
+        ids = comp.ids
+        for in2, out2 in sols:
+            for p, i in enumerate(ids):     # Ecriture des étiquettes de la SCC pour les SCC en aval.
+                label[i] = IN if (in2 >> p) & 1 else OUT if (out2 >> p) & 1 else UNDEC
+            yield [ids[p] for p in bits(in2)]
+
+    gens = [local(0)]       # Une recherche en cours par SCC déjà traitée.
+    chosen = [None]         # Arguments IN choisis dans chaque SCC.
+    while gens:
+        if st is None:
+            part = next(gens[-1], None)
+        else:
+            with st.phase("search"):
+                part = next(gens[-1], None)
+        if part is None:    # Plus de solution pour cette SCC : on revient à la précédente.
+            gens.pop()
+            chosen.pop()
+            continue
+        chosen[-1] = part
+        if len(gens) == len(comps):     # Toutes les SCC sont étiquetées.
+            if st is not None:
+                st.extensions += 1
+                st.emit("extension")
+            yield g_in + [i for part in chosen for i in part]
+        else:
+            gens.append(local(len(gens)))
+            chosen.append(None)
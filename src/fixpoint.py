@@ -0,0 +1,89 @@
+"""
+src/fixpoint.py
+
+Fonction caractéristique F d'un système d'argumentation et ses points fixes.
+F(S) est l'ensemble des arguments défendus par S (tous leurs attaquants sont attaqués par S) :
+    - S sans conflit est admissible si S ⊆ F(S), complet si S = F(S).
+    - l'extension fondée est le plus petit point fixe de F (calculé en temps linéaire par grounded_labelling).
+    - le plus grand ensemble admissible inclus dans X est le plus grand point fixe de S -> X ∩ F(S)
+      (c'est ainsi qu'est obtenue l'extension idéale, à partir de l'intersection des extensions préférées).
+F travaille sur les masques de src/bitset.py : un appel coûte une passe sur les arguments,
+et sur un encodage restreint (Bitset.restricted) seuls les arguments de la restriction sont examinés.
+"""
+from src.systeme_argumentation import AS
+from src.bitset import Bitset, bits, iter_admissible
+from src import stats
+
+UNDEC, IN, OUT = 0, 1, 2    # Etiquettes (un argument non encore traité est aussi à 0).
+
+def characteristic(bs: Bitset, m: int) -> int:
+    """
+    Applique la fonction caractéristique.
+    Args:
+        - bs: encodage en masques de l'AS.
+        - m: masque de l'ensemble S.
+    Returns: Le masque de F(S), les arguments dont tous les attaquants sont attaqués par S.
+    """
+    stats.count("defence_checks")
+    plus = bs.attacked_by(m)        # Arguments attaqués par S.
+    atk = bs.atk
+    res = 0
+    for i in bits(bs.full):
+        if atk[i] & ~plus == 0:
+            res |= 1 << i
+    return res
+
+def is_complete(bs: Bitset, m: int) -> bool:
+    """
+    Vérifie que m est sans conflit et que m = F(m).
+    """
+    return bs.is_conflict_free(m) and characteristic(bs, m) == m
+
+def iter_complete(bs: Bitset):
+    """
+    Génère les masques des extensions complètes (ensembles admissibles qui contiennent tout ce qu'ils défendent).
+    """
+    for m in iter_admissible(bs):
+        if characteristic(bs, m) & ~m == 0:
+            yield m
+
+def largest_admissible(bs: Bitset, m: int) -> int:
+    """
+    Donne le plus grand ensemble admissible inclus dans un ensemble sans conflit.
+    Les arguments de m qui ne sont pas défendus par m sont retirés jusqu'à ce qu'il n'y en ait plus.
+    Args:
+        - bs: encodage en masques de l'AS.
+        - m: masque d'un ensemble sans conflit.
+    Returns: Le masque du plus grand point fixe de S -> m ∩ F(S).
+    """
+    while True:
+        kept = m & characteristic(bs, m)
+        if kept == m:
+            return m
+        m = kept
+
+def grounded_labelling(systeme_argumentation: AS) -> bytearray:
+    """
+    Calcule l'extension fondée (plus petit point fixe de F) en temps linéaire (nombre d'arguments + nombre d'attaques).
+    On compte pour chaque argument ses attaquants non encore OUT : quand ce compte tombe à 0,
+    l'argument est IN et tout ce qu'il attaque devient OUT.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+    Returns: Les étiquettes de l'extension fondée (label[i] vaut IN, OUT ou UNDEC).
+    """
+    succ, pred = systeme_argumentation.succ, systeme_argumentation.pred
+    n = len(succ)
+    alive = [len(attackers) for attackers in pred]  # Nombre d'attaquants de chaque argument qui ne sont pas OUT.
+    label = bytearray(n)
+    todo = [i for i in systeme_argumentation.ids() if alive[i] == 0]   # Arguments non attaqués.
+    while todo:
+        x = todo.pop()
+        label[x] = IN
+        for y in succ[x]:
+            if label[y] == UNDEC:   # y passe OUT une seule fois.
+                label[y] = OUT
+                for z in succ[y]:   # z perd un attaquant.
+                    alive[z] -= 1
+                    if alive[z] == 0 and label[z] == UNDEC:
+                        todo.append(z)
+    return label
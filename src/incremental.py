@@ -0,0 +1,81 @@
+"""
+src/incremental.py
+
+Raisonnement incrémental sur un AS qui évolue un argument ou une attaque à la fois (système de dialogue).
+Le raisonneur active le memo de l'AS (voir src/decomposition.py) : l'encodage de chaque composante
+fortement connexe et ses solutions par contexte amont sont conservés d'une requête à l'autre.
+Une modification passe par les méthodes de l'AS, qui n'effacent que les composantes touchées ;
+seules ces composantes (et celles dont le contexte amont a changé) sont recalculées à la requête suivante.
+"""
+from src.systeme_argumentation import AS
+from src.cache import ExtensionCache
+from src.store import ExtensionStore
+from src.queries import solve_query
+
+class IncrementalReasoner:
+    __slots__ = ("systeme_argumentation", "cache")
+
+    def __init__(self, systeme_argumentation: AS):
+        """
+        Initialise le raisonneur sur un AS (modifié sur place par la suite).
+        Args:
+            - systeme_argumentation: système d'argumentation <A, R>.
+        Returns: None
+        """
+        self.systeme_argumentation = systeme_argumentation
+        if systeme_argumentation.memo is None:
+            systeme_argumentation.memo = {}     # Composante (ensemble d'identifiants) -> résultats conservés.
+        self.cache = ExtensionCache(systeme_argumentation)
+
+    def add_argument(self, a: str):
+        """
+        Ajoute un argument.
+        """
+        self.systeme_argumentation.add_argument(a)
+        self._changed()
+
+    def remove_argument(self, a: str):
+        """
+        Retire un argument et ses attaques.
+        """
+        self.systeme_argumentation.remove_argument(a)
+        self._changed()
+
+    def add_attack(self, x: str, y: str):
+        """
+        Ajoute l'attaque x -> y.
+        """
+        self.systeme_argumentation.add_attack(x, y)
+        self._changed()
+
+    def remove_attack(self, x: str, y: str):
+        """
+        Retire l'attaque x -> y.
+        """
+        self.systeme_argumentation.remove_attack(x, y)
+        self._changed()
+
+    def _changed(self):
+        """
+        Oublie les listes d'extensions : elles sont recombinées à la demande à partir des composantes conservées.
+        """
+        self.cache = ExtensionCache(self.systeme_argumentation)
+
+    def extensions(self, semantic: str) -> ExtensionStore:
+        """
+        Donne les extensions actuelles d'une sémantique ('PR' ou 'ST').
+        """
+        return self.cache.get(semantic)
+
+    def solve(self, problem: str, query) -> bool:
+        """
+        Résout une requête VE / DC / DS sur l'état actuel de l'AS avec les procédures de src/queries.py
+        (qui s'arrêtent dès que la réponse est connue et profitent des composantes conservées).
+        Args:
+            - problem: type de problème.
+            - query: ensemble S (pour les VE) ou argument a (pour DC / DS).
+        Returns:
+            - True si la requête est satisfaite.
+            - False sinon.
+        """
+        return solve_query(problem, self.systeme_argumentation, query)
@@ -0,0 +1,140 @@
+"""
+src/labelling.py
+
+Solveur par retour arrière sur les étiquetages (labellings) pour les extensions préférées et stables.
+Chaque argument porte une étiquette :
+    - IN : dans l'extension.
+    - OUT : attaqué par un argument IN.
+    - MUST_OUT : attaque un argument IN sans être encore attaqué par IN (doit devenir OUT).
+    - UNDEC : exclu de l'extension (choix du retour arrière ou argument qui s'attaque lui-même).
+    - BLANK : pas encore décidé.
+Les étiquettes sont des masques de bits sur l'encodage de src/bitset.py.
+A chaque noeud :
+    - propagation : un argument BLANK dont tous les attaquants sont OUT est forcément IN.
+    - élagage : un MUST_OUT (ou, en stable, un argument non IN) qui n'a plus d'attaquant BLANK ne peut plus être rendu OUT.
+    - branchement : un argument BLANK est essayé IN puis UNDEC.
+En préféré, seuls les ensembles admissibles maximaux sont produits, sans garder les extensions déjà trouvées
+(la mémoire reste proportionnelle à la profondeur de la recherche) :
+    - une branche est coupée dès qu'un argument mis UNDEC par un branchement peut être ajouté à toute feuille en dessous :
+      il n'est pas OUT et chacun de ses attaquants est OUT ou UNDEC et attaqué par lui.
+    - une feuille qui passe ce test est vérifiée par une sous-recherche d'un ensemble admissible qui la contient
+      avec en plus un de ces arguments (_extends) : la feuille n'est produite que s'il n'y en a pas.
+Si la collecte est active (src/stats.py), chaque noeud, test de défense de la propagation et branche coupée est compté.
+Avec une échéance (deadline), la recherche s'interrompt par TimeoutError dès qu'un noeud est atteint après elle ;
+de même dès que l'événement stop est positionné (src/parallel.py : une réponse est connue, les autres processus s'arrêtent).
+"""
+import time
+from src.bitset import Bitset, bits, popcount
+from src import stats
+
+def search(bs: Bitset, preferred: bool, in_: int = 0, out: int = 0, undec: int = 0, scope: int = None, must_out: int = None,
+           deadline: float = None, maximal: bool = True, stop=None):
+    """
+    Parcourt les étiquetages par retour arrière.
+    Args:
+        - bs: encodage en masques de l'AS.
+        - preferred: True pour les extensions préférées, False pour les stables.
+        - in_, out, undec: étiquettes déjà fixées au départ.
+        - scope: masque des arguments à décider (tous par défaut).
+        - must_out: attaquants de IN pas encore OUT (recalculé à partir de IN par défaut).
+        - deadline: échéance en secondes de time.monotonic() (aucune par défaut).
+        - maximal: en préféré, False pour produire tous les ensembles admissibles atteints (sans test de maximalité).
+        - stop: événement (méthode is_set) qui interrompt la recherche (aucun par défaut).
+    Returns: Générateur de couples (IN, OUT) des étiquetages trouvés.
+    Raises: TimeoutError: si l'échéance est dépassée ou si stop est positionné.
+    """
+    att, atk = bs.att, bs.atk
+    if scope is None:
+        scope = bs.full
+    undec |= bs.self_attacking & scope          # Un argument qui s'attaque lui-même ne peut pas être IN.
+    if must_out is None:
+        must_out = bs.attackers_of(in_) & ~out  # Attaquants de IN qui ne sont pas encore contre-attaqués.
+    st = stats.current
+    maximal = preferred and maximal
+    base = undec        # Arguments exclus dès le départ (ils ne rendent pas une feuille extensible).
+    # chosen : arguments mis UNDEC par un branchement. Le dernier masque indique les arguments à réexaminer pour la propagation.
+    stack = [(in_, out, must_out, undec, 0, scope)]
+    while stack:
+        in_, out, must_out, undec, chosen, check = stack.pop()
+        if st is not None:
+            st.subsets += 1
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError("Error: délai de recherche dépassé.")
+        if stop is not None and stop.is_set():
+            raise TimeoutError("Error: recherche interrompue.")
+
+        # Propagation : les arguments BLANK dont tous les attaquants sont OUT passent IN.
+        # Seuls les arguments attaqués par un argument devenu OUT depuis le dernier passage sont réexaminés.
+        blank = scope & ~(in_ | out | must_out | undec)
+        while check:
+            if st is not None:
+                st.defence_checks += popcount(check & blank)
+            forced = 0
+            for x in bits(check & blank):
+                if atk[x] & ~out == 0:
+                    forced |= 1 << x
+            if not forced:
+                break
+            new_out = bs.attacked_by(forced) & ~out
+            in_ |= forced
+            out |= new_out
+            must_out = (must_out | bs.attackers_of(forced)) & ~out
+            undec &= ~out
+            check = bs.attacked_by(new_out) & scope
+            blank = scope & ~(in_ | out | must_out | undec)
+
+        # Elagage : chaque argument qui doit finir OUT a encore besoin d'un attaquant BLANK.
+        # En préféré, un argument UNDEC choisi qui ne peut plus être attaqué que par des arguments qu'il attaque
+        # et qui ne seront jamais IN s'ajoute à toute feuille en dessous : la branche ne contient aucune extension maximale.
+        pending = must_out if preferred else scope & ~(in_ | out | blank)
+        chosen &= ~out
+        dead = any(atk[y] & blank == 0 for y in bits(pending))
+        if maximal and not dead:
+            dead = any(atk[x] & ~(out | att[x] & undec) == 0 for x in bits(chosen))
+        if dead:
+            if st is not None:
+                st.pruned += 1
+            continue
+
+        if not blank:       # Feuille : tous les arguments sont étiquetés.
+            if maximal and _extends(bs, in_, out, base, scope, chosen, deadline, stop):
+                if st is not None:
+                    st.pruned += 1
+                continue
+            yield in_, out
+            continue
+
+        # Branchement : de préférence sur un argument qui attaque un MUST_OUT.
+        cand = blank & bs.attackers_of(must_out)
+        low = (cand or blank) & -(cand or blank)
+        x = low.bit_length() - 1
+        stack.append((in_, out, must_out, undec | low, chosen | low, 0))   # Branche UNDEC (explorée en second).
+        new_out = att[x] & ~out
+        out_x = out | new_out
+        stack.append((in_ | low, out_x, (must_out | atk[x]) & ~out_x, undec & ~out_x, chosen,
+                      bs.attacked_by(new_out) & scope))                 # Branche IN (explorée en premier).
+
+def _extends(bs: Bitset, in_: int, out: int, undec: int, scope: int, chosen: int, deadline: float = None, stop=None) -> bool:
+    """
+    Vérifie qu'une feuille de la recherche préférée n'est pas maximale.
+    Un ensemble admissible plus grand ne peut ajouter que des arguments UNDEC choisis par branchement (les autres sont OUT
+    ou exclus dès le départ) : on cherche, pour chacun d'eux, un ensemble admissible qui contient IN et lui,
+    en excluant ceux déjà essayés.
+    Args:
+        - bs: encodage en masques de l'AS.
+        - in_, out: étiquettes de la feuille.
+        - undec: arguments exclus dès le départ de la recherche.
+        - scope: masque des arguments à décider.
+        - chosen: arguments UNDEC choisis par branchement (et pas OUT).
+        - deadline: échéance en secondes de time.monotonic() (aucune par défaut).
+        - stop: événement qui interrompt la recherche (aucun par défaut).
+    Returns: True si un ensemble admissible contient strictement IN.
+    """
+    for x in bits(chosen):
+        out_x = out | bs.att[x]
+        larger = search(bs, True, in_=in_ | 1 << x, out=out_x, undec=undec & ~out_x, scope=scope, deadline=deadline,
+                        maximal=False, stop=stop)
+        if next(larger, None) is not None:
+            return True
+        undec |= 1 << x     # Les ensembles qui contiennent x ont été écartés.
+    return False
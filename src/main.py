@@ -0,0 +1,267 @@
+"""
+src/main.py
+
+Corps du programme, lancé par program.py.
+Orchestration complète :
+  - parsing de la ligne de commande.
+  - validation de la requête utilisateur.
+  - parsing du fichier .apx.
+  - construction du système d'argumentation.
+  - résolution de la requête.
+En mode batch (-b), le fichier .apx est lu une seule fois puis chaque ligne
+"PROBLEME ARGUMENTS" du fichier de requêtes (ou de l'entrée standard avec -b -)
+est résolue avec un cache d'extensions commun.
+Avec -c, chaque ligne "a,b,c" du fichier de candidats est vérifiée pour le problème VE donné par -p,
+les candidats étant vérifiés par paquets (voir src/bulk.py).
+
+Avec -p EE-PR / EE-ST, les extensions sont affichées une par ligne ("[a,b,c]") au fur et à mesure de la recherche,
+avec -p SE-PR / SE-ST une seule extension (ou NO s'il n'y en a pas) ; --limit borne le nombre d'extensions,
+--timeout la durée de la recherche et --count n'affiche que le nombre d'extensions.
+
+Avec --cache, le système est chargé depuis le cache binaire <fichier>.afc (créé au premier appel)
+et les extensions calculées y sont conservées pour les appels suivants.
+
+Avec --jobs N, la recherche est répartie sur N processus (voir src/parallel.py).
+Avec --backend sat, les requêtes sont résolues par le moteur SAT (voir src/sat.py).
+Avec --connect ADRESSE, la requête est envoyée à un démon de résolution (voir src/daemon.py), qui garde
+les AS déjà lus et leurs extensions d'une requête à l'autre ; la sortie reste YES ou NO.
+Avec --stats, les compteurs et les temps par phase du solveur sont affichés sur stderr (voir src/stats.py) ;
+avec --profile DIR, un profil cProfile et un instantané tracemalloc de l'exécution sont écrits dans DIR.
+
+Démarrage rapide : le code est ici plutôt que dans program.py car Python ne garde pas de bytecode compilé
+pour le script lancé, alors que ce module est compilé une seule fois (src/__pycache__).
+Seuls sys et src/cli.py sont importés au lancement. La forme "-p -f -a" est lue sans argparse
+et chaque module n'est importé que si la requête en a besoin : une requête seule ne charge que le parseur
+et src/queries.py (jamais argparse, le cache binaire, le mode parallèle, SAT, le démon ou NumPy).
+src/queries.py et src/semantics.py n'importent eux-mêmes la recherche et la décomposition que si la requête en a besoin :
+VE-ST est un seul test de stabilité et ne charge ni src/labelling.py, ni src/decomposition.py, ni src/fixpoint.py, ni src/store.py.
+
+Pour les problèmes de décision, affiche uniquement YES ou NO sur la sortie standard (une ligne par requête).
+Les erreurs sont affichées sur stderr et pas sur la sortie standard.
+"""
+from __future__ import annotations     # Annotations non évaluées : AS et ExtensionCache ne sont pas importés au lancement.
+import sys
+from src.cli import parse_args, PROBLEMS, ENUMERATIONS
+
+TYPE_CHECKING = False   # Vrai pour mypy / pyright : typing (environ 9 ms) n'est pas importé au lancement.
+if TYPE_CHECKING:
+    from src.systeme_argumentation import AS
+    from src.cache import ExtensionCache
+
+def parse_and_validate_query(problem: str, raw_a: str):
+    """
+    Parse et valide l'argument -a en fonction du problème.
+    Args:
+        - problem: type de problème.
+        - raw_a: valeur brute de l'option -a (chaine de caractères).
+    Returns:
+        - Un ensemble d'arguments (set[str]) pour VE.
+        - Un argument unique (str) pour DC / DS.
+    Raises: ValueError: si le format de -a est invalide.
+    """
+    raw_a = raw_a.strip().lower()   # Suppression des espaces inutile et mise en minuscule.
+    tokens = []                     # Initatialisation de la liste les arguments pour les problèmes VE-.
+    if not problem.startswith("VE-"):   # Cas DC / DS où on attend un seul argument.
+        if "," in raw_a:                # On teste la présence d'une virgule (c'ets a dire est ce qu'il y'a plusieurs arguments).
+            raise ValueError("Error: -a doit contenir un seul argument.")
+        if raw_a == "":                 # On teste si la chaine est vide (c'est a dire il n'y a pas d'arguments).
+            raise ValueError("Error: -a ne peut pas être vide.")
+        return raw_a        # On retourne l'argument.
+    for t in raw_a.split(","):  # On itère sur la liste d'arguments qui a été créé en séparant à partir de la virgule.
+        t = t.strip()           # Suppression des espaces inutile.
+        if t != "":             # On teste si la chaine est vide.
+            tokens.append(t)    # Si la chaine n'est pas vide on l'ajoute à la liste des arguments.
+    if not tokens:              # Si la liste des arguments est vide on lève une erreur.
+        raise ValueError("Error: -a doit contenir au moins un argument.")
+    return set(tokens) # On retourne le(s) argument(s) sous forme d'ensemble.
+
+def run_batch(systeme_argumentation: AS, stream, cache: ExtensionCache):
+    """
+    Résout chaque requête "PROBLEME ARGUMENTS" lue dans stream sur le même AS.
+    Les lignes vides et celles commençant par '#' sont ignorées.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - stream: flux texte des requêtes (une par ligne).
+        - cache: cache des extensions partagé par toutes les requêtes.
+    Returns: None
+    Raises: ValueError: si une ligne est mal formée (avec son numéro).
+    """
+    from src.queries import solve_query
+    for num, ligne in enumerate(stream, 1):
+        ligne = ligne.strip()
+        if ligne == "" or ligne.startswith("#"):   # Ligne vide ou commentaire.
+            continue
+        problem, _, raw_a = ligne.partition(" ")
+        if problem not in PROBLEMS:
+            raise ValueError(f"Error: ligne {num}: problème inconnu '{problem}'.")
+        try:
+            query = parse_and_validate_query(problem, raw_a)
+        except ValueError as e:
+            raise ValueError(f"ligne {num}: {e}")
+        res = solve_query(problem, systeme_argumentation, query, cache)
+        print("YES" if res else "NO", flush=True)   # Une réponse par requête, envoyée immédiatement.
+
+CANDIDATES_CHUNK = 4096    # Nombre de candidats vérifiés ensemble en vérification groupée.
+
+def run_candidates(systeme_argumentation: AS, problem: str, stream):
+    """
+    Vérifie chaque ensemble "a,b,c" lu dans stream (un par ligne) par paquets de CANDIDATES_CHUNK candidats.
+    Les lignes vides et celles commençant par '#' sont ignorées.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - problem: 'VE-PR' ou 'VE-ST'.
+        - stream: flux texte des candidats.
+    Returns: None
+    Raises: ValueError: si une ligne est mal formée (avec son numéro).
+    """
+    from src.queries import verify_many
+    paquet = []
+
+    def flush():
+        for res in verify_many(problem, systeme_argumentation, paquet):
+            print("YES" if res else "NO")
+        paquet.clear()
+
+    for num, ligne in enumerate(stream, 1):
+        ligne = ligne.strip()
+        if ligne == "" or ligne.startswith("#"):   # Ligne vide ou commentaire.
+            continue
+        try:
+            paquet.append(parse_and_validate_query(problem, ligne))
+        except ValueError as e:
+            raise ValueError(f"ligne {num}: {e}")
+        if len(paquet) == CANDIDATES_CHUNK:
+            flush()
+    flush()
+
+def run_enumeration(systeme_argumentation: AS, problem: str, args: dict, cache: ExtensionCache = None):
+    """
+    Affiche les extensions (EE), une extension (SE) ou leur nombre (--count), au fur et à mesure de la recherche.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - problem: 'EE-PR', 'EE-ST', 'SE-PR' ou 'SE-ST'.
+        - args: options de la ligne de commande (voir src/cli.py).
+        - cache: cache des extensions déjà calculées (optionnel).
+    Returns: None
+    Raises: TimeoutError: si le délai --timeout est dépassé (les extensions déjà affichées restent valables).
+    """
+    kind, _, semantic = problem.partition('-')
+    limit = 1 if kind == 'SE' else args["limit"]
+    if cache is not None and semantic in cache.extensions:     # Extensions déjà conservées dans le cache binaire.
+        from itertools import islice
+        exts = islice(cache.extensions[semantic], limit)
+    elif args["backend"] == "sat":
+        from src import sat
+        exts = sat.iter_extensions(systeme_argumentation, semantic, limit, args["timeout"])
+    elif args["count"]:     # Comptage sans construire les extensions.
+        from src import semantics
+        print(semantics.count_extensions(systeme_argumentation, semantic, limit, args["timeout"]))
+        return
+    else:
+        from src import semantics
+        exts = semantics.iter_extensions(systeme_argumentation, semantic, limit, args["timeout"])
+    if args["count"]:
+        print(sum(1 for _ in exts))
+        return
+    found = False
+    for ext in exts:
+        print(f"[{','.join(sorted(ext))}]", flush=True)    # Chaque extension est envoyée dès qu'elle est trouvée.
+        found = True
+    if kind == 'SE' and not found:
+        print("NO")
+
+def run(args: dict):
+    """
+    Charge le système d'argumentation et résout la requête (ou les requêtes du mode batch).
+    Args:
+        - args: options de la ligne de commande (voir src/cli.py).
+    Returns: None
+    """
+    problem = args["probleme"]      # Récupération du problème voulant etre traité.
+
+    query = None
+    if args["batch"] is None and args["candidates"] is None and problem not in ENUMERATIONS:
+        query = parse_and_validate_query(problem, args["arguments"]) # Récupération des arguments à 
+
+    if args["connect"] is not None:     # Requête résolue par le démon : le fichier n'est pas lu ici.
+        import os
+        from src import client
+        res = client.solve(args["connect"], problem, os.path.abspath(args["file"]), query)
+        print("YES" if res else "NO")
+        return
+
+    from src import stats
+    cache = stored = None
+    with stats.phase("parse"):
+        if args["cache"]:   # Chargement par le cache binaire, avec les extensions déjà calculées.
+            from src import compiled
+            from src.cache import ExtensionCache
+            from src.queries import cached_semantic
+            systeme_argumentation, stored, digest = compiled.load(args["file"])
+            cache = ExtensionCache(systeme_argumentation, args["jobs"], args["backend"])
+            for semantic, exts in stored.items():
+                cache.seed(semantic, exts)
+        else:
+            from src.apx_parser import load_apx
+            systeme_argumentation = load_apx(args["file"])  # Création du système d'argumentation à partir du fichier renseigné (tableaux d'adjacence).
+
+    if problem in ENUMERATIONS:     # Enumération paresseuse des extensions.
+        run_enumeration(systeme_argumentation, problem, args, cache)
+    elif args["candidates"] is not None:  # Vérification groupée de tous les candidats du fichier.
+        if args["candidates"] == "-":
+            run_candidates(systeme_argumentation, problem, sys.stdin)
+        else:
+            with open(args["candidates"], 'r', encoding= 'utf-8') as candidats:
+                run_candidates(systeme_argumentation, problem, candidats)
+    elif args["batch"] is not None:   # Mode batch : un seul chargement du fichier pour toutes les requêtes.
+        if cache is None:
+            from src.cache import ExtensionCache
+            cache = ExtensionCache(systeme_argumentation, args["jobs"], args["backend"])
+        if args["batch"] == "-":
+            run_batch(systeme_argumentation, sys.stdin, cache)
+        else:
+            with open(args["batch"], 'r', encoding= 'utf-8') as requetes:
+                run_batch(systeme_argumentation, requetes, cache)
+    elif cache is not None and cached_semantic(problem) in cache.extensions:     # Extensions déjà conservées dans le cache binaire.
+        from src.queries import solve_query
+        res = solve_query(problem, systeme_argumentation, query, cache)
+        print("YES" if res else "NO")
+    elif args["backend"] == "sat":    # Requête seule résolue par le moteur SAT.
+        from src import sat
+        res = sat.solve_query(problem, systeme_argumentation, query)
+        print("YES" if res else "NO")
+    elif args["jobs"] > 1:  # Requête seule répartie sur plusieurs processus.
+        from src import parallel
+        res = parallel.solve_query(problem, systeme_argumentation, query, args["jobs"])
+        print("YES" if res else "NO")
+    else:   # Requête seule : procédure dédiée qui s'arrête dès que la réponse est connue, sans tout énumérer.
+        from src.queries import solve_query
+        res = solve_query(problem, systeme_argumentation, query) # Résolution du problème voulu avec les arguments voulu pour le système d'argumentation voulu.
+        print("YES" if res else "NO")   # Affiche YES ou NO en fonction du résultat de la résolution du problème.
+
+    if args["cache"] and cache.extensions.keys() != stored.keys():     # De nouvelles extensions ont été calculées : on les conserve.
+        from src import compiled
+        compiled.save_extensions(args["file"], systeme_argumentation, digest, cache.extensions)
+
+def main():
+    """
+    Fonction principale du programme.
+    """
+    try: # Bloc permettant de géré les erreurs pouvant etre provoquée par les fonctions à l'intérieur.
+        args = parse_args(sys.argv[1:]) # Récupération des paramètres passés en ligne de commande.
+        if args["profile"] is None and not args["stats"]:   # Cas courant : pas d'instrumentation.
+            run(args)
+            return
+        from contextlib import ExitStack
+        from src import stats
+        with ExitStack() as contexte:
+            if args["profile"] is not None:     # Profil cProfile / tracemalloc écrit à la fin de l'exécution.
+                contexte.enter_context(stats.profile(args["profile"]))
+            if args["stats"]:   # Compteurs et temps par phase, affichés sur stderr pour ne pas changer la sortie.
+                collected = contexte.enter_context(stats.collect())
+                contexte.callback(lambda: print(collected.report(), file=sys.stderr))
+            run(args)
+
+    except Exception as e:              # En cas d'erreur, le programme affiche l'erreur sur la sortir d'erreur et pas sur la sortie standard.
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,173 @@
+"""
+src/parallel.py
+
+Recherche d'extensions répartie sur plusieurs processus (concurrent.futures.ProcessPoolExecutor).
+L'espace de recherche est découpé en fixant l'appartenance de k arguments non décidés par l'extension fondée
+(choisis dans la plus grande SCC, par degré décroissant) : chaque combinaison IN / hors extension est une tâche,
+résolue par src/decomposition.py avec ces arguments imposés ou interdits.
+    - stable : les tâches donnent exactement les extensions stables de leur partie.
+    - préférée : une tâche donne les ensembles admissibles maximaux parmi ceux de sa partie ;
+      toute extension préférée est trouvée par la tâche de sa partie, les ensembles non maximaux sont retirés à la fusion.
+Les résultats sont fusionnés dans l'ordre des tâches : la sortie ne dépend pas de l'ordre de fin des processus.
+Pour DC / DS, les processus s'arrêtent dès qu'un témoin ou un contre-exemple est trouvé : l'événement partagé
+est vérifié à chaque noeud de la recherche (src/labelling.py), pas seulement entre deux extensions.
+"""
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from src.systeme_argumentation import AS
+from src import decomposition, queries
+from src.store import ExtensionStore
+
+TASKS_PER_JOB = 4       # Plusieurs tâches par processus pour équilibrer la charge.
+
+_af = None              # AS reconstruit dans chaque processus.
+_stop = None            # Evénement partagé : une réponse est connue, les tâches en cours s'arrêtent.
+
+def _init_worker(names: list[str], src: array, dst: array, stop):
+    """
+    Reconstruit l'AS une seule fois dans chaque processus.
+    """
+    global _af, _stop
+    _af = AS.from_arrays(names, src, dst)
+    _stop = stop
+
+def partitions(systeme_argumentation: AS, jobs: int) -> list[tuple[frozenset[int], frozenset[int]]]:
+    """
+    Découpe l'espace de recherche en fixant l'appartenance de k arguments (2^k >= TASKS_PER_JOB * jobs).
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - jobs: nombre de processus.
+    Returns: Liste des parties (identifiants imposés IN, identifiants interdits), dans un ordre fixe.
+    """
+    af = systeme_argumentation
+    label = decomposition.grounded_labelling(af)
+    rest = [i for i in af.ids() if label[i] == decomposition.UNDEC]
+    if not rest:
+        return [(frozenset(), frozenset())]
+    largest = max(decomposition.strongly_connected_components(af, rest), key=len)
+    cand = sorted((i for i in largest if i not in af.succ[i]), key=lambda i: (-len(af.succ[i]) - len(af.pred[i]), i))
+    k = 0
+    while (1 << k) < TASKS_PER_JOB * jobs and k < len(cand):
+        k += 1
+    fixed = cand[:k]
+    res = []
+    for pattern in range(1 << k):
+        required = frozenset(x for p, x in enumerate(fixed) if (pattern >> p) & 1)
+        res.append((required, frozenset(fixed) - required))
+    return res
+
+def _extensions(preferred: bool, required: frozenset[int], excluded: frozenset[int]) -> list[list[int]]:
+    """
+    Tâche : extensions (maximales dans la partie en préféré) de la partie donnée.
+    """
+    res = []
+    try:
+        for ids in decomposition.iter_extensions(_af, preferred, required=required, excluded=excluded, stop=_stop):
+            res.append(ids)
+    except TimeoutError:    # Recherche interrompue par l'événement partagé.
+        pass
+    return res
+
+def _exists(preferred: bool, required: frozenset[int], excluded: frozenset[int], maximal: bool) -> bool:
+    """
+    Tâche : vérifie qu'une extension de la partie respecte les contraintes.
+    Avec maximal, l'ensemble trouvé doit aussi être une extension préférée de tout l'AS
+    (aucune extension préférée ne le contient strictement).
+    """
+    try:
+        for ids in decomposition.iter_extensions(_af, preferred, required=required, excluded=excluded, stop=_stop):
+            if not maximal:
+                return True
+            first = next(decomposition.iter_extensions(_af, True, required=set(ids), stop=_stop))
+            if len(first) == len(ids):
+                return True
+    except TimeoutError:    # Une autre tâche a trouvé la réponse.
+        pass
+    return False
+
+def _run(systeme_argumentation: AS, jobs: int, tasks, fn, first: bool = False):
+    """
+    Exécute les tâches (tuples d'arguments de fn) sur jobs processus.
+    Args:
+        - first: True pour s'arrêter à la première tâche qui renvoie True.
+    Returns: Liste des résultats dans l'ordre des tâches (ou booléen avec first).
+    """
+    af = systeme_argumentation
+    src, dst = array('i'), array('i')
+    for i, targets in enumerate(af.succ):
+        src.extend([i] * len(targets))
+        dst.extend(targets)
+    stop = multiprocessing.Event()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(af.names, src, dst, stop)) as pool:
+        futures = [pool.submit(fn, *task) for task in tasks]
+        if not first:
+            return [f.result() for f in futures]
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            if any(f.result() for f in done):
+                stop.set()      # Les tâches en cours s'arrêtent, celles en attente sont annulées.
+                for f in pending:
+                    f.cancel()
+                return True
+        return False
+
+def extensions(systeme_argumentation: AS, semantic: str, jobs: int) -> ExtensionStore:
+    """
+    Calcule les extensions d'une sémantique sur plusieurs processus.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - semantic: 'PR' ou 'ST'.
+        - jobs: nombre de processus.
+    Returns: Collection compacte des extensions (ordre déterministe, voir src/store.py).
+    Raises: ValueError: si la sémantique est inconnue.
+    """
+    if semantic not in ('PR', 'ST'):
+        raise ValueError(f"Sémantique inconnue: {semantic}")
+    preferred = semantic == 'PR'
+    tasks = [(preferred, req, excl) for req, excl in partitions(systeme_argumentation, jobs)]
+    found = [frozenset(ids) for part in _run(systeme_argumentation, jobs, tasks, _extensions) for ids in part]
+    if preferred:       # Fusion : on ne garde que les ensembles maximaux par inclusion.
+        kept = []
+        for S in sorted(found, key=len, reverse=True):
+            if not any(S < P for P in kept):
+                kept.append(S)
+        kept = set(kept)
+        found = [S for S in found if S in kept]
+    return ExtensionStore(systeme_argumentation, found)
+
+def solve_query(problem: str, systeme_argumentation: AS, query, jobs: int) -> bool:
+    """
+    Résout une requête en répartissant la recherche sur plusieurs processus.
+    Les vérifications (VE), les sémantiques autres que PR / ST et les cas tranchés par l'extension fondée
+    restent résolus par src/queries.py.
+    Args:
+        - problem: type de problème.
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - query: ensemble S (pour les VE) ou argument a (pour DC / DS).
+        - jobs: nombre de processus.
+    Returns:
+        - True si la requête est satisfaite.
+        - False sinon.
+    Raises: ValueError: si le problème est inconnu.
+    """
+    af = systeme_argumentation
+    kind, _, semantic = problem.partition('-')
+    if kind == 'VE' or semantic not in ('PR', 'ST') or query not in af.A:
+        return queries.solve_query(problem, af, query)
+    a = af.index[query]
+    label = decomposition.grounded_labelling(af)
+    if label[a] != decomposition.UNDEC:     # 'a' IN est dans toutes les extensions, 'a' OUT dans aucune.
+        return queries.solve_query(problem, af, query)
+    preferred = semantic == 'PR'
+    tasks = []
+    for req, excl in partitions(af, jobs):
+        if kind == 'DC':        # Témoin contenant 'a'.
+            req = req | {a}
+        else:                   # Contre-exemple ne contenant pas 'a'.
+            excl = excl | {a}
+        if req.isdisjoint(excl):
+            tasks.append((preferred, req, excl, preferred and kind == 'DS'))
+    found = _run(af, jobs, tasks, _exists, first=True)
+    return found if kind == 'DC' else not found
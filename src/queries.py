@@ -4,46 +4,167 @@ src/queries.py
 Gestion des commandes VE / DC / DS avec les sémantiques :
     - préférée (PR)
     - stable (ST)
+    - fondée (GR)
+    - complète (CO)
+    - semi-stable (SST)
+    - idéale (ID)
+Chaque requête utilise une procédure de décision dédiée qui s'arrête dès que la réponse est connue
+(aucune liste complète d'extensions n'est construite, sauf pour les semi-stables quand il n'y a pas d'extension stable).
+Avec un cache (ou pour les semi-stables), DC / DS sont un test de bit sur l'union / l'intersection des extensions
+gardées par src/store.py, sans parcourir d'ensembles Python.
+Les requêtes passent par une sémantique moins coûteuse quand la théorie le permet :
+    - un argument de l'extension fondée est dans toutes les extensions complètes (donc préférées, stables, semi-stables et idéale).
+    - les extensions complètes et préférées acceptent crédulement les mêmes arguments (DC-CO = DC-PR),
+      et l'extension fondée est la plus petite extension complète (DS-CO = DC-GR).
+    - les semi-stables sont des préférées (DS-PR implique DS-SST, DC-SST implique DC-PR),
+      et ce sont les stables dès qu'il existe une extension stable.
+    - l'extension idéale est incluse dans toutes les préférées (DC-ID implique DS-PR).
+La décomposition, la recherche et les collections d'extensions ne sont importées (par src/semantics.py)
+que par les requêtes qui en ont besoin : VE-ST, VE-GR, VE-CO et DC-GR / DS-GR n'en chargent aucune.
 """
-
+from __future__ import annotations     # Annotations non évaluées : ExtensionCache (src/cache.py) n'est pas importé.
 from src.systeme_argumentation import AS
 import src.semantics as semantics
+from src import stats
+
+TYPE_CHECKING = False   # Comme typing.TYPE_CHECKING, sans importer typing (voir src/main.py).
+if TYPE_CHECKING:
+    from src.cache import ExtensionCache
+
+SEMANTICS = ('PR', 'ST', 'GR', 'CO', 'SST', 'ID')     # Sémantiques gérées.
+DIRECT = ('VE-ST', 'VE-CO', 'VE-GR', 'DC-GR', 'DS-GR', 'DS-CO')    # Tests en temps polynomial : le cache des extensions n'est pas utilisé.
 
-def solve_query(problem: str, systeme_argumentation: AS, query) -> bool:
+def solve_query(problem: str, systeme_argumentation: AS, query, cache: ExtensionCache = None) -> bool:
     """
     Résout une requête VE / DC / DS selon la sémantique demandée.
     Args:
         - problem: type de problème.
         - systeme_argumentation: système d'argumentation <A, R>.
         - query: ensemble S (pour les VE) ou argument a (pour DC / DS).
+        - cache: cache des extensions de l'AS, réutilisé d'une requête à l'autre (optionnel).
     Returns:
         - True si la requête est satisfaite.
         - False sinon.
     Raises: ValueError: si le problème est inconnu.
     """
-    match problem:      # Appel de la bonne fonction en fonction du problème renseigné en paramètre.
-        case 'VE-PR':
-            return ve_pr(systeme_argumentation, query)
+    with stats.phase("query"):     # Temps total de résolution de la requête (si la collecte est active).
+        if cache is not None and problem not in DIRECT:
+            return solve_cached(problem, cache, query)
+        match problem:      # Appel de la bonne fonction en fonction du problème renseigné en paramètre.
+            case 'VE-PR':
+                return ve_pr(systeme_argumentation, query)
         
-        case 'DC-PR':
-            return dc_pr(systeme_argumentation, query)
+            case 'DC-PR':
+                return dc_pr(systeme_argumentation, query)
         
-        case 'DS-PR':
-            return ds_pr(systeme_argumentation, query)
+            case 'DS-PR':
+                return ds_pr(systeme_argumentation, query)
         
-        case 'VE-ST':
-            return ve_st(systeme_argumentation, query)
+            case 'VE-ST':
+                return ve_st(systeme_argumentation, query)
         
-        case 'DC-ST':
-            return dc_st(systeme_argumentation, query)
+            case 'DC-ST':
+                return dc_st(systeme_argumentation, query)
         
-        case 'DS-ST':
-            return ds_st(systeme_argumentation, query)
+            case 'DS-ST':
+                return ds_st(systeme_argumentation, query)
+
+            case 'VE-GR':
+                return ve_gr(systeme_argumentation, query)
+
+            case 'DC-GR' | 'DS-GR':     # Une seule extension : crédule et sceptique coïncident.
+                return dc_gr(systeme_argumentation, query)
+
+            case 'VE-CO':
+                return ve_co(systeme_argumentation, query)
+
+            case 'DC-CO':
+                return dc_pr(systeme_argumentation, query)
+
+            case 'DS-CO':
+                return dc_gr(systeme_argumentation, query)
+
+            case 'VE-SST':
+                return ve_sst(systeme_argumentation, query)
+
+            case 'DC-SST':
+                return dc_sst(systeme_argumentation, query)
+
+            case 'DS-SST':
+                return ds_sst(systeme_argumentation, query)
+
+            case 'VE-ID':
+                return ve_id(systeme_argumentation, query)
+
+            case 'DC-ID' | 'DS-ID':
+                return dc_id(systeme_argumentation, query)
         
-        case _:         # Cas d'érreur si jamais.
+            case _:         # Cas d'érreur si jamais.
+                raise ValueError(f"Problème inconnu: {problem}")
+
+
+def cached_semantic(problem: str) -> str:
+    """
+    Donne la sémantique dont les extensions conservées répondent à une requête (voir solve_cached).
+    Raises: ValueError: si le problème est inconnu.
+    """
+    kind, _, semantic = problem.partition('-')
+    if semantic not in SEMANTICS:
+        raise ValueError(f"Problème inconnu: {problem}")
+    if semantic == 'CO':    # Les extensions complètes, bien plus nombreuses, ne sont jamais énumérées.
+        semantic = 'PR' if kind == 'DC' else 'GR'
+    return semantic
+
+
+def solve_cached(problem: str, cache: ExtensionCache, query) -> bool:
+    """
+    Résout une requête à partir des extensions conservées dans le cache.
+    Args:
+        - problem: type de problème.
+        - cache: cache des extensions de l'AS.
+        - query: ensemble S (pour les VE) ou argument a (pour DC / DS).
+    Returns:
+        - True si la requête est satisfaite.
+        - False sinon.
+    Raises: ValueError: si le problème est inconnu.
+    """
+    kind, semantic = problem.partition('-')[0], cached_semantic(problem)
+    match kind:
+        case 'VE':
+            return cache.contains(semantic, query)
+        case 'DC':
+            return cache.is_credulous(semantic, query)
+        case 'DS':
+            return cache.is_skeptical(semantic, query)
+        case _:
             raise ValueError(f"Problème inconnu: {problem}")
 
 
+def verify_many(problem: str, systeme_argumentation: AS, candidates: list[set[str]]) -> list[bool]:
+    """
+    Résout d'un coup une requête VE sur une liste d'ensembles candidats (voir src/bulk.py).
+    Absence de conflit, défense et stabilité sont vérifiées pour tous les candidats en une passe ;
+    en préféré, seuls les candidats admissibles et non stables passent ensuite le test de maximalité.
+    Args:
+        - problem: 'VE-PR' ou 'VE-ST'.
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - candidates: liste d'ensembles d'arguments.
+    Returns: Liste des réponses (True si le candidat est une extension), dans l'ordre des candidats.
+    Raises: ValueError: si le problème n'est pas une vérification.
+    """
+    if problem not in ('VE-PR', 'VE-ST'):
+        raise ValueError(f"Problème inconnu pour une vérification groupée: {problem}")
+    from src import bulk    # Importé seulement si besoin (NumPy, s'il est installé, est long à charger).
+    with stats.phase("query"):
+        _, admissible, stable = bulk.check(systeme_argumentation, candidates)
+        if problem == 'VE-ST':
+            return stable
+        res = []
+        for S, adm, st in zip(candidates, admissible, stable):  # Une extension stable est préférée.
+            res.append(st or adm and next(semantics.iter_preferred_extensions(systeme_argumentation, S), None) == S)
+        return res
+
+
 # --- Extensions préférées (PR) ---
 
 def ve_pr(systeme_argumentation: AS, S: set[str]) -> bool:
@@ -56,7 +177,10 @@ def ve_pr(systeme_argumentation: AS, S: set[str]) -> bool:
         - True si S est une extension préférée.
         - False sinon.
     """
-    return S in semantics.preferred_extensions(systeme_argumentation) # Teste si S est dans l'ensemble des extensions préférées du système.
+    if not S.issubset(systeme_argumentation.A) or not semantics.is_admissible(systeme_argumentation, S):
+        return False        # S doit au moins être admissible.
+    first = next(semantics.iter_preferred_extensions(systeme_argumentation, S), None) # Première extension préférée contenant S.
+    return first == S       # S est maximal si la première extension préférée qui le contient est S lui-même.
 
 def dc_pr(systeme_argumentation: AS, a: str) -> bool:
     """
@@ -68,7 +192,11 @@ def dc_pr(systeme_argumentation: AS, a: str) -> bool:
         - True si a est crédullement accepté.
         - False sinon.
     """
-    return any(a in S for S in semantics.preferred_extensions(systeme_argumentation)) # Teste si l'argument 'a' est au moins dans une des extentions préférées.
+    if a not in systeme_argumentation.A:    # Un argument inconnu n'est dans aucune extension.
+        return False
+    if a in semantics.grounded_extension(systeme_argumentation):   # Il existe toujours une extension préférée et elle contient 'a'.
+        return True
+    return next(semantics.iter_preferred_extensions(systeme_argumentation, {a}), None) is not None # On s'arrête au premier témoin contenant 'a'.
 
 def ds_pr(systeme_argumentation: AS, a: str) -> bool:
     """
@@ -80,8 +208,9 @@ def ds_pr(systeme_argumentation: AS, a: str) -> bool:
         - True si a est sceptiquement accepté.
         - False sinon.
     """
-    exts = semantics.preferred_extensions(systeme_argumentation) # Toutes les extensions préférées du système.
-    return (not exts) or all(a in S for S in exts) # Teste s'il n'y a pas d'extensions préférées ou si 'a' appartient a toutes les extentions préférées.
+    if a in semantics.grounded_extension(systeme_argumentation):   # 'a' est dans toutes les extensions préférées.
+        return True
+    return all(a in S for S in semantics.iter_preferred_extensions(systeme_argumentation)) # On s'arrête au premier contre-exemple ne contenant pas 'a'.
 
 
 # --- Extensions stables (ST) ---
@@ -96,7 +225,7 @@ def ve_st(systeme_argumentation: AS, S: set[str]) -> bool:
         - True si S est une extension stable.
         - False sinon.
     """
-    return S in semantics.stable_extensions(systeme_argumentation) #Teste si 'S' est dans l'ensemble des extensions stables.
+    return S.issubset(systeme_argumentation.A) and semantics.is_stable(systeme_argumentation, S) # Un seul test de stabilité suffit.
 
 def dc_st(systeme_argumentation: AS, a: str) -> bool:
     """
@@ -108,7 +237,9 @@ def dc_st(systeme_argumentation: AS, a: str) -> bool:
         - True si a est crédullement accepté.
         - False sinon.
     """
-    return any(a in S for S in semantics.stable_extensions(systeme_argumentation)) # On teste si 'a' appartient à au moins une des extension stable.
+    if a not in systeme_argumentation.A:    # Un argument inconnu n'est dans aucune extension.
+        return False
+    return next(semantics.iter_stable_extensions(systeme_argumentation, {a}), None) is not None # On s'arrête au premier témoin contenant 'a'.
 
 def ds_st(systeme_argumentation: AS, a: str) -> bool:
     """
@@ -120,5 +251,124 @@ def ds_st(systeme_argumentation: AS, a: str) -> bool:
         - True si a est sceptiquement accepté.
         - False sinon.
     """
-    exts = semantics.stable_extensions(systeme_argumentation) # Toutes les extensions stables du système.
-    return (not exts) or all(a in S for S in exts) # Teste s'il n'y a pas d'extensions stable ou si 'a' appartient a toutes les extentions stables.
+    if a not in systeme_argumentation.A:    # 'a' n'est dans aucune extension : il faut qu'il n'y en ait aucune.
+        return next(semantics.iter_stable_extensions(systeme_argumentation), None) is None
+    if a in semantics.grounded_extension(systeme_argumentation):   # 'a' est dans toutes les extensions stables.
+        return True
+    return next(semantics.iter_stable_extensions(systeme_argumentation, excluding={a}), None) is None # On cherche un contre-exemple ne contenant pas 'a'.
+
+
+# --- Extension fondée (GR) ---
+
+def ve_gr(systeme_argumentation: AS, S: set[str]) -> bool:
+    """
+    Vérifie que 'S' est l'extension fondée (calculée en temps linéaire).
+    """
+    return S == semantics.grounded_extension(systeme_argumentation)
+
+def dc_gr(systeme_argumentation: AS, a: str) -> bool:
+    """
+    Vérifie que 'a' appartient à l'extension fondée (et donc à toutes les extensions complètes).
+    """
+    return a in semantics.grounded_extension(systeme_argumentation)
+
+
+# --- Extensions complètes (CO) ---
+
+def ve_co(systeme_argumentation: AS, S: set[str]) -> bool:
+    """
+    Vérifie que 'S' est une extension complète (un seul calcul de F(S)).
+    """
+    return S.issubset(systeme_argumentation.A) and semantics.is_complete(systeme_argumentation, S)
+
+
+# --- Extensions semi-stables (SST) ---
+
+def ve_sst(systeme_argumentation: AS, S: set[str]) -> bool:
+    """
+    Vérifie que 'S' est une extension semi-stable.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - S: ensemble d'arguments.
+    Returns:
+        - True si S est une extension préférée dont S ∪ S+ n'est strictement inclus dans celui d'aucune autre.
+        - False sinon.
+    """
+    af = systeme_argumentation
+    if not S.issubset(af.A):
+        return False
+    if semantics.is_stable(af, S):      # S ∪ S+ = A.
+        return True
+    if not ve_pr(af, S) or next(semantics.iter_stable_extensions(af), None) is not None:  # S préférée, et aucune stable.
+        return False
+    from src import bitset
+    bs = bitset.encode(af)
+    m = bs.to_mask(S)
+    r = m | bs.attacked_by(m)
+    for P in semantics.iter_preferred_extensions(af):   # On s'arrête à la première préférée qui couvre plus que S.
+        p = bs.to_mask(P)
+        r2 = p | bs.attacked_by(p)
+        if r != r2 and r & ~r2 == 0:
+            return False
+    return True
+
+def dc_sst(systeme_argumentation: AS, a: str) -> bool:
+    """
+    Vérifie que 'a' appartient à au moins une extension semi-stable.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - a: argument à tester.
+    Returns:
+        - True si a est crédullement accepté.
+        - False sinon.
+    """
+    af = systeme_argumentation
+    if a in semantics.grounded_extension(af):
+        return True
+    if not dc_pr(af, a):            # Aucune préférée ne contient 'a' (réglé aussi si 'a' est inconnu).
+        return False
+    if next(semantics.iter_stable_extensions(af), None) is not None:   # Les semi-stables sont les stables.
+        return dc_st(af, a)
+    return semantics.semi_stable_extensions(af, semantics.preferred_extensions(af)).is_credulous(a)    # Union des semi-stables.
+
+def ds_sst(systeme_argumentation: AS, a: str) -> bool:
+    """
+    Vérifie que 'a' appartient à toutes les extensions semi-stables.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - a: argument à tester.
+    Returns:
+        - True si a est sceptiquement accepté.
+        - False sinon.
+    """
+    af = systeme_argumentation
+    if a not in af.A:               # Il existe toujours une extension semi-stable.
+        return False
+    if ds_pr(af, a):                # 'a' est dans toutes les préférées (réglé aussi si 'a' est fondé).
+        return True
+    if next(semantics.iter_stable_extensions(af), None) is not None:   # Les semi-stables sont les stables.
+        return ds_st(af, a)
+    return semantics.semi_stable_extensions(af, semantics.preferred_extensions(af)).is_skeptical(a)    # Intersection des semi-stables.
+
+
+# --- Extension idéale (ID) ---
+
+def ve_id(systeme_argumentation: AS, S: set[str]) -> bool:
+    """
+    Vérifie que 'S' est l'extension idéale.
+    """
+    af = systeme_argumentation
+    if not S.issubset(af.A) or not semantics.is_complete(af, S):     # L'extension idéale est complète.
+        return False
+    return S == semantics.ideal_extension(af)
+
+def dc_id(systeme_argumentation: AS, a: str) -> bool:
+    """
+    Vérifie que 'a' appartient à l'extension idéale.
+    """
+    af = systeme_argumentation
+    if a in semantics.grounded_extension(af):     # L'extension fondée est incluse dans l'idéale.
+        return True
+    if not ds_pr(af, a):            # L'idéale est incluse dans toutes les préférées.
+        return False
+    return a in semantics.ideal_extension(af)
@@ -0,0 +1,194 @@
+"""
+src/sat.py
+
+Moteur SAT : les sémantiques sont encodées en CNF et résolues par src/cdcl.py (ou pycosat s'il est installé).
+La variable i + 1 est vraie si et seulement si l'argument d'identifiant i est dans l'ensemble cherché.
+    - sans conflit : pour chaque attaque x -> y, (¬x ∨ ¬y).
+    - admissible : sans conflit et, pour chaque attaque z -> y, (¬y ∨ x1 ∨ ... ∨ xk) où x1..xk attaquent z.
+    - stable : sans conflit et, pour chaque argument y, (y ∨ x1 ∨ ... ∨ xk) où x1..xk attaquent y.
+Requêtes :
+    - VE-ST / DC-ST / DS-ST : un seul appel au solveur (sous hypothèses).
+    - DC-PR : un seul appel (un argument est dans une extension préférée s'il est dans un ensemble admissible).
+    - VE-PR : S admissible et aucun ensemble admissible ne contient strictement S (un appel).
+    - DS-PR et énumération des préférées : maximisation itérative. Un ensemble admissible candidat est agrandi
+      (« contient strictement le candidat ») jusqu'à ne plus pouvoir l'être : c'est une extension préférée,
+      puis une clause de blocage (« n'est pas inclus dans cette extension ») écarte ses sous-ensembles des candidats suivants.
+Les autres sémantiques (GR, CO, SST, ID) ne sont pas encodées : leurs requêtes sont résolues par src/queries.py.
+Ce moteur ne dépend pas du solveur à étiquetages : il sert aussi à vérifier ses résultats (--backend sat).
+"""
+import time
+from itertools import islice
+from src.systeme_argumentation import AS
+from src.cdcl import make_solver
+from src.store import ExtensionStore
+
+class Encoding:
+    __slots__ = ("systeme_argumentation", "solver", "ids", "deadline")
+
+    def __init__(self, systeme_argumentation: AS, semantic: str, deadline: float = None):
+        """
+        Encode les ensembles admissibles ('PR') ou les extensions stables ('ST') d'un AS.
+        Args:
+            - systeme_argumentation: système d'argumentation <A, R>.
+            - semantic: 'PR' ou 'ST'.
+            - deadline: échéance des recherches en secondes de time.monotonic() (aucune par défaut).
+        Returns: None
+        Raises: ValueError: si la sémantique est inconnue.
+        """
+        if semantic not in ('PR', 'ST'):
+            raise ValueError(f"Sémantique inconnue: {semantic}")
+        af = systeme_argumentation
+        self.systeme_argumentation = af
+        self.solver = solver = make_solver()
+        self.ids = list(af.ids())
+        self.deadline = deadline
+        for _ in af.names:
+            solver.new_var()
+        succ, pred = af.succ, af.pred
+        for x in self.ids:
+            for y in succ[x]:       # Sans conflit.
+                solver.add_clause([-(x + 1), -(y + 1)])
+        for y in self.ids:
+            if semantic == 'ST':    # y est dans l'extension ou attaqué par elle.
+                solver.add_clause([y + 1] + [x + 1 for x in pred[y]])
+            else:                   # Chaque attaquant z de y est contre-attaqué.
+                for z in pred[y]:
+                    solver.add_clause([-(y + 1)] + [x + 1 for x in pred[z]])
+
+    def literals(self, S: set[str], sign: int = 1) -> list[int]:
+        """
+        Donne les littéraux des arguments de S (positifs, ou négatifs avec sign = -1).
+        Raises: ValueError: si S contient un argument inconnu.
+        """
+        return [sign * (i + 1) for i in self.systeme_argumentation.ids_of(S)]
+
+    def find(self, assumptions=()) -> set[int]:
+        """
+        Cherche un ensemble de l'encodage respectant les hypothèses.
+        Returns: Les identifiants de ses arguments, ou None s'il n'y en a pas.
+        Raises: TimeoutError: si l'échéance est dépassée.
+        """
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise TimeoutError("Error: délai de recherche dépassé.")
+        model = self.solver.solve(assumptions, self.deadline)
+        if model is None:
+            return None
+        return {i for i in self.ids if model[i + 1]}
+
+    def maximize(self, S: set[int]) -> set[int]:
+        """
+        Agrandit un ensemble admissible jusqu'à une extension préférée qui le contient.
+        Chaque étape cherche un ensemble admissible contenant strictement le précédent ; la clause
+        « au moins un nouvel argument » est activée par une variable de sélection, désactivée ensuite.
+        Returns: Les identifiants de l'extension préférée.
+        """
+        solver = self.solver
+        while True:
+            others = [i + 1 for i in self.ids if i not in S]
+            if not others:
+                return S
+            for lit in others:      # Les arguments hors de S sont d'abord essayés IN : l'ensemble grandit plus vite.
+                solver.set_phase(lit)
+            selector = solver.new_var()
+            solver.add_clause([-selector] + others)
+            bigger = self.find([selector] + [i + 1 for i in S])
+            solver.add_clause([-selector])      # La clause temporaire ne sert plus.
+            if bigger is None:
+                return S
+            S = bigger
+
+    def block(self, P: set[int]):
+        """
+        Interdit les ensembles inclus dans P pour les recherches suivantes.
+        """
+        self.solver.add_clause([i + 1 for i in self.ids if i not in P])
+
+
+# --- Extensions ---
+
+def iter_extensions(systeme_argumentation: AS, semantic: str, limit: int = None, timeout: float = None):
+    """
+    Génère une par une les extensions préférées ou stables.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - semantic: 'PR' ou 'ST'.
+        - limit: nombre maximal d'extensions produites (toutes par défaut).
+        - timeout: délai maximal de la recherche en secondes (aucun par défaut).
+    Returns: Générateur des extensions (ensembles de noms).
+    Raises: TimeoutError: si le délai est dépassé.
+    """
+    if limit is not None:
+        yield from islice(iter_extensions(systeme_argumentation, semantic, timeout=timeout), limit)
+        return
+    enc = Encoding(systeme_argumentation, semantic, None if timeout is None else time.monotonic() + timeout)
+    names = systeme_argumentation.names
+    while True:
+        S = enc.find()
+        if S is None:
+            return
+        if semantic == 'PR':
+            S = enc.maximize(S)
+        yield {names[i] for i in S}
+        enc.block(S)    # Stables : deux extensions stables ne sont jamais incluses l'une dans l'autre.
+
+def extensions(systeme_argumentation: AS, semantic: str) -> ExtensionStore:
+    """
+    Donne les extensions préférées ou stables (collection compacte, voir src/store.py).
+    """
+    res = ExtensionStore(systeme_argumentation)
+    for S in iter_extensions(systeme_argumentation, semantic):
+        res.add(S)
+    return res
+
+
+# --- Requêtes ---
+
+def solve_query(problem: str, systeme_argumentation: AS, query) -> bool:
+    """
+    Résout une requête VE / DC / DS avec le moteur SAT.
+    Args:
+        - problem: type de problème.
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - query: ensemble S (pour les VE) ou argument a (pour DC / DS).
+    Returns:
+        - True si la requête est satisfaite.
+        - False sinon.
+    Raises: ValueError: si le problème est inconnu.
+    """
+    af = systeme_argumentation
+    kind, _, semantic = problem.partition('-')
+    if kind not in ('VE', 'DC', 'DS'):
+        raise ValueError(f"Problème inconnu: {problem}")
+    if semantic not in ('PR', 'ST'):    # Sémantique non encodée.
+        from src import queries
+        return queries.solve_query(problem, af, query)
+    if kind == 'VE':
+        if not query.issubset(af.A):
+            return False
+        enc = Encoding(af, semantic)
+        inside = enc.literals(query)
+        if semantic == 'ST':        # Un appel : l'ensemble fixé argument par argument est-il stable ?
+            return enc.find(inside + enc.literals(af.A - query, -1)) is not None
+        if enc.find(inside + enc.literals(af.A - query, -1)) is None:     # S doit être admissible.
+            return False
+        others = enc.literals(af.A - query)
+        if not others:
+            return True
+        enc.solver.add_clause(others)   # Un ensemble admissible contenant strictement S ?
+        return enc.find(inside) is None
+    if query not in af.A:           # Un argument inconnu n'est dans aucune extension (il existe toujours une préférée).
+        return kind == 'DS' and semantic == 'ST' and next(iter_extensions(af, 'ST'), None) is None
+    enc = Encoding(af, semantic)
+    a = af.index[query] + 1
+    if kind == 'DC':                # Un témoin contenant 'a'.
+        return enc.find([a]) is not None
+    if semantic == 'ST':            # Un contre-exemple ne contenant pas 'a'.
+        return enc.find([-a]) is None
+    while True:                     # DS-PR : recherche d'une extension préférée sans 'a'.
+        S = enc.find([-a])
+        if S is None:
+            return True
+        P = enc.maximize(S)
+        if a - 1 not in P:
+            return False
+        enc.block(P)                # P contient 'a' : ses sous-ensembles ne sont plus candidats.
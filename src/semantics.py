@@ -7,13 +7,40 @@ Fonctions de base :
     - défense
     - admissibilité
     - stabilité
+    - complétude
 Recherche des extensions :
+    - fondée
     - admissibles
+    - complètes
     - préférées
     - stables
+    - semi-stables
+    - idéale
+Générateurs d'extensions (arrêt possible dès que la réponse est connue) :
+    - préférées contenant un ensemble donné
+    - stables contenant / excluant des ensembles donnés
+Enumération paresseuse (problèmes EE / SE) :
+    - extensions produites une à une, avec un nombre maximal et un délai
+    - comptage sans construire les extensions
+Les tests de base utilisent directement les listes d'adjacence de l'AS,
+les extensions admissibles sont énumérées par le moteur à masques de bits (src/bitset.py),
+les extensions préférées et stables sont cherchées par le solveur à étiquetages (src/labelling.py),
+après le prétraitement extension fondée + composantes fortement connexes (src/decomposition.py),
+les sémantiques fondée, complète et idéale reposent sur la fonction caractéristique (src/fixpoint.py),
+les fonctions ci-dessous gardent l'interface à base d'ensembles de noms.
+Les collections d'extensions sont des matrices de bits compactes (src/store.py) qui se parcourent comme des ensembles de noms.
+Ces modules ne sont importés que par les fonctions qui s'en servent : les tests de base (une requête VE-ST par exemple)
+ne chargent ni la recherche, ni la décomposition, ni les collections.
 """
+from __future__ import annotations     # Annotations non évaluées : ExtensionStore n'est pas importé au chargement.
+import time
 from src.systeme_argumentation import AS
-from itertools import combinations
+from src import stats
+from itertools import islice
+
+TYPE_CHECKING = False   # Lu comme vrai par les vérificateurs de types (voir src/main.py).
+if TYPE_CHECKING:
+    from src.store import ExtensionStore
 
 # ******** Fonctions de base: ********
 
@@ -28,15 +55,10 @@ def is_conflict_free(systeme_argumentation: AS, S: set[str]) -> bool:
         - False sinon.
     Raises: ValueError: si S contient un argument inconnu.
     """
-    if not S.issubset(systeme_argumentation.A): # Vérification que l'ensemble S est un sous ensemble de l'ensemble des arguments de l'AS.
-        raise ValueError("S contient un argument inconnu.")
-    
-    for arg in S:   # On boucle sur tout les arguments de l'ensemble S.
-        attacks = systeme_argumentation.attacks(arg)    # Ensemble des arguments attaqué par l'argument sur lequel on boucle.
-        for att in attacks:     # On itére sur les arguments attaqués.
-            if att in S:        # On teste leur présence dans l'ensemble S.
-                return False        # Si un argument de S est attaqué par un autre argument de S on retourne False.
-    return True     # Si aucuns des arguments de S ne s'attaque.
+    ids = systeme_argumentation.ids_of(S)       # Vérifie au passage que S est un sous ensemble des arguments de l'AS.
+    stats.count("conflict_free_checks")
+    succ = systeme_argumentation.succ
+    return not any(j in ids for i in ids for j in succ[i])  # Aucun argument de S n'est attaqué par S.
 
 def defends(systeme_argumentation: AS, S: set[str], a: str) -> bool:
     """
@@ -50,20 +72,10 @@ def defends(systeme_argumentation: AS, S: set[str], a: str) -> bool:
         - False sinon.
     Raises: ValueError: si S ou a contient un argument inconnu.
     """
-    if not S.issubset(systeme_argumentation.A):     # Vérification que l'ensemble S est un sous ensemble de l'ensemble des arguments de l'AS.
-        raise ValueError("S contient un argument inconnu.")
-    if a not in systeme_argumentation.A:            # Vérification que l'argument a est présent dans l'ensemble des arguments de l'AS.
-        raise ValueError(f"L'argument {a} n'est pas dans les arguments.")
-    
-    for x in systeme_argumentation.attackers_of(a): # On boucle sur les attaquant de l'argument a. x représente donc un attaquant de a.
-        find = False
-        for y in S: # On boucle sur les arguments de l'ensemble S.
-            if x in systeme_argumentation.attacks(y): # Si y attaque x.
-                find = True # On indique que un élément de Y défend bien a. (a <-- x <-- y)
-                break
-        if not find:
-            return False
-    return True
+    plus = attacked_by(systeme_argumentation, systeme_argumentation.ids_of(S))   # Vérifie au passage que S est un sous ensemble des arguments de l'AS.
+    i = systeme_argumentation.id_of(a)      # Vérifie au passage que a est présent dans les arguments de l'AS.
+    stats.count("defence_checks")
+    return all(x in plus for x in systeme_argumentation.pred[i])    # Les attaquants de a sont tous attaqués par S.
 
 def is_admissible(systeme_argumentation: AS, S: set[str]) -> bool:
     """
@@ -75,12 +87,12 @@ def is_admissible(systeme_argumentation: AS, S: set[str]) -> bool:
         - True si S est sans conflit et défend tous ses éléments.
         - False sinon.
     """
-    if not is_conflict_free(systeme_argumentation, S):      # Vérification que l'ensemble S est sans conflit.
-        return False        # S'il n'est pas sans conflit on retourne False.
-    for a in S:             # On itére sur tous les arguments de a.
-        if not defends(systeme_argumentation, S, a): # Si a n'est pas défendu par l'ensemble S. 
-            return False
-    return True
+    ids = systeme_argumentation.ids_of(S)
+    stats.count("conflict_free_checks")
+    stats.count("defence_checks")
+    plus = attacked_by(systeme_argumentation, ids)      # Arguments attaqués par S.
+    pred = systeme_argumentation.pred
+    return plus.isdisjoint(ids) and all(x in plus for i in ids for x in pred[i])
 
 def is_stable(systeme_argumentation: AS, S: set[str]) -> bool:
     """
@@ -92,32 +104,53 @@ def is_stable(systeme_argumentation: AS, S: set[str]) -> bool:
         - True si S est sans conflit et attaque tous les arguments hors de S.
         - False sinon.
     """
-    if not is_conflict_free(systeme_argumentation, S):      # Vérification que l'ensemble S est sans conflit.
-        return False
-    outside = systeme_argumentation.A - S       # On cherche tous les arguments non compris dans l'ensemble S.
-    attacked_by_S = set()       # Initialisation de l'ensemble des arguments qui sont attaqués par un argument de l'ensemble S.
-    for b in S:                 # b est un argument de S.
-        attacked_by_S |= systeme_argumentation.attacks(b)   # Union de attacked_by_S et des arguments attaqué par b.
-    return outside.issubset(attacked_by_S)      # On teste si outside est un sous ensemble de l'ensembles des attacked_by_S.
+    ids = systeme_argumentation.ids_of(S)
+    stats.count("conflict_free_checks")
+    plus = attacked_by(systeme_argumentation, ids)      # Arguments attaqués par S.
+    return plus.isdisjoint(ids) and len(plus) + len(ids) == len(systeme_argumentation.A)    # S et les arguments qu'il attaque couvrent A.
 
-def all_subsets(A: set[str]) -> list[set[str]]:
+def is_complete(systeme_argumentation: AS, S: set[str]) -> bool:
     """
-    Génère tous les sous-ensembles d'un ensemble d'arguments.
+    Vérifie si un ensemble est une extension complète.
     Args:
-        - A: ensemble d'arguments.
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - S: ensemble d'arguments.
     Returns:
-        - Liste de tous les sous-ensembles de A.
+        - True si S est sans conflit et contient exactement les arguments qu'il défend (S = F(S)).
+        - False sinon.
+    Raises: ValueError: si S contient un argument inconnu.
     """
-    res = []                # Initialisation de la liste des sous ensembles.
-    elements = list(A)      # Transformation de l'ensemble A en liste.
-    for k in range(len(elements)+1):
-        for combo in combinations(elements, k): # Itération sur les combinaisons compossible de l'ensemble A de taille k.
-            S = set(combo)      # Transformation de la combinaison en ensemble.
-            res.append(S)       # Ajout de la combinaison à la liste des sous ensemble.
-    return res
+    from src import bitset, fixpoint
+    bs = bitset.encode(systeme_argumentation)
+    return fixpoint.is_complete(bs, bs.to_mask(S))
+
+def attacked_by(systeme_argumentation: AS, ids: set[int]) -> set[int]:
+    """
+    Donne les identifiants des arguments attaqués par au moins un des arguments ids.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - ids: identifiants d'arguments.
+    Returns:
+        - Ensemble des identifiants attaqués.
+    """
+    succ = systeme_argumentation.succ
+    return {j for i in ids for j in succ[i]}
 
 # ******** Recherche des extensions: ********
 
+def grounded_extension(systeme_argumentation: AS) -> set[str]:
+    """
+    Donne l'extension fondée (calculée en temps linéaire).
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+    Returns:
+        - Ensemble des arguments de l'extension fondée, contenu dans toute extension préférée ou stable.
+    """
+    from src import fixpoint
+    label = fixpoint.grounded_labelling(systeme_argumentation)
+    names = systeme_argumentation.names
+    return {names[i] for i in systeme_argumentation.ids() if label[i] == fixpoint.IN}
+
 def admissible_extensions(systeme_argumentation: AS) -> list[set[str]]:
     """
     Donne toutes les extensions admissibles.
@@ -126,45 +159,206 @@ def admissible_extensions(systeme_argumentation: AS) -> list[set[str]]:
     Returns:
         - Liste des ensembles admissibles.
     """
-    res = []                # Initialisation de la liste des extensions admissibles.
-    sous_ensembles = all_subsets(systeme_argumentation.A) # Liste des sous ensembles de l'AS.
-    for se in sous_ensembles:                           # On boucle sur chaque sous ensembles.
-        if is_admissible(systeme_argumentation, se):    # On teste si le sous ensemble est admissible.
-            res.append(se)                              # Si tel est le cas on le rajoute à la liste des extensions admissibles.
-    return res
+    from src import bitset
+    bs = bitset.encode(systeme_argumentation)
+    return [bs.to_set(m) for m in bitset.iter_admissible(bs)]  # Seuls les ensembles sans conflit sont examinés.
 
-def preferred_extensions(systeme_argumentation: AS) -> list[set[str]]:
+def complete_extensions(systeme_argumentation: AS) -> ExtensionStore:
+    """
+    Donne les extensions complètes.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+    Returns:
+        - Collection compacte (src/store.py) des ensembles sans conflit S tels que S = F(S).
+    """
+    from src.store import ExtensionStore
+    return ExtensionStore(systeme_argumentation, _iter_complete_ids(systeme_argumentation))
+
+def preferred_extensions(systeme_argumentation: AS) -> ExtensionStore:
     """
     Donne les extensions préférées.
     Args:
         - systeme_argumentation: système d'argumentation <A, R>.
     Returns:
-        - Liste des extensions admissibles maximales par inclusion.
+        - Collection compacte (src/store.py) des extensions admissibles maximales par inclusion.
     """
-    res = []                # Initialisation de la liste des extensions préférées.
-    admissibles = admissible_extensions(systeme_argumentation) # Liste des extentions admissibles de l'AS.
-    for i in range(len(admissibles)): # Parcourt chaque extension admissible.
-        S = admissibles[i]  # S = extension admissible courante sur laquelle on itère.
-        pref = True                 # On pose S est préferré.
-        for admi in admissibles:    # On boucle sur les admissibles.
-            if S < admi:            # Si S est inclu dans l'admissible sur lequel on itére on sort de la boucle.
-                pref = False
-                break
-        if pref:    # Si pref est encore a True (cest a dire qu'on a pas trouvé d'expression plus inclue S)
-            res.append(S)
-    return res
+    from src import decomposition
+    from src.store import ExtensionStore
+    return ExtensionStore(systeme_argumentation, decomposition.iter_extensions(systeme_argumentation, True))   # Seuls les ensembles maximaux sont produits.
 
-def stable_extensions(systeme_argumentation: AS) -> list[set[str]]:
+def stable_extensions(systeme_argumentation: AS) -> ExtensionStore:
     """
     Donne les extensions stables.
     Args:
         - systeme_argumentation: système d'argumentation <A, R>.
     Returns:
-        - Liste des extensions stables.
+        - Collection compacte (src/store.py) des extensions stables.
+    """
+    from src import decomposition
+    from src.store import ExtensionStore
+    return ExtensionStore(systeme_argumentation, decomposition.iter_extensions(systeme_argumentation, False))
+
+def semi_stable_extensions(systeme_argumentation: AS, preferred: ExtensionStore = None) -> ExtensionStore:
+    """
+    Donne les extensions semi-stables : les extensions complètes dont S ∪ S+ (arguments de S ou attaqués par S)
+    est maximal par inclusion. Ce sont des extensions préférées, et les stables s'il en existe.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - preferred: extensions préférées déjà calculées (optionnel).
+    Returns:
+        - Collection compacte (src/store.py) des extensions semi-stables.
     """
-    res = []                # Initialisation de la liste des extensions stables.
-    sous_ensembles = all_subsets(systeme_argumentation.A) # Liste des sous ensembles de l'AS.
-    for se in sous_ensembles:                           # On boucle sur chaque sous ensembles.
-        if is_stable(systeme_argumentation, se):        # On teste si le sous ensemble est stable.
-            res.append(se)                              # Si tel est le cas on le rajoute à la liste des extensions admissibles.
+    from src import bitset
+    from src.store import ExtensionStore
+    if preferred is None:
+        stables = stable_extensions(systeme_argumentation)
+        if stables:         # S ∪ S+ = A est maximal : les semi-stables sont les stables.
+            return stables
+        preferred = preferred_extensions(systeme_argumentation)
+    bs = bitset.encode(systeme_argumentation)
+    ranges = [m | bs.attacked_by(m) for m in preferred.masks()]
+    res = ExtensionStore(systeme_argumentation)
+    for m, r in zip(preferred.masks(), ranges):
+        if not any(r != r2 and r & ~r2 == 0 for r2 in ranges):
+            res.add_mask(m)
     return res
+
+def ideal_extension(systeme_argumentation: AS, preferred: ExtensionStore = None) -> set[str]:
+    """
+    Donne l'extension idéale : le plus grand ensemble admissible inclus dans toutes les extensions préférées.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - preferred: extensions préférées déjà calculées (optionnel, leur intersection est alors déjà connue).
+    Returns:
+        - Ensemble des arguments de l'extension idéale (elle contient l'extension fondée).
+    """
+    from src import bitset, decomposition, fixpoint
+    bs = bitset.encode(systeme_argumentation)
+    if preferred is not None:
+        common = preferred.intersection
+    else:
+        grounded = bs.to_mask(grounded_extension(systeme_argumentation))
+        common = bs.full
+        for ids in decomposition.iter_extensions(systeme_argumentation, True):
+            m = 0
+            for i in ids:
+                m |= 1 << i
+            common &= m
+            if common == grounded:      # L'extension fondée est admissible et incluse dans l'idéale.
+                break
+    return bs.to_set(fixpoint.largest_admissible(bs, common))
+
+# ******** Générateurs d'extensions: ********
+
+def iter_preferred_extensions(systeme_argumentation: AS, S: set[str] = None):
+    """
+    Génère une par une les extensions préférées contenant S.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - S: ensemble d'arguments imposés dans l'extension (aucun par défaut).
+    Returns:
+        - Générateur des extensions préférées qui contiennent S (rien si S n'est contenu dans aucune).
+    Raises: ValueError: si S contient un argument inconnu.
+    """
+    from src import decomposition
+    if S and not is_conflict_free(systeme_argumentation, S):   # Un ensemble en conflit n'est contenu dans aucune extension.
+        return
+    names = systeme_argumentation.names
+    for ids in decomposition.iter_extensions(systeme_argumentation, True, required=systeme_argumentation.ids_of(S or ())):
+        yield {names[i] for i in ids}
+
+def iter_stable_extensions(systeme_argumentation: AS, S: set[str] = None, excluding: set[str] = None):
+    """
+    Génère une par une les extensions stables contenant S et ne contenant aucun argument de excluding.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - S: ensemble d'arguments imposés dans l'extension (aucun par défaut).
+        - excluding: ensemble d'arguments interdits dans l'extension (aucun par défaut).
+    Returns:
+        - Générateur des extensions stables respectant les contraintes.
+    Raises: ValueError: si S ou excluding contient un argument inconnu.
+    """
+    from src import decomposition
+    required = systeme_argumentation.ids_of(S or ())
+    excluded = systeme_argumentation.ids_of(excluding or ())
+    if S and not is_conflict_free(systeme_argumentation, S) or not required.isdisjoint(excluded):  # Contraintes impossibles à satisfaire.
+        return
+    names = systeme_argumentation.names
+    for ids in decomposition.iter_extensions(systeme_argumentation, False, required=required, excluded=excluded):
+        yield {names[i] for i in ids}
+
+def iter_complete_extensions(systeme_argumentation: AS):
+    """
+    Génère une par une les extensions complètes.
+    Une extension complète contient l'extension fondée et aucun argument qu'elle attaque : seuls les arguments
+    non décidés sont cherchés, et une extension complète est l'extension fondée plus une extension complète
+    de la restriction de l'AS à ces arguments (leurs attaquants OUT sont déjà contre-attaqués).
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+    Returns:
+        - Générateur des extensions complètes (la première est l'extension fondée).
+    """
+    names = systeme_argumentation.names
+    for ids in _iter_complete_ids(systeme_argumentation):
+        yield {names[i] for i in ids}
+
+def _iter_complete_ids(systeme_argumentation: AS):
+    """
+    Générateur des extensions complètes (listes d'identifiants).
+    """
+    from src import bitset, fixpoint
+    label = fixpoint.grounded_labelling(systeme_argumentation)
+    g_in = [i for i in systeme_argumentation.ids() if label[i] == fixpoint.IN]
+    rest = [i for i in systeme_argumentation.ids() if label[i] == fixpoint.UNDEC]
+    bs = bitset.Bitset.restricted(systeme_argumentation, rest)
+    for m in fixpoint.iter_complete(bs):
+        yield g_in + [rest[p] for p in bitset.bits(m)]
+
+# ******** Enumération paresseuse: ********
+
+def _iter_ids(systeme_argumentation: AS, semantic: str, limit: int, timeout: float):
+    """
+    Générateur des extensions (listes d'identifiants) avec nombre maximal et délai.
+    Raises: ValueError: si la sémantique est inconnue.
+    """
+    from src import decomposition
+    if semantic not in ('PR', 'ST'):
+        raise ValueError(f"Sémantique inconnue: {semantic}")
+    deadline = None if timeout is None else time.monotonic() + timeout
+    gen = decomposition.iter_extensions(systeme_argumentation, semantic == 'PR', deadline=deadline)
+    return gen if limit is None else islice(gen, limit)
+
+def iter_extensions(systeme_argumentation: AS, semantic: str, limit: int = None, timeout: float = None):
+    """
+    Génère une par une les extensions préférées ou stables, au fur et à mesure de la recherche.
+    La mémoire utilisée dépend de la profondeur de la recherche et non du nombre d'extensions.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - semantic: 'PR' ou 'ST'.
+        - limit: nombre maximal d'extensions produites (toutes par défaut).
+        - timeout: délai maximal de la recherche en secondes (aucun par défaut).
+    Returns:
+        - Générateur des extensions (ensembles de noms).
+    Raises:
+        - ValueError: si la sémantique est inconnue.
+        - TimeoutError: si le délai est dépassé (les extensions déjà produites restent valables).
+    """
+    names = systeme_argumentation.names
+    for ids in _iter_ids(systeme_argumentation, semantic, limit, timeout):
+        yield {names[i] for i in ids}
+
+def count_extensions(systeme_argumentation: AS, semantic: str, limit: int = None, timeout: float = None) -> int:
+    """
+    Compte les extensions préférées ou stables sans les construire.
+    Args:
+        - systeme_argumentation: système d'argumentation <A, R>.
+        - semantic: 'PR' ou 'ST'.
+        - limit: le comptage s'arrête à limit extensions (aucune limite par défaut).
+        - timeout: délai maximal de la recherche en secondes (aucun par défaut).
+    Returns:
+        - Nombre d'extensions (au plus limit).
+    Raises:
+        - ValueError: si la sémantique est inconnue.
+        - TimeoutError: si le délai est dépassé.
+    """
+    return sum(1 for _ in _iter_ids(systeme_argumentation, semantic, limit, timeout))
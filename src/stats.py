@@ -0,0 +1,127 @@
+"""
+src/stats.py
+
+Instrumentation du solveur : compteurs et temps par phase d'une exécution.
+La collecte n'est active que dans un bloc collect() : le reste du temps current vaut None
+et les fonctions instrumentées ne font qu'un test.
+Compteurs :
+    - subsets : ensembles examinés (sous-ensembles énumérés ou noeuds de la recherche par étiquetage).
+    - conflict_free_checks : tests d'absence de conflit.
+    - defence_checks : tests de défense (un argument est-il défendu / ses attaquants sont-ils contre-attaqués).
+    - pruned : branches de la recherche coupées.
+    - extensions : extensions complètes trouvées.
+Phases chronométrées : parse, grounded, scc, search, query (voir phase()).
+Un callback optionnel reçoit chaque événement ('extension', 'phase', 'done') avec les statistiques courantes.
+Les processus de src/parallel.py ne remontent pas leurs compteurs : seul le processus principal est mesuré.
+cProfile et tracemalloc ne sont importés que par profile(), pour ne pas ralentir le démarrage du programme.
+"""
+import os
+import time
+from contextlib import contextmanager, nullcontext
+
+COUNTERS = ("subsets", "conflict_free_checks", "defence_checks", "pruned", "extensions")
+
+current = None      # Statistiques en cours de collecte (None : instrumentation désactivée).
+
+class Stats:
+    __slots__ = COUNTERS + ("phases", "callback")
+
+    def __init__(self, callback=None):
+        """
+        Initialise des compteurs à zéro.
+        Args:
+            - callback: fonction appelée avec (événement, statistiques) à chaque événement (optionnel).
+        Returns: None
+        """
+        for name in COUNTERS:
+            setattr(self, name, 0)
+        self.phases = {}        # Phase -> temps cumulé en secondes.
+        self.callback = callback
+
+    def emit(self, event: str):
+        """
+        Transmet un événement au callback s'il y en a un.
+        """
+        if self.callback is not None:
+            self.callback(event, self)
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Chronomètre un bloc et ajoute sa durée au temps de la phase.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+            self.emit("phase")
+
+    def as_dict(self) -> dict:
+        """
+        Donne les compteurs et les temps par phase.
+        """
+        res = {name: getattr(self, name) for name in COUNTERS}
+        res.update((f"time_{name}", t) for name, t in self.phases.items())
+        return res
+
+    def report(self) -> str:
+        """
+        Donne les statistiques sous forme de lignes "nom: valeur".
+        """
+        return "\n".join(f"{k}: {v:.6f}" if isinstance(v, float) else f"{k}: {v}" for k, v in self.as_dict().items())
+
+def count(name: str, k: int = 1):
+    """
+    Ajoute k au compteur name si la collecte est active.
+    """
+    if current is not None:
+        setattr(current, name, getattr(current, name) + k)
+
+def phase(name: str):
+    """
+    Chronomètre un bloc si la collecte est active (sinon ne fait rien).
+    """
+    return current.phase(name) if current is not None else nullcontext()
+
+@contextmanager
+def collect(callback=None):
+    """
+    Active la collecte des statistiques dans un bloc.
+    Args:
+        - callback: fonction appelée avec (événement, statistiques) à chaque événement (optionnel).
+    Returns: Les statistiques collectées (mises à jour pendant le bloc).
+    """
+    global current
+    previous, current = current, Stats(callback)
+    try:
+        yield current
+    finally:
+        stats, current = current, previous
+        stats.emit("done")
+
+@contextmanager
+def profile(directory: str):
+    """
+    Profile un bloc avec cProfile et tracemalloc, puis écrit deux fichiers dans directory :
+        - profile-<date>-<pid>.prof : profil cProfile (lisible avec pstats).
+        - profile-<date>-<pid>.tracemalloc : instantané mémoire (lisible avec tracemalloc.Snapshot.load).
+    Args:
+        - directory: répertoire des fichiers (créé si besoin).
+    Returns: None
+    """
+    import cProfile
+    import tracemalloc
+    os.makedirs(directory, exist_ok=True)
+    base = os.path.join(directory, f"profile-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}")
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        profiler.dump_stats(base + ".prof")
+        snapshot.dump(base + ".tracemalloc")
@@ -0,0 +1,266 @@
+"""
+src/store.py
+
+Stockage compact des collections d'extensions.
+Une extension est un masque de bits sur les identifiants des arguments (bit i à 1 <=> argument i dans l'extension),
+comme dans src/bitset.py. Deux représentations partagent la même interface :
+    - ExtensionStore : matrice de bits compacte, une ligne de ceil(n / 8) octets par extension dans un seul bytearray
+      (aucun objet Python par extension). Un test d'appartenance est une recherche d'octets (bytearray.find) sur la matrice.
+    - ZDD : diagramme de décision à suppression des zéros. Les extensions qui partagent une même fin
+      (mêmes arguments d'identifiant plus grand) partagent les mêmes noeuds : utile quand les extensions se recouvrent beaucoup.
+Les deux gardent l'union (arguments crédulement acceptés, DC) et l'intersection (arguments sceptiquement acceptés, DS)
+de toutes les extensions sous forme de masques : DC / DS sont un test de bit.
+Parcourir une collection donne des ensembles de noms, construits un par un à la demande.
+compact() choisit la représentation la plus petite.
+"""
+import sys
+from array import array
+from src.systeme_argumentation import AS
+from src.bitset import bits
+
+SHARE_MIN = 256         # Nombre d'extensions à partir duquel compact() essaie le ZDD.
+
+class _Family:
+    __slots__ = ("names", "index", "full", "union", "intersection")
+
+    def __init__(self, names: list[str], index: dict, full: int):
+        """
+        Initialise une collection vide.
+        Args:
+            - names: nom de chaque identifiant.
+            - index: identifiant de chaque nom.
+            - full: masque de tous les arguments de l'AS.
+        Returns: None
+        """
+        self.names = names
+        self.index = index
+        self.full = full
+        self.union = 0              # Masque des arguments d'au moins une extension.
+        self.intersection = full    # Masque des arguments de toutes les extensions (A entier s'il n'y en a pas).
+
+    def mask_of(self, S) -> int:
+        """
+        Transforme un ensemble d'arguments en masque.
+        Returns: Le masque de S, None si S contient un argument inconnu.
+        """
+        m = 0
+        for a in S:
+            i = self.index.get(a)
+            if i is None:
+                return None
+            m |= 1 << i
+        return m
+
+    def __iter__(self):
+        """
+        Génère les extensions (ensembles de noms).
+        """
+        names = self.names
+        for m in self.masks():
+            yield {names[i] for i in bits(m)}
+
+    def __contains__(self, S) -> bool:
+        """
+        Vérifie que S est une des extensions (VE).
+        """
+        m = self.mask_of(S)
+        return m is not None and self.has_mask(m)
+
+    def is_credulous(self, a: str) -> bool:
+        """
+        Vérifie que 'a' appartient à au moins une extension (DC).
+        """
+        i = self.index.get(a)
+        return i is not None and (self.union >> i) & 1 == 1
+
+    def is_skeptical(self, a: str) -> bool:
+        """
+        Vérifie que 'a' appartient à toutes les extensions (DS), vrai s'il n'y a aucune extension.
+        """
+        if not len(self):
+            return True
+        i = self.index.get(a)
+        return i is not None and (self.intersection >> i) & 1 == 1
+
+class ExtensionStore(_Family):
+    __slots__ = ("stride", "rows", "count")
+
+    def __init__(self, systeme_argumentation: AS, exts=()):
+        """
+        Initialise la matrice de bits des extensions d'un AS.
+        Args:
+            - systeme_argumentation: système d'argumentation <A, R>.
+            - exts: extensions à ajouter, listes d'identifiants (optionnel).
+        Returns: None
+        """
+        full = 0
+        for i in systeme_argumentation.ids():
+            full |= 1 << i
+        super().__init__(systeme_argumentation.names, systeme_argumentation.index, full)
+        self.stride = max(1, (len(self.names) + 7) // 8)   # Octets par ligne.
+        self.rows = bytearray()
+        self.count = 0
+        for ids in exts:
+            m = 0
+            for i in ids:
+                m |= 1 << i
+            self.add_mask(m)
+
+    def add_mask(self, m: int):
+        """
+        Ajoute une extension donnée par son masque.
+        """
+        self.rows += m.to_bytes(self.stride, 'little')
+        self.count += 1
+        self.union |= m
+        self.intersection &= m
+
+    def add(self, S: set[str]):
+        """
+        Ajoute une extension donnée par ses noms.
+        Raises: ValueError: si S contient un argument inconnu.
+        """
+        m = self.mask_of(S)
+        if m is None:
+            raise ValueError("S contient un argument inconnu.")
+        self.add_mask(m)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def masks(self):
+        """
+        Génère les masques des extensions dans l'ordre d'ajout.
+        """
+        vue, stride = memoryview(self.rows), self.stride
+        for pos in range(0, self.count * stride, stride):
+            yield int.from_bytes(vue[pos:pos + stride], 'little')
+
+    def has_mask(self, m: int) -> bool:
+        """
+        Vérifie qu'un masque est une des lignes de la matrice (seules les positions multiples de la largeur comptent).
+        """
+        if m & ~self.union or self.intersection & ~m:      # Tranché par l'union et l'intersection.
+            return False
+        target, stride = m.to_bytes(self.stride, 'little'), self.stride
+        pos = self.rows.find(target)
+        while pos >= 0:
+            if pos % stride == 0:
+                return True
+            pos = self.rows.find(target, pos + 1)
+        return False
+
+    def nbytes(self) -> int:
+        """
+        Estime la mémoire occupée (octets).
+        """
+        return sys.getsizeof(self.rows) + sys.getsizeof(self.union) + sys.getsizeof(self.intersection)
+
+class ZDD(_Family):
+    __slots__ = ("var", "lo", "hi", "root", "count")
+
+    def __init__(self, family: _Family):
+        """
+        Construit le ZDD d'une collection d'extensions.
+        Les noeuds 0 (famille vide) et 1 (famille {∅}) sont terminaux. Le noeud k teste l'argument var[k] :
+        lo[k] est la famille des extensions sans lui, hi[k] celle des extensions avec lui (privées de lui).
+        Les variables sont testées par identifiant croissant et chaque noeud (var, lo, hi) n'existe qu'une fois.
+        Args:
+            - family: collection d'extensions (distinctes).
+        Returns: None
+        """
+        super().__init__(family.names, family.index, family.full)
+        self.var, self.lo, self.hi = array('i', [-1, -1]), array('i', [0, 1]), array('i', [0, 1])
+        unique = {}         # (var, lo, hi) -> noeud.
+        done = []           # Noeuds des familles déjà construites.
+        todo = [(False, list(family.masks()))]
+        while todo:         # Parcours en profondeur sans récursion (la profondeur peut atteindre n).
+            ready, item = todo.pop()
+            if ready:       # Les familles sans puis avec l'argument item sont construites.
+                hi, lo = done.pop(), done.pop()
+                key = (item, lo, hi)
+                node = unique.get(key)
+                if node is None:
+                    node = unique[key] = len(self.var)
+                    self.var.append(item)
+                    self.lo.append(lo)
+                    self.hi.append(hi)
+                done.append(node)
+                continue
+            family = item
+            if not family:
+                done.append(0)
+                continue
+            union = 0
+            for m in family:
+                union |= m
+            if not union:   # Seul l'ensemble vide reste.
+                done.append(1)
+                continue
+            v = (union & -union).bit_length() - 1      # Plus petit argument présent.
+            low = 1 << v
+            todo.append((True, v))
+            todo.append((False, [m ^ low for m in family if m & low]))
+            todo.append((False, [m for m in family if not m & low]))
+        self.root = done.pop()
+        counts = [0, 1]
+        inter = [None, 0]   # Intersection de la famille de chaque noeud (None pour la famille vide).
+        for k in range(2, len(self.var)):   # Les enfants sont toujours créés avant leur parent.
+            lo, hi, low = self.lo[k], self.hi[k], 1 << self.var[k]
+            counts.append(counts[lo] + counts[hi])
+            inter.append(inter[hi] | low if lo == 0 else (inter[hi] | low) & inter[lo])
+            self.union |= low
+        self.count = counts[self.root]
+        if self.count:
+            self.intersection = inter[self.root]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def masks(self):
+        """
+        Génère les masques des extensions.
+        """
+        var, lo, hi = self.var, self.lo, self.hi
+        stack = [(self.root, 0)]
+        while stack:
+            node, m = stack.pop()
+            if node == 1:
+                yield m
+            elif node > 1:
+                stack.append((lo[node], m))
+                stack.append((hi[node], m | 1 << var[node]))
+
+    def has_mask(self, m: int) -> bool:
+        """
+        Suit le chemin de m depuis la racine.
+        """
+        var, node = self.var, self.root
+        while node > 1:
+            v = var[node]
+            if m & ((1 << v) - 1):      # m contient un argument plus petit que tous ceux qui restent.
+                return False
+            if (m >> v) & 1:
+                node = self.hi[node]
+                m ^= 1 << v
+            else:
+                node = self.lo[node]
+        return node == 1 and m == 0
+
+    def nbytes(self) -> int:
+        """
+        Estime la mémoire occupée (octets).
+        """
+        return sum(sys.getsizeof(t) for t in (self.var, self.lo, self.hi)) + sys.getsizeof(self.union) + sys.getsizeof(self.intersection)
+
+def compact(store: ExtensionStore):
+    """
+    Donne la représentation la plus petite d'une collection d'extensions.
+    Args:
+        - store: collection d'extensions.
+    Returns: Un ZDD équivalent s'il occupe moins de mémoire (essayé à partir de SHARE_MIN extensions), store sinon.
+    """
+    if not isinstance(store, ExtensionStore) or len(store) < SHARE_MIN:
+        return store
+    zdd = ZDD(store)
+    return zdd if zdd.nbytes() < store.nbytes() else store
@@ -7,19 +7,163 @@ Représentation d'un système d’argumentation (AS) avec : <A, R>
     Avec Les fonctions:
         - attackers_of(a): qui attaque a.
         - attacks(a): qui est attaqué par a.
+
+Les attaques sont indexées une seule fois à la construction :
+    - chaque argument reçoit un identifiant entier (index) et names[i] redonne son nom.
+    - succ[i] : identifiants des arguments attaqués par l'argument i (array d'entiers).
+    - pred[i] : identifiants des attaquants de l'argument i (array d'entiers).
+    (les listes de voisins peuvent aussi être des vues memoryview sur un cache binaire, voir src/compiled.py)
+L'encodage en masques de bits (src/bitset.py) est calculé à la demande et conservé dans bitset.
+
+L'AS peut être modifié (ajout / retrait d'arguments et d'attaques) : les index sont mis à jour sur place,
+les identifiants des autres arguments ne changent pas (un argument retiré laisse names[i] à None).
+Si memo n'est pas None, il contient les résultats par composante fortement connexe (voir src/decomposition.py) :
+une modification n'efface que les entrées des composantes qui contiennent un argument touché.
 """
+from array import array
+from collections import deque
+from itertools import repeat
+
 class AS:
+    __slots__ = ("A", "names", "index", "succ", "pred", "nb_attacks", "bitset", "memo")
+
     def __init__(self, A: set[str], R:set[tuple[str, str]]):
         """
-        Initialise un AS.
+        Initialise un AS et construit les index d'adjacence.
         Args:
             - A: ensemble des arguments.
             - R: ensemble des attaques (x, y) avec x attaque y.
         Returns: None
+        Raises: ValueError: si une attaque utilise un argument qui n'est pas dans A.
         """
         self.A = A      # Initialisation de l'ensemble des arguments.
-        self.R = R      # Initialisation de l'ensemble des attaques.
-    
+        self.names = sorted(A)      # Nom de chaque argument, la position dans la liste est son identifiant.
+        self.index = {name: i for i, name in enumerate(self.names)}    # Identifiant entier de chaque argument.
+        self.succ = [array('i') for _ in self.names]   # Liste d'adjacence avant (qui est attaqué par i).
+        self.pred = [array('i') for _ in self.names]   # Liste d'adjacence arrière (qui attaque i).
+        self.nb_attacks = 0     # Nombre d'attaques du système.
+        self.bitset = None      # Encodage en masques de bits, construit à la première utilisation.
+        self.memo = None        # Résultats par composante, activé par le raisonnement incrémental (src/incremental.py).
+        for x, y in R:          # On itére une seule fois sur les relations pour remplir les index.
+            if x not in self.index or y not in self.index:
+                raise ValueError("Error: Argument utilisé dans une attaque avant d’être déclaré.")
+            i, j = self.index[x], self.index[y]
+            self.succ[i].append(j)  # i attaque j.
+            self.pred[j].append(i)  # j est attaqué par i.
+            self.nb_attacks += 1
+
+    @classmethod
+    def from_arrays(cls, names: list[str], src, dst) -> "AS":
+        """
+        Construit un AS directement à partir d'identifiants entiers (sans passer par des ensembles de couples).
+        Args:
+            - names: nom de chaque argument, la position est son identifiant.
+            - src, dst: tableaux d'identifiants, src[k] attaque dst[k].
+        Returns: Le système d'argumentation.
+        """
+        self = cls.__new__(cls)
+        self.A = set(names)
+        self.names = names
+        self.index = dict(zip(names, range(len(names))))
+        self.bitset = None
+        self.memo = None
+        self.succ = self._adjacency(len(names), src, dst)
+        self.pred = self._adjacency(len(names), dst, src)
+        if self._dedupe(self.succ):     # Une attaque en double l'est dans les deux sens.
+            self._dedupe(self.pred)
+        self.nb_attacks = sum(map(len, self.succ))
+        return self
+
+    @classmethod
+    def from_csr(cls, names: list[str], succ_off, succ_adj, pred_off, pred_adj) -> "AS":
+        """
+        Construit un AS à partir de tableaux au format CSR sans recopier les attaques :
+        les voisins de i sont des tranches (vues) de succ_adj / pred_adj.
+        Args:
+            - names: nom de chaque argument, la position est son identifiant.
+            - succ_off, succ_adj: attaqués par i = succ_adj[succ_off[i]:succ_off[i+1]].
+            - pred_off, pred_adj: attaquants de i = pred_adj[pred_off[i]:pred_off[i+1]].
+        Returns: Le système d'argumentation.
+        """
+        self = cls.__new__(cls)
+        self.A = set(names)
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        n = len(names)
+        self.succ = [succ_adj[succ_off[i]:succ_off[i + 1]] for i in range(n)]
+        self.pred = [pred_adj[pred_off[i]:pred_off[i + 1]] for i in range(n)]
+        self.nb_attacks = len(succ_adj)
+        self.bitset = None
+        self.memo = None
+        return self
+
+    @staticmethod
+    def _adjacency(n: int, src, dst) -> list[array]:
+        """
+        Regroupe les attaques par argument : adj[src[k]] reçoit dst[k], dans l'ordre des tableaux.
+        Le parcours des attaques est fait par map (en C), sans itération Python par attaque.
+        """
+        adj = list(map(array, repeat('i', n)))
+        deque(map(array.append, map(adj.__getitem__, src), dst), maxlen=0)
+        return adj
+
+    @staticmethod
+    def _dedupe(adj: list) -> bool:
+        """
+        Supprime les voisins en double de chaque liste.
+        Returns: True si au moins une liste contenait un double.
+        """
+        sizes = list(map(len, adj))
+        unique = list(map(len, map(set, adj)))      # Calculés en C, comparés d'un bloc.
+        if sizes == unique:
+            return False
+        for i, size, kept in zip(range(len(adj)), sizes, unique):
+            if size != kept:
+                adj[i] = array('i', sorted(set(adj[i])))
+        return True
+
+    @property
+    def R(self) -> set[tuple[str, str]]:
+        """
+        Reconstruit l'ensemble des attaques à partir des index.
+        Returns: L'ensemble des attaques (x, y) avec x attaque y.
+        """
+        names = self.names
+        return {(names[i], names[j]) for i, targets in enumerate(self.succ) for j in targets}
+
+    def ids(self):
+        """
+        Itère sur les identifiants des arguments présents (les arguments retirés sont sautés).
+        """
+        return (i for i, name in enumerate(self.names) if name is not None)
+
+    def ids_of(self, S) -> set[int]:
+        """
+        Donne les identifiants d'un ensemble d'arguments.
+        Args:
+            - S: ensemble d'arguments.
+        Returns: L'ensemble des identifiants.
+        Raises: ValueError: si S contient un argument inconnu.
+        """
+        index = self.index
+        try:
+            return {index[a] for a in S}
+        except KeyError:
+            raise ValueError("S contient un argument inconnu.") from None
+
+    def id_of(self, a: str) -> int:
+        """
+        Donne l'identifiant entier de a.
+        Args:
+            - a: argument.
+        Returns: L'identifiant de a.
+        Raises: ValueError: si a n'est pas dans A.
+        """
+        i = self.index.get(a)       # Recherche de l'identifiant de 'a' en temps constant.
+        if i is None:               # Si 'a' n'a pas d'identifiant il n'est pas dans le système.
+            raise ValueError(f"L'argument {a} n'est pas dans les arguments.")
+        return i
+
     def attackers_of(self, a: str) -> set[str]:
         """
         Donne les attaquants de a.
@@ -28,14 +172,9 @@ class AS:
         Returns: L'ensemble contenant tous les attaquant de a.
         Raises: ValueError: si a n'est pas dans A.
         """
-        if a not in self.A:         # Verification de si l'argument a appartient à l'ensemble des arguments du système.
-            raise ValueError(f"L'argument {a} n'est pas dans les arguments.")
-        attackers = set()       # Initialisation de l'ensemble des attaquant de 'a'.
-        for r in self.R:        # On itére sur chaque relation dans l'ensemble des relations du système.
-            if(r[1] == a):      # On regarde si la relation porte sur 'a' qui se fait attaquer.
-                attackers.add(r[0])     # Si c'est le cas on ajoute l'attaquant à la liste des attaquant de 'a'.
-        return attackers # On retourne la liste des attaquant.
-    
+        names = self.names
+        return {names[i] for i in self.pred[self.id_of(a)]}  # Lecture directe de la liste d'adjacence arrière de 'a'.
+
     def attacks(self, a: str) -> set[str]:
         """
         Donne les arguments attaqués par a.
@@ -44,10 +183,104 @@ class AS:
         Returns: l'ensemble contenant tous les arguments attaqués par a.
         Raises: ValueError: si a n'est pas dans A.
         """
-        if a not in self.A:         # Verification de si l'argument a appartient à l'ensemble des arguments du système.
-            raise ValueError(f"L'argument {a} n'est pas dans les arguments.")
-        attacks = set()         # Initialisation de l'ensemble des attaqué par 'a'.
-        for r in self.R:        # On itére sur chaque relation dans l'ensemble des relations du système.
-            if(r[0] == a):      # On regarde si la relation porte sur 'a' qui attaque.
-                attacks.add(r[1])       # Si c'est le cas on ajoute l'attaqué à la liste des attaqué par 'a'.
-        return attacks # On retourne la liste des attaqué.
+        names = self.names
+        return {names[j] for j in self.succ[self.id_of(a)]}  # Lecture directe de la liste d'adjacence avant de 'a'.
+
+    # ******** Modifications: ********
+
+    def add_argument(self, a: str) -> int:
+        """
+        Ajoute un argument (sans attaque).
+        Args:
+            - a: nom du nouvel argument.
+        Returns: L'identifiant du nouvel argument.
+        Raises: ValueError: si a est déjà dans A.
+        """
+        if a in self.index:
+            raise ValueError(f"L'argument {a} est déjà dans les arguments.")
+        i = len(self.names)         # Les identifiants ne sont jamais réutilisés.
+        self.names.append(a)
+        self.index[a] = i
+        self.A.add(a)
+        self.succ.append(array('i'))
+        self.pred.append(array('i'))
+        self._changed((i,))
+        return i
+
+    def remove_argument(self, a: str):
+        """
+        Retire un argument et toutes les attaques qui le concernent.
+        Args:
+            - a: argument à retirer.
+        Returns: None
+        Raises: ValueError: si a n'est pas dans A.
+        """
+        i = self.id_of(a)
+        touched = {i, *self.succ[i], *self.pred[i]}
+        for j in set(self.succ[i]):     # i n'attaque plus personne.
+            if j != i:
+                self._writable(self.pred, j).remove(i)
+        for j in set(self.pred[i]):     # Plus personne n'attaque i.
+            if j != i:
+                self._writable(self.succ, j).remove(i)
+        self.nb_attacks -= len(self.succ[i]) + len(self.pred[i]) - (i in self.succ[i])
+        self.succ[i], self.pred[i] = array('i'), array('i')
+        self.names[i] = None
+        del self.index[a]
+        self.A.discard(a)
+        self._changed(touched)
+
+    def add_attack(self, x: str, y: str):
+        """
+        Ajoute l'attaque x -> y (sans effet si elle existe déjà).
+        Args:
+            - x: attaquant.
+            - y: attaqué.
+        Returns: None
+        Raises: ValueError: si x ou y n'est pas dans A.
+        """
+        i, j = self.id_of(x), self.id_of(y)
+        if j in self.succ[i]:
+            return
+        self._writable(self.succ, i).append(j)
+        self._writable(self.pred, j).append(i)
+        self.nb_attacks += 1
+        self._changed((i, j))
+
+    def remove_attack(self, x: str, y: str):
+        """
+        Retire l'attaque x -> y.
+        Args:
+            - x: attaquant.
+            - y: attaqué.
+        Returns: None
+        Raises: ValueError: si x ou y n'est pas dans A, ou si l'attaque n'existe pas.
+        """
+        i, j = self.id_of(x), self.id_of(y)
+        if j not in self.succ[i]:
+            raise ValueError(f"L'attaque ({x}, {y}) n'existe pas.")
+        self._writable(self.succ, i).remove(j)
+        self._writable(self.pred, j).remove(i)
+        self.nb_attacks -= 1
+        self._changed((i, j))
+
+    @staticmethod
+    def _writable(adj: list, i: int) -> array:
+        """
+        Donne la liste de voisins adj[i] sous forme modifiable (une vue sur le cache binaire est recopiée).
+        """
+        if not isinstance(adj[i], array):
+            adj[i] = array('i', adj[i])
+        return adj[i]
+
+    def _changed(self, touched):
+        """
+        Invalide ce qui dépend des arguments touchés par une modification.
+        Args:
+            - touched: identifiants des arguments touchés.
+        Returns: None
+        """
+        self.bitset = None      # L'encodage global est reconstruit à la prochaine utilisation.
+        if self.memo is not None:   # Seules les composantes qui contiennent un argument touché sont oubliées.
+            for key in [key for key in self.memo if not key.isdisjoint(touched)]:
+                del self.memo[key]
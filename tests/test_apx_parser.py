@@ -0,0 +1,81 @@
+"""
+tests/test_apx_parser.py
+
+Tests du parseur .apx : lignes acceptées et rejetées, lecture par blocs, et accord entre
+parse_apx (ensembles), parse_apx_indexed (identifiants) et load_apx (AS).
+Lancement : python -m pytest -q
+"""
+import pytest
+
+from src import apx_parser
+from src.apx_parser import load_apx, parse_apx, parse_apx_indexed
+
+
+def write(tmp_path, texte: str) -> str:
+    path = tmp_path / "af.apx"
+    path.write_bytes(texte.encode("utf-8"))
+    return str(path)
+
+
+def parsed(path: str) -> tuple[set, set]:
+    """
+    Parse un fichier des trois façons et vérifie qu'elles donnent le même système.
+    """
+    A, R = parse_apx(path)
+    names, src, dst = parse_apx_indexed(path)
+    assert set(names) == A and {(names[i], names[j]) for i, j in zip(src, dst)} == R
+    af = load_apx(path)
+    assert af.A == A and af.R == R and af.nb_attacks == len(R)
+    return A, R
+
+
+@pytest.mark.parametrize("texte", [
+    "arg(a).\narg(b).\natt(a,b).\n",
+    "arg(a).\r\narg(b).\r\n\r\natt(a,b).\r\n",                    # Fins de ligne Windows et ligne vide.
+    "  arg(A).\n\targ(b).\n   \natt(a,b). % att(b,a)\n",             # Indentation, majuscules, texte après le point.
+    "att(a,b).\narg(b).\narg(a).\natt(a,b).",                       # Déclaration après l'attaque, attaque en double, pas de retour final.
+])
+def test_accepted(tmp_path, texte):
+    assert parsed(write(tmp_path, texte)) == ({"a", "b"}, {("a", "b")})
+
+
+def test_empty(tmp_path):
+    assert parsed(write(tmp_path, "")) == (set(), set())
+    assert parsed(write(tmp_path, "\n \n")) == (set(), set())
+
+
+def test_non_ascii_names_lowercased(tmp_path):
+    assert parsed(write(tmp_path, "arg(É).\narg(b).\natt(É,b).\n")) == ({"é", "b"}, {("é", "b")})
+
+
+@pytest.mark.parametrize("texte, numero", [
+    ("arg(a).\narg b).\natt(a,a).\n", 2),
+    ("arg(a).\narg(b).\natt(a,b,a).\n", 3),
+    ("arg(a).\n% commentaire\n", 2),
+    ("arg(a).\natt(a,a)\n", 2),
+])
+def test_malformed_line(tmp_path, texte, numero):
+    path = write(tmp_path, texte)
+    for parse in (parse_apx, parse_apx_indexed, load_apx):
+        with pytest.raises(ValueError, match=f"Ligne {numero} "):
+            parse(path)
+
+
+def test_undeclared(tmp_path):
+    path = write(tmp_path, "arg(a).\natt(a,b).\n")
+    for parse in (parse_apx, parse_apx_indexed, load_apx):
+        with pytest.raises(ValueError, match="déclaré"):
+            parse(path)
+
+
+def test_blocks(tmp_path, monkeypatch):
+    """
+    Des blocs de quelques octets coupent les lignes : le résultat et les numéros de ligne ne changent pas.
+    """
+    n = 200
+    texte = "".join(f"arg(a{i}).\n" for i in range(n)) + "".join(f"att(a{i},a{i * 7 % n}).\n" for i in range(n))
+    attendu = parsed(write(tmp_path, texte))
+    monkeypatch.setattr(apx_parser, "CHUNK_SIZE", 16)
+    assert parsed(write(tmp_path, texte)) == attendu
+    with pytest.raises(ValueError, match=f"Ligne {2 * n + 1} "):
+        parse_apx(write(tmp_path, texte + "oops\n" + texte))
@@ -0,0 +1,86 @@
+"""
+tests/test_bulk.py
+
+Vérification groupée (src/bulk.py, queries.verify_many) : le chemin NumPy (si NumPy est installé)
+et le repli sur des entiers Python comparés aux tests un par un de src/semantics.py et src/queries.py.
+Lancement : python -m pytest -q
+"""
+import random
+from itertools import combinations
+
+import pytest
+
+from src.systeme_argumentation import AS
+from src import bulk, queries, semantics
+
+SEEDS = range(60)
+
+
+def random_af(seed: int) -> AS:
+    rnd = random.Random(seed)
+    A = [f"a{i}" for i in range(rnd.randint(1, 6))]
+    p = rnd.choice((0.1, 0.2, 0.3, 0.5))
+    return AS(set(A), {(x, y) for x in A for y in A if rnd.random() < p})
+
+
+def candidates(af: AS) -> list[set[str]]:
+    """
+    Tous les sous-ensembles, plus des candidats avec un argument inconnu.
+    """
+    A = sorted(af.index)
+    res = [set(S) for k in range(len(A) + 1) for S in combinations(A, k)]
+    return res + [{"inconnu"}, {A[0], "inconnu"}]
+
+
+def expected(af: AS, S: set[str]) -> tuple[bool, bool, bool]:
+    if not S <= af.A:
+        return False, False, False
+    return semantics.is_conflict_free(af, S), semantics.is_admissible(af, S), semantics.is_stable(af, S)
+
+
+@pytest.fixture(params=["numpy", "ints"])
+def backend(request, monkeypatch):
+    """
+    Choisit le chemin de src/bulk.py : NumPy (ignoré s'il n'est pas installé) ou entiers Python.
+    """
+    if request.param == "numpy":
+        monkeypatch.setattr(bulk, "np", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(bulk, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_check(seed, backend):
+    af = random_af(seed)
+    cands = candidates(af)
+    cf, adm, st = bulk.check(af, cands)
+    assert list(zip(cf, adm, st)) == [expected(af, S) for S in cands]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_verify_many(seed, backend):
+    af = random_af(seed)
+    cands = candidates(af)
+    for problem in ("VE-PR", "VE-ST"):
+        assert queries.verify_many(problem, af, cands) == [queries.solve_query(problem, af, S) for S in cands]
+
+
+def test_numpy_blocks(monkeypatch):
+    """
+    Des blocs de quelques candidats donnent les mêmes réponses qu'un seul bloc.
+    """
+    monkeypatch.setattr(bulk, "np", pytest.importorskip("numpy"))
+    af = random_af(3)
+    cands = candidates(af) * 3
+    attendu = bulk.check(af, cands)
+    monkeypatch.setattr(bulk, "BLOCK", 8)
+    assert bulk.check(af, cands) == attendu
+
+
+def test_empty(backend):
+    af = AS({"a", "b"}, {("a", "b")})
+    assert bulk.check(af, []) == ([], [], [])
+    assert bulk.check(AS(set(), set()), [set()]) == ([True], [True], [True])
+    with pytest.raises(ValueError):
+        queries.verify_many("DC-PR", af, [{"a"}])
@@ -0,0 +1,190 @@
+"""
+tests/test_cli.py
+
+Tests de la ligne de commande (program.py) : sortie standard, erreurs sur stderr et code de retour
+    - mode batch (-b fichier ou entrée standard) comparé aux requêtes seules.
+    - vérification groupée (-c fichier ou entrée standard) comparée aux requêtes VE seules.
+    - énumération EE / SE avec --limit, --timeout et --count, et les fonctions qui les servent
+      (semantics.iter_extensions, semantics.count_extensions).
+Lancement : python -m pytest -q
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src import main, semantics
+from src.apx_parser import load_apx
+from src.queries import solve_query
+
+ROOT = Path(__file__).resolve().parent.parent
+APX = "arg(a).\narg(b).\narg(c).\narg(d).\natt(a,b).\natt(b,a).\natt(b,c).\natt(c,d).\n"     # PR = ST = {a,c}, {b,d}.
+
+
+@pytest.fixture
+def apx(tmp_path) -> str:
+    path = tmp_path / "af.apx"
+    path.write_text(APX, encoding="utf-8")
+    return str(path)
+
+
+def program(*argv, stdin: str = None) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, str(ROOT / "program.py"), *argv], input=stdin, capture_output=True, text=True, cwd=ROOT)
+
+
+def answers(stdout: str) -> list[bool]:
+    assert set(stdout.split()) <= {"YES", "NO"}
+    return [ligne == "YES" for ligne in stdout.split()]
+
+
+BATCH = [("DC-PR", "a"), ("DS-PR", "a"), ("VE-ST", "a,c"), ("VE-PR", "a,b"), ("DS-GR", "d"), ("DC-SST", "d"),
+         ("VE-ID", "a"), ("DC-CO", "c"), ("DC-ST", "inconnu")]
+
+
+def test_batch_matches_single_queries(apx, tmp_path):
+    af = load_apx(apx)
+    attendu = [solve_query(p, af, main.parse_and_validate_query(p, a)) for p, a in BATCH]
+    requetes = "# commentaire\n\n" + "".join(f"{p} {a}\n" for p, a in BATCH)
+    fichier = tmp_path / "requetes.txt"
+    fichier.write_text(requetes, encoding="utf-8")
+    for argv, stdin in ((("-b", str(fichier)), None), (("-b", "-"), requetes), (("-b", str(fichier), "--cache"), None)):
+        res = program("-f", apx, *argv, stdin=stdin)
+        assert res.returncode == 0 and res.stderr == ""
+        assert answers(res.stdout) == attendu
+    for (p, a), ok in zip(BATCH, attendu):      # Mêmes réponses que les requêtes seules.
+        res = program("-p", p, "-f", apx, "-a", a)
+        assert res.returncode == 0 and answers(res.stdout) == [ok]
+
+
+@pytest.mark.parametrize("ligne, message", [("XX-PR a", "ligne 3: problème inconnu"), ("DC-PR a,b", "ligne 3: "), ("VE-PR ", "ligne 3: ")])
+def test_batch_bad_line(apx, ligne, message):
+    res = program("-f", apx, "-b", "-", stdin=f"DC-PR a\n\n{ligne}\nDC-PR b\n")
+    assert res.returncode == 1 and message in res.stderr
+    assert res.stdout == "YES\n"        # Les réponses déjà données restent affichées.
+
+
+@pytest.mark.parametrize("argv", [("-b", "-", "-p", "DC-PR"), ("-b", "-", "-a", "a"), ("-b", "-", "-c", "-")])
+def test_batch_usage(apx, argv):
+    res = program("-f", apx, *argv, stdin="")
+    assert res.returncode == 2 and res.stdout == ""
+
+
+CANDIDATS = ["a,c", "b,d", "a", "", "# commentaire", "a, b", "A,C", "c,d", "a,inconnu", "b, d "]
+
+
+@pytest.mark.parametrize("problem", ["VE-PR", "VE-ST"])
+def test_candidates_match_single_queries(apx, tmp_path, problem):
+    af = load_apx(apx)
+    attendu = [solve_query(problem, af, main.parse_and_validate_query(problem, c)) for c in CANDIDATS if c and not c.startswith("#")]
+    assert attendu.count(True) == 4
+    fichier = tmp_path / "candidats.txt"
+    fichier.write_text("\n".join(CANDIDATS) + "\n", encoding="utf-8")
+    for argv, stdin in ((("-c", str(fichier)), None), (("-c", "-"), "\n".join(CANDIDATS))):
+        res = program("-p", problem, "-f", apx, *argv, stdin=stdin)
+        assert res.returncode == 0 and res.stderr == ""
+        assert answers(res.stdout) == attendu
+
+
+def test_candidates_chunks(apx, monkeypatch, capsys):
+    """
+    Des paquets de deux candidats donnent les mêmes réponses, dans l'ordre.
+    """
+    af = load_apx(apx)
+    lignes = [c for c in CANDIDATS if c and not c.startswith("#")]
+    attendu = [solve_query("VE-PR", af, main.parse_and_validate_query("VE-PR", c)) for c in lignes]
+    monkeypatch.setattr(main, "CANDIDATES_CHUNK", 2)
+    main.run_candidates(af, "VE-PR", CANDIDATS)
+    assert answers(capsys.readouterr().out) == attendu
+
+
+def test_candidates_errors(apx):
+    res = program("-p", "VE-PR", "-f", apx, "-c", "-", stdin="a,c\n , \n")
+    assert res.returncode == 1 and "ligne 2: " in res.stderr
+    for argv in (("-p", "DC-PR", "-c", "-"), ("-p", "VE-PR", "-c", "-", "-a", "a")):
+        res = program("-f", apx, *argv, stdin="a\n")
+        assert res.returncode == 2 and res.stdout == ""
+
+
+def printed(stdout: str) -> list[frozenset]:
+    lignes = stdout.splitlines()
+    assert all(ligne.startswith("[") and ligne.endswith("]") for ligne in lignes)
+    return [frozenset(a for a in ligne[1:-1].split(",") if a) for ligne in lignes]
+
+
+def pairs_apx(tmp_path, k: int) -> str:
+    """
+    k paires d'attaques mutuelles : 2^k extensions préférées (et stables).
+    """
+    path = tmp_path / "paires.apx"
+    path.write_text("".join(f"arg(x{i}).\narg(y{i}).\natt(x{i},y{i}).\natt(y{i},x{i}).\n" for i in range(k)), encoding="utf-8")
+    return str(path)
+
+
+EXTENSIONS = {frozenset("ac"), frozenset("bd")}
+
+
+@pytest.mark.parametrize("semantic", ["PR", "ST"])
+def test_enumeration(apx, semantic):
+    res = program("-p", f"EE-{semantic}", "-f", apx)
+    assert res.returncode == 0 and res.stderr == ""
+    assert len(printed(res.stdout)) == 2 and set(printed(res.stdout)) == EXTENSIONS
+    for argv, n in ((("--limit", "1"), 1), (("--limit", "5"), 2), (("--timeout", "60"), 2)):
+        res = program("-p", f"EE-{semantic}", "-f", apx, *argv)
+        assert res.returncode == 0 and len(printed(res.stdout)) == n and set(printed(res.stdout)) <= EXTENSIONS
+    res = program("-p", f"SE-{semantic}", "-f", apx)
+    assert res.returncode == 0 and printed(res.stdout)[0] in EXTENSIONS and len(printed(res.stdout)) == 1
+    for argv, n in (((), "2"), (("--limit", "1"), "1"), (("--backend", "sat"), "2"), (("--cache",), "2")):
+        res = program("-p", f"EE-{semantic}", "-f", apx, "--count", *argv)
+        assert res.returncode == 0 and res.stdout == f"{n}\n"
+
+
+def test_no_stable_extension(tmp_path):
+    path = tmp_path / "impair.apx"
+    path.write_text("arg(a).\narg(b).\narg(c).\natt(a,b).\natt(b,c).\natt(c,a).\n", encoding="utf-8")
+    assert program("-p", "SE-ST", "-f", str(path)).stdout == "NO\n"
+    assert program("-p", "EE-ST", "-f", str(path)).stdout == ""
+    assert program("-p", "EE-ST", "-f", str(path), "--count").stdout == "0\n"
+    assert program("-p", "EE-PR", "-f", str(path)).stdout == "[]\n"       # L'ensemble vide est la seule préférée.
+
+
+def test_timeout(tmp_path):
+    """
+    2^22 extensions : le délai est dépassé, les extensions déjà affichées sont valables et le code de retour est 1.
+    """
+    path = pairs_apx(tmp_path, 22)
+    res = program("-p", "EE-PR", "-f", path, "--timeout", "0.2")
+    assert res.returncode == 1 and "délai" in res.stderr
+    exts = printed(res.stdout)
+    assert exts and len(set(exts)) == len(exts) and all(len(S) == 22 for S in exts)
+    res = program("-p", "EE-ST", "-f", path, "--timeout", "0.2", "--count")
+    assert res.returncode == 1 and res.stdout == "" and "délai" in res.stderr
+
+
+@pytest.mark.parametrize("argv", [("--limit", "0"), ("--timeout", "0"), ("--jobs", "2"), ("-a", "a")])
+def test_enumeration_usage(apx, argv):
+    res = program("-p", "EE-PR", "-f", apx, *argv)
+    assert res.returncode == 2 and res.stdout == ""
+
+
+@pytest.mark.parametrize("argv", [("--limit", "1"), ("--timeout", "1"), ("--count",)])
+def test_enumeration_options_need_enumeration(apx, argv):
+    res = program("-p", "DC-PR", "-f", apx, "-a", "a", *argv)
+    assert res.returncode == 2 and res.stdout == ""
+
+
+@pytest.mark.parametrize("semantic", ["PR", "ST"])
+def test_iter_and_count(tmp_path, semantic):
+    af = load_apx(pairs_apx(tmp_path, 5))
+    exts = [frozenset(S) for S in semantics.iter_extensions(af, semantic)]
+    assert len(exts) == len(set(exts)) == 32 == semantics.count_extensions(af, semantic)
+    assert [frozenset(S) for S in semantics.iter_extensions(af, semantic, limit=3)] == exts[:3]     # Même ordre, arrêt anticipé.
+    assert semantics.count_extensions(af, semantic, limit=3) == 3
+    assert semantics.count_extensions(af, semantic, limit=100, timeout=60) == 32
+    gen = semantics.iter_extensions(af, semantic, timeout=1e-9)
+    with pytest.raises(TimeoutError):
+        next(gen)
+    with pytest.raises(TimeoutError):
+        semantics.count_extensions(af, semantic, timeout=1e-9)
+    with pytest.raises(ValueError):
+        semantics.count_extensions(af, "GR")
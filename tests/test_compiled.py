@@ -0,0 +1,122 @@
+"""
+tests/test_compiled.py
+
+Cache binaire .afc (src/compiled.py) : aller-retour de l'AS et des extensions, cache tronqué ou abîmé,
+empreinte SHA-256 périmée (source modifiée) : un cache invalide est ignoré puis réécrit.
+Lancement : python -m pytest -q
+"""
+import pytest
+
+from src import compiled, semantics
+from src.compiled import HEADER, cache_path, file_hash, load, read_compiled, save_extensions, write_compiled
+from src.apx_parser import load_apx
+
+APX = "arg(a).\narg(b).\narg(c).\narg(é).\natt(a,b).\natt(b,a).\natt(b,c).\natt(c,é).\natt(é,é).\n"
+
+
+@pytest.fixture
+def apx(tmp_path) -> str:
+    path = tmp_path / "af.apx"
+    path.write_text(APX, encoding="utf-8")
+    return str(path)
+
+
+def same_af(af, ref):
+    assert af.names == ref.names and af.A == ref.A and af.R == ref.R and af.nb_attacks == ref.nb_attacks
+    assert [list(row) for row in af.succ] == [list(row) for row in ref.succ]
+    assert [list(row) for row in af.pred] == [list(row) for row in ref.pred]
+
+
+def masks(exts: dict) -> dict:
+    return {semantic: list(store.masks()) for semantic, store in exts.items()}
+
+
+def test_round_trip(apx):
+    ref = load_apx(apx)
+    af, stored, digest = load(apx)          # Premier appel : le cache est créé.
+    assert stored == {} and digest == file_hash(apx)
+    same_af(af, ref)
+    af, stored = read_compiled(apx, digest)
+    same_af(af, ref)
+    assert stored == {} and isinstance(af.succ[0], memoryview)      # Vues sur le fichier projeté, sans copie.
+    exts = {"PR": semantics.preferred_extensions(ref), "ST": semantics.stable_extensions(ref)}
+    save_extensions(apx, ref, digest, exts)
+    af, stored, _ = load(apx)
+    same_af(af, ref)
+    assert masks(stored) == masks(exts) and len(stored["PR"]) == 2
+    assert {frozenset(S) for S in stored["PR"]} == {frozenset(S) for S in exts["PR"]}
+
+
+def test_empty(tmp_path):
+    path = tmp_path / "vide.apx"
+    path.write_text("", encoding="utf-8")
+    af, stored, digest = load(str(path))
+    af, stored = read_compiled(str(path), digest)
+    assert af.names == [] and af.R == set() and stored == {}
+
+
+def test_truncated(apx):
+    """
+    Un cache tronqué est ignoré. Coupé exactement entre deux sections, c'est un cache valide qui garde moins
+    de sémantiques : l'AS reste exact et les extensions manquantes seront recalculées.
+    """
+    af, _, digest = load(apx)
+    exts = {"PR": semantics.preferred_extensions(af), "ST": semantics.stable_extensions(af)}
+    save_extensions(apx, af, digest, exts)
+    with open(cache_path(apx), "rb") as f:
+        data = f.read()
+    valid = []
+    for size in range(len(data)):
+        with open(cache_path(apx), "wb") as f:
+            f.write(data[:size])
+        res = read_compiled(apx, digest)
+        if res is not None:
+            same_af(res[0], af)
+            valid.append(list(masks(res[1]).items()))
+    assert valid == [[], [("PR", list(exts["PR"].masks()))]]       # Fin de l'AS, puis fin des préférées.
+    af2, stored, _ = load(apx)              # Dernier octet manquant : ignoré puis réécrit à partir de la source.
+    same_af(af2, af)
+    assert stored == {} and read_compiled(apx, digest) is not None
+
+
+@pytest.mark.parametrize("offset, value", [(0, b"XFC1"), (4, bytes([compiled.VERSION + 1])), (5, bytes([1 - compiled.LITTLE]))])
+def test_bad_header(apx, offset, value):
+    _, _, digest = load(apx)
+    with open(cache_path(apx), "r+b") as f:
+        f.seek(offset)
+        f.write(value)
+    assert read_compiled(apx, digest) is None
+
+
+def test_stale_digest(apx):
+    af, _, digest = load(apx)
+    save_extensions(apx, af, digest, {"PR": semantics.preferred_extensions(af)})
+    with open(apx, "a", encoding="utf-8") as f:
+        f.write("arg(d).\natt(d,a).\n")     # La source change après l'écriture du cache.
+    assert read_compiled(apx, file_hash(apx)) is None
+    af2, stored, digest2 = load(apx)
+    assert digest2 != digest and stored == {}
+    same_af(af2, load_apx(apx))
+    with open(cache_path(apx), "rb") as f:
+        assert HEADER.unpack(f.read(HEADER.size))[3] == digest2        # En-tête réécrit avec la nouvelle empreinte.
+
+
+def test_save_with_old_digest(apx):
+    """
+    Des extensions calculées sur l'ancienne source ne sont pas reprises si le fichier a changé entre-temps.
+    """
+    af, _, digest = load(apx)
+    with open(apx, "a", encoding="utf-8") as f:
+        f.write("arg(d).\n")
+    save_extensions(apx, af, digest, {"PR": semantics.preferred_extensions(af)})
+    af2, stored, _ = load(apx)
+    assert stored == {} and "d" in af2.A
+
+
+def test_out_of_range_extension(apx):
+    af, _, digest = load(apx)
+    write_compiled(apx, af, digest, {"PR": semantics.preferred_extensions(af)})
+    with open(cache_path(apx), "r+b") as f:
+        f.seek(-4, 2)
+        f.write((len(af.names)).to_bytes(4, "little" if compiled.LITTLE else "big"))   # Identifiant hors de l'AS.
+    assert read_compiled(apx, digest) is None
@@ -0,0 +1,115 @@
+"""
+tests/test_daemon.py
+
+Démon de résolution (src/daemon.py) et son client (src/client.py) : validation et normalisation des requêtes,
+puis un démon lancé sur une socket Unix temporaire, dont les réponses sont comparées aux requêtes locales.
+Lancement : python -m pytest -q
+"""
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src import client
+from src.apx_parser import load_apx
+from src.daemon import parse_request
+from src.queries import solve_query
+
+ROOT = Path(__file__).resolve().parent.parent
+APX = "arg(A).\narg(b).\narg(c).\narg(d).\natt(A,b).\natt(b,A).\natt(b,c).\natt(c,d).\n"     # Noms lus en minuscules.
+
+
+@pytest.mark.parametrize("message, attendu", [
+    ({"problem": "DC-PR", "file": "af.apx", "query": "A"}, "a"),
+    ({"problem": "DS-ST", "file": "af.apx", "query": "  b "}, "b"),
+    ({"problem": "VE-PR", "file": "af.apx", "query": [" A", "C ", ""]}, {"a", "c"}),
+])
+def test_parse_request_normalised(message, attendu):
+    assert parse_request(message) == (message["problem"], "af.apx", attendu)
+
+
+@pytest.mark.parametrize("message", [
+    [],
+    {"problem": "XX-PR", "file": "af.apx", "query": "a"},
+    {"problem": "DC-PR", "file": "", "query": "a"},
+    {"problem": "DC-PR", "file": "af.apx", "query": " "},
+    {"problem": "DC-PR", "file": "af.apx", "query": "a,b"},
+    {"problem": "DC-PR", "file": "af.apx", "query": ["a"]},
+    {"problem": "VE-PR", "file": "af.apx", "query": [" ", ""]},
+    {"problem": "VE-PR", "file": "af.apx", "query": "a"},
+])
+def test_parse_request_rejected(message):
+    with pytest.raises(ValueError):
+        parse_request(message)
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """
+    Démon lancé dans un sous-processus sur une socket Unix temporaire, arrêté par SIGTERM à la fin du test.
+    """
+    sock = str(tmp_path / "d.sock")
+    proc = subprocess.Popen([sys.executable, "-m", "src.daemon", sock, "--workers", "2"], cwd=ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                client.connect(sock).close()
+                break
+            except OSError:
+                assert proc.poll() is None and time.monotonic() < deadline, "le démon n'a pas démarré"
+                time.sleep(0.05)
+        yield sock
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        assert proc.wait(timeout=30) == 0
+        proc.stderr.close()
+    assert not os.path.exists(sock)         # La socket est retirée à l'arrêt.
+
+
+def test_daemon_matches_local(daemon, tmp_path):
+    path = tmp_path / "af.apx"
+    path.write_text(APX, encoding="utf-8")
+    path = str(path)
+    af = load_apx(path)
+    for problem in ("DC-PR", "DS-PR", "DC-ST", "DS-ST", "DC-GR", "DC-SST", "DS-SST", "DC-ID"):
+        for a in ("A", "a", " b ", "c", "D", "inconnu"):
+            assert client.solve(daemon, problem, path, a) == solve_query(problem, af, a.strip().lower()), (problem, a)
+    assert client.solve(daemon, "DC-PR", path, "A") is True
+    assert client.solve(daemon, "VE-PR", path, {"A", "c"}) is True
+    assert client.solve(daemon, "VE-ST", path, {"b", "D"}) is True
+    assert client.solve(daemon, "VE-ST", path, {"a", "b"}) is False
+    with pytest.raises(ValueError, match="problème inconnu"):
+        client.solve(daemon, "XX-PR", path, "a")
+    with pytest.raises(ValueError):
+        client.solve(daemon, "DC-PR", str(tmp_path / "absent.apx"), "a")
+    status = client.request(daemon, {"op": "status", "id": 7})
+    assert status["id"] == 7 and status["requests"] >= 48
+    assert [f["file"] for w in status["workers"] for f in w["frameworks"]] == [path]
+    res = subprocess.run([sys.executable, str(ROOT / "program.py"), "--connect", daemon, "-p", "DS-PR", "-f", path, "-a", "A"],
+                         capture_output=True, text=True, cwd=ROOT)
+    assert res.returncode == 0 and res.stdout == f"{'YES' if solve_query('DS-PR', af, 'a') else 'NO'}\n"
+
+
+def test_daemon_pipeline(daemon, tmp_path):
+    """
+    Plusieurs requêtes sur une connexion : une réponse par ligne, dans l'ordre, avec l'id de la requête.
+    """
+    path = tmp_path / "af.apx"
+    path.write_text(APX, encoding="utf-8")
+    messages = [{"id": k, "problem": p, "file": str(path), "query": q}
+                for k, (p, q) in enumerate([("DC-PR", "A"), ("DS-PR", "a"), ("VE-PR", ["a", "c"]), ("DC-PR", "a,b")])]
+    with client.connect(daemon) as sock:
+        sock.settimeout(30)                 # La connexion doit être fermée par le démon après la dernière réponse.
+        sock.sendall(b"".join(json.dumps(m).encode("utf-8") + b"\n" for m in messages))
+        sock.shutdown(1)
+        with sock.makefile("rb") as flux:
+            res = [json.loads(line) for line in flux]
+    assert [r["id"] for r in res] == [0, 1, 2, 3]
+    assert [r.get("result") for r in res[:3]] == [True, False, True] and "error" in res[3]
@@ -0,0 +1,96 @@
+"""
+tests/test_incremental.py
+
+Raisonnement incrémental (src/incremental.py) : après chaque modification de l'AS (ajout / retrait d'arguments
+et d'attaques), les extensions et les requêtes DC / DS sont comparées à celles d'un AS reconstruit de zéro.
+Vérifie aussi que les solutions conservées par composante (memo de src/decomposition.py) restent bornées.
+Lancement : python -m pytest -q
+"""
+import random
+
+import pytest
+
+from src.systeme_argumentation import AS
+from src.incremental import IncrementalReasoner
+from src import decomposition, queries, semantics
+
+SEEDS = range(40)
+STEPS = 12              # Nombre de modifications par AS.
+
+
+def random_af(rnd: random.Random) -> AS:
+    A = [f"a{i}" for i in range(rnd.randint(2, 7))]
+    p = rnd.choice((0.2, 0.3, 0.5))
+    return AS(set(A), {(x, y) for x in A for y in A if rnd.random() < p})
+
+
+def rebuilt(af: AS) -> AS:
+    """
+    AS reconstruit de zéro à partir des arguments et des attaques actuels (sans memo).
+    """
+    return AS(set(af.index), af.R)
+
+
+def mutate(reasoner: IncrementalReasoner, rnd: random.Random, step: int):
+    """
+    Applique une modification tirée au hasard.
+    """
+    af = reasoner.systeme_argumentation
+    A = sorted(af.index)
+    R = sorted(af.R)
+    match rnd.choice(("add_argument", "remove_argument", "add_attack", "remove_attack")):
+        case "add_argument":
+            reasoner.add_argument(f"n{step}")
+        case "remove_argument" if len(A) > 1:
+            reasoner.remove_argument(rnd.choice(A))
+        case "remove_attack" if R:
+            reasoner.remove_attack(*rnd.choice(R))
+        case _:
+            reasoner.add_attack(rnd.choice(A), rnd.choice(A))
+
+
+def as_sets(exts) -> set[frozenset]:
+    return {frozenset(S) for S in exts}
+
+
+@pytest.mark.parametrize("contexts", [decomposition.CONTEXTS, 1])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_matches_rebuilt(seed, contexts, monkeypatch):
+    monkeypatch.setattr(decomposition, "CONTEXTS", contexts)     # 1 : un seul contexte conservé par composante.
+    rnd = random.Random(seed)
+    reasoner = IncrementalReasoner(random_af(rnd))
+    for step in range(STEPS):
+        mutate(reasoner, rnd, step)
+        af = reasoner.systeme_argumentation
+        fresh = rebuilt(af)
+        for semantic in ("PR", "ST"):
+            assert as_sets(reasoner.extensions(semantic)) == as_sets(semantics.iter_extensions(fresh, semantic))
+            for a in sorted(af.index):
+                for kind in ("DC", "DS"):
+                    problem = f"{kind}-{semantic}"
+                    assert reasoner.solve(problem, a) == queries.solve_query(problem, fresh, a), (problem, a)
+
+
+def test_memo_bounded():
+    """
+    Les solutions d'une composante sont conservées par contexte amont, pas par requête : après l'énumération
+    complète (qui rencontre tous les contextes), les requêtes DC / DS sur chaque argument n'ajoutent aucune entrée.
+    """
+    A = [f"a{i}" for i in range(10)]
+    R = {(A[i], A[i + 1]) for i in range(0, 10, 2)} | {(A[i + 1], A[i]) for i in range(0, 10, 2)}  # Cinq SCC {a2k, a2k+1}...
+    R |= {(A[i], A[i + 1]) for i in range(1, 9, 2)}                                                # ... attaquées l'une après l'autre.
+    reasoner = IncrementalReasoner(AS(set(A), R))
+    af = reasoner.systeme_argumentation
+
+    def entries() -> int:
+        return sum(len(comp.solutions) for comp in af.memo.values())
+
+    reasoner.extensions("PR")
+    reasoner.extensions("ST")
+    before = entries()
+    assert before > len(af.memo)        # Les SCC en aval ont plusieurs contextes.
+    for a in A:
+        for problem in ("DC-PR", "DS-PR", "DC-ST", "DS-ST"):
+            reasoner.solve(problem, a)
+    assert entries() == before
+    assert all(len(comp.solutions) <= decomposition.CONTEXTS for comp in af.memo.values())
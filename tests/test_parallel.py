@@ -0,0 +1,98 @@
+"""
+tests/test_parallel.py
+
+Recherche répartie (src/parallel.py) : extensions et requêtes DC / DS comparées à la recherche séquentielle,
+et arrêt des tâches dès que l'événement partagé est positionné, au milieu de la recherche.
+Lancement : python -m pytest -q
+"""
+import random
+
+import pytest
+
+from src.systeme_argumentation import AS
+from src import decomposition, parallel, queries, semantics
+
+SEEDS = range(8)            # Chaque appel démarre un groupe de processus : peu d'AS, mais peu décidés par l'extension fondée.
+JOBS = 2
+
+
+def random_af(seed: int) -> AS:
+    """
+    Petit AS avec beaucoup d'attaques mutuelles (beaucoup d'arguments non décidés par l'extension fondée).
+    """
+    rnd = random.Random(seed)
+    A = [f"a{i}" for i in range(rnd.randint(4, 8))]
+    R = set()
+    for x in A:
+        for y in A:
+            if x != y and rnd.random() < 0.3:
+                R.add((x, y))
+                if rnd.random() < 0.6:
+                    R.add((y, x))
+    return AS(set(A), R)
+
+
+def as_sets(exts) -> set[frozenset]:
+    return {frozenset(S) for S in exts}
+
+
+class Countdown:
+    """
+    Evénement qui passe à positionné après n consultations (compte les consultations).
+    """
+    def __init__(self, n: int):
+        self.n = n
+        self.calls = 0
+
+    def is_set(self) -> bool:
+        self.calls += 1
+        return self.calls > self.n
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_matches_sequential(seed):
+    af = random_af(seed)
+    for semantic in ("PR", "ST"):
+        assert as_sets(parallel.extensions(af, semantic, JOBS)) == as_sets(semantics.iter_extensions(af, semantic))
+        label = decomposition.grounded_labelling(af)
+        for a in sorted(af.index):
+            if label[af.index[a]] != decomposition.UNDEC:   # Réglé par l'extension fondée, sans processus.
+                continue
+            for kind in ("DC", "DS"):
+                problem = f"{kind}-{semantic}"
+                assert parallel.solve_query(problem, af, a, JOBS) == queries.solve_query(problem, af, a), (problem, a)
+
+
+def test_stop_inside_search():
+    """
+    Sans extension stable, la recherche ne produit rien : l'événement est quand même vu à chaque noeud.
+    Quatre paires d'attaques mutuelles en amont, puis w (qui s'attaque lui-même) attaqué par les paires,
+    et un cycle impair attaqué par w : chaque combinaison des paires échoue sur le cycle.
+    """
+    pairs = [(f"x{i}", f"y{i}") for i in range(4)]
+    R = {(x, y) for x, y in pairs} | {(y, x) for x, y in pairs} | {(x, "w") for x, _ in pairs} | {("w", "w"), ("w", "c0")}
+    R |= {("c0", "c1"), ("c1", "c2"), ("c2", "c0")}
+    af = AS({a for pair in pairs for a in pair} | {"w", "c0", "c1", "c2"}, R)
+    assert next(semantics.iter_extensions(af, "ST"), None) is None
+    stop = Countdown(5)
+    with pytest.raises(TimeoutError):
+        next(decomposition.iter_extensions(af, False, stop=stop), None)
+    assert stop.calls == 6
+
+
+@pytest.mark.parametrize("kind", ["DC", "DS"])
+def test_worker_stops_early(kind, monkeypatch):
+    """
+    Une tâche DC / DS dont l'événement est positionné répond False sans finir sa partie.
+    """
+    af = AS({"a", "b", "c"}, {("a", "b"), ("b", "a"), ("b", "c"), ("c", "b")})
+    stop = Countdown(0)
+    monkeypatch.setattr(parallel, "_af", af)
+    monkeypatch.setattr(parallel, "_stop", stop)
+    a = af.index["a"]
+    req, excl = (frozenset({a}), frozenset()) if kind == "DC" else (frozenset(), frozenset({a}))
+    assert parallel._exists(True, req, excl, kind == "DS") is False
+    assert parallel._extensions(True, req, excl) == []
+    assert stop.calls == 2
+    monkeypatch.setattr(parallel, "_stop", Countdown(float("inf")))     # Jamais positionné : la tâche aboutit.
+    assert parallel._exists(True, req, excl, kind == "DS") is True
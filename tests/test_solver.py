@@ -0,0 +1,203 @@
+"""
+tests/test_solver.py
+
+Tests de bout en bout et tests croisés des solveurs :
+    - EE-PR / EE-ST de program.py (labelling et SAT) comparés aux fichiers attendus de Fichiers-tests/.
+    - sur de petits AS aléatoires, la recherche par étiquetages (seule et avec la décomposition en SCC)
+      et le moteur SAT comparés à une énumération brute de tous les sous-ensembles (définitions de Dung).
+    - de même pour les requêtes VE / DC / DS des sémantiques complète, fondée, semi-stable et idéale.
+Lancement : python -m pytest -q
+"""
+import random
+import subprocess
+import sys
+from itertools import combinations
+from pathlib import Path
+
+import pytest
+
+from src.systeme_argumentation import AS
+from src import bitset, decomposition, labelling, queries, sat, semantics
+from src.cache import ExtensionCache
+
+ROOT = Path(__file__).resolve().parent.parent
+FICHIERS = sorted((ROOT / "Fichiers-tests").glob("*.apx"))
+SEEDS = range(150)          # Nombre d'AS aléatoires par test croisé.
+MAX_ARGS = 7                # Taille maximale des AS aléatoires (2^7 sous-ensembles pour la force brute).
+
+
+def expected(path: Path) -> set[frozenset[str]]:
+    """
+    Lit un fichier d'extensions attendues ("[A,B]" par ligne, noms en minuscule comme le parseur).
+    """
+    res = set()
+    for ligne in path.read_text(encoding="utf-8").splitlines():
+        ligne = ligne.strip()
+        if ligne.startswith("[") and ligne.endswith("]"):
+            res.add(frozenset(a.strip().lower() for a in ligne[1:-1].split(",") if a.strip()))
+    return res
+
+
+def printed(stdout: str) -> set[frozenset[str]]:
+    """
+    Lit les extensions affichées par program.py (une "[a,b]" par ligne).
+    """
+    return {frozenset(a for a in ligne[1:-1].split(",") if a) for ligne in stdout.splitlines() if ligne.startswith("[")}
+
+
+@pytest.mark.parametrize("backend", ["labelling", "sat"])
+@pytest.mark.parametrize("semantic", ["PR", "ST"])
+@pytest.mark.parametrize("apx", FICHIERS, ids=lambda p: p.stem)
+def test_enumeration_matches_expected_files(apx, semantic, backend):
+    attendu = expected(apx.with_name(f"{apx.stem}_{semantic.lower()}.txt"))
+    res = subprocess.run([sys.executable, str(ROOT / "program.py"), "-p", f"EE-{semantic}", "-f", str(apx), "--backend", backend],
+                         capture_output=True, text=True, cwd=ROOT, check=True)
+    lignes = [ligne for ligne in res.stdout.splitlines() if ligne.startswith("[")]
+    assert len(lignes) == len(attendu)      # Chaque extension est affichée une seule fois.
+    assert printed(res.stdout) == attendu
+
+
+def random_af(seed: int) -> AS:
+    """
+    Tire un petit AS aléatoire (densité variable, attaques sur soi-même comprises).
+    """
+    rnd = random.Random(seed)
+    A = [f"a{i}" for i in range(rnd.randint(1, MAX_ARGS))]
+    p = rnd.choice((0.1, 0.2, 0.3, 0.5))
+    return AS(set(A), {(x, y) for x in A for y in A if rnd.random() < p})
+
+
+def brute_force(af: AS, excluded: frozenset = frozenset()) -> tuple[set[frozenset], set[frozenset]]:
+    """
+    Enumère tous les sous-ensembles qui évitent excluded.
+    Returns: Couple (ensembles admissibles maximaux, extensions stables).
+    """
+    A = sorted(af.index)
+    R = {(af.names[i], af.names[j]) for i in af.ids() for j in af.succ[i]}
+    attackers = {a: {x for x, y in R if y == a} for a in A}
+    admissible, stable = [], set()
+    for k in range(len(A) + 1):
+        for S in map(frozenset, combinations(A, k)):
+            if S & excluded or any((x, y) in R for x in S for y in S):
+                continue
+            plus = {y for x, y in R if x in S}
+            if all(attackers[a] <= plus for a in S):
+                admissible.append(S)
+                if plus | S == set(A):
+                    stable.add(S)
+    preferred = {S for S in admissible if not any(S < T for T in admissible)}
+    return preferred, stable
+
+
+def brute_force_semantics(af: AS) -> tuple[list[frozenset], dict[str, set[frozenset]]]:
+    """
+    Enumère tous les sous-ensembles et applique les définitions de chaque sémantique.
+    Returns: Couple (ensembles admissibles, dictionnaire sémantique -> extensions) pour CO, GR, PR, ST, SST et ID.
+    """
+    A = sorted(af.index)
+    R = {(af.names[i], af.names[j]) for i in af.ids() for j in af.succ[i]}
+    attackers = {a: {x for x, y in R if y == a} for a in A}
+    admissible, complete, reach = [], [], {}
+    for k in range(len(A) + 1):
+        for S in map(frozenset, combinations(A, k)):
+            if any((x, y) in R for x in S for y in S):
+                continue
+            plus = {y for x, y in R if x in S}
+            defended = {a for a in A if attackers[a] <= plus}
+            if S <= defended:
+                admissible.append(S)
+                reach[S] = S | plus
+                if defended <= S:
+                    complete.append(S)
+    preferred = {S for S in admissible if not any(S < T for T in admissible)}
+    common = frozenset.intersection(*preferred)
+    exts = {
+        "CO": set(complete),
+        "GR": {S for S in complete if not any(T < S for T in complete)},        # La plus petite extension complète.
+        "PR": preferred,
+        "ST": {S for S in admissible if reach[S] == set(A)},
+        "SST": {S for S in complete if not any(reach[S] < reach[T] for T in complete)},
+        "ID": {frozenset().union(*(S for S in admissible if S <= common))},      # Union des admissibles inclus dans toutes les préférées.
+    }
+    return admissible, exts
+
+
+def as_sets(exts) -> set[frozenset]:
+    return {frozenset(S) for S in exts}
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_extensions_labelling_sat_brute_force(seed):
+    af = random_af(seed)
+    preferred, stable = brute_force(af)
+    for semantic, attendu in (("PR", preferred), ("ST", stable)):
+        bs = bitset.encode(af)
+        seule = [frozenset(af.names[i] for i in bitset.bits(m)) for m, _ in labelling.search(bs, semantic == "PR")]
+        assert len(seule) == len(attendu) and set(seule) == attendu        # Etiquetages sans décomposition, sans doublon.
+        assert as_sets(semantics.iter_extensions(af, semantic)) == attendu  # Décomposition en SCC.
+        assert as_sets(sat.extensions(af, semantic)) == attendu
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_required_excluded_brute_force(seed):
+    """
+    Avec des arguments imposés / interdits (découpage de src/parallel.py, DS-PR), toute extension préférée qui les respecte
+    est produite, et chaque ensemble produit est admissible maximal parmi ceux qui évitent les interdits.
+    """
+    af = random_af(seed)
+    rnd = random.Random(-seed)
+    A = sorted(af.index)
+    excluded = frozenset(rnd.sample(A, rnd.randint(0, min(2, len(A)))))
+    required = frozenset(rnd.sample(sorted(set(A) - excluded), rnd.randint(0, min(1, len(A) - len(excluded)))))
+    preferred, _ = brute_force(af)
+    maximal, _ = brute_force(af, excluded)
+    res = decomposition.iter_extensions(af, True, set(af.ids_of(required)), set(af.ids_of(excluded)))
+    produit = [frozenset(af.names[i] for i in ids) for ids in res]
+    assert len(produit) == len(set(produit))
+    assert {P for P in preferred if required <= P and not P & excluded} <= set(produit)
+    assert all(required <= S for S in produit) and set(produit) <= maximal
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_queries_labelling_sat_brute_force(seed):
+    af = random_af(seed)
+    preferred, stable = brute_force(af)
+    for semantic, exts in (("PR", preferred), ("ST", stable)):
+        for a in sorted(af.index):
+            credule = any(a in S for S in exts)
+            sceptique = all(a in S for S in exts)
+            for solve in (queries.solve_query, sat.solve_query):
+                assert solve(f"DC-{semantic}", af, a) == credule
+                assert solve(f"DS-{semantic}", af, a) == sceptique
+        for S in exts:
+            for solve in (queries.solve_query, sat.solve_query):
+                assert solve(f"VE-{semantic}", af, set(S))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_other_semantics_brute_force(seed):
+    """
+    Sémantiques complète, fondée, semi-stable et idéale : extensions et requêtes VE / DC / DS (directes, via le cache
+    et via le moteur SAT, qui délègue ces sémantiques) comparées aux définitions. Les ensembles admissibles servent
+    de candidats VE, la plupart n'étant pas des extensions.
+    """
+    af = random_af(seed)
+    admissible, exts = brute_force_semantics(af)
+    assert exts["GR"] == {frozenset(semantics.grounded_extension(af))}
+    assert as_sets(semantics.complete_extensions(af)) == exts["CO"]
+    assert as_sets(semantics.semi_stable_extensions(af)) == exts["SST"]
+    assert as_sets(semantics.semi_stable_extensions(af, semantics.preferred_extensions(af))) == exts["SST"]
+    assert {frozenset(semantics.ideal_extension(af))} == exts["ID"]
+    assert {frozenset(semantics.ideal_extension(af, semantics.preferred_extensions(af)))} == exts["ID"]
+    cache = ExtensionCache(af)
+    solvers = (queries.solve_query, lambda problem, af, query: queries.solve_query(problem, af, query, cache), sat.solve_query)
+    for semantic in ("CO", "GR", "SST", "ID"):
+        for a in sorted(af.index):
+            credule = any(a in S for S in exts[semantic])
+            sceptique = all(a in S for S in exts[semantic])
+            for solve in solvers:
+                assert solve(f"DC-{semantic}", af, a) == credule, (semantic, a)
+                assert solve(f"DS-{semantic}", af, a) == sceptique, (semantic, a)
+        for S in admissible:
+            for solve in solvers:
+                assert solve(f"VE-{semantic}", af, set(S)) == (S in exts[semantic]), (semantic, S)
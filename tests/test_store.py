@@ -0,0 +1,108 @@
+"""
+tests/test_store.py
+
+Collections d'extensions (src/store.py) : ExtensionStore et ZDD comparés à un ensemble Python de référence
+(appartenance, parcours, nombre d'extensions, DC / DS), et choix de la représentation par compact().
+Lancement : python -m pytest -q
+"""
+import random
+
+import pytest
+
+from src.systeme_argumentation import AS
+from src.store import SHARE_MIN, ExtensionStore, ZDD, compact
+
+SEEDS = range(60)
+
+
+def af_of(n: int) -> AS:
+    return AS({f"a{i}" for i in range(n)}, set())
+
+
+def random_family(rnd: random.Random, af: AS) -> set[frozenset]:
+    names = sorted(af.index)
+    return {frozenset(a for a in names if rnd.random() < 0.5) for _ in range(rnd.randint(0, 12))}
+
+
+def store_of(af: AS, family) -> ExtensionStore:
+    store = ExtensionStore(af)
+    for S in family:
+        store.add(set(S))
+    return store
+
+
+def check(coll, af: AS, family: set[frozenset]):
+    """
+    Compare une collection à la famille attendue.
+    """
+    names = sorted(af.index)
+    assert len(coll) == len(family)
+    parcours = [frozenset(S) for S in coll]
+    assert len(parcours) == len(family) and set(parcours) == family
+    for S in family:
+        assert S in coll
+        assert set(S) | {"inconnu"} not in coll
+    rnd = random.Random(len(family))
+    for _ in range(20):
+        S = frozenset(a for a in names if rnd.random() < 0.5)
+        assert (S in coll) == (S in family)
+    for a in names + ["inconnu"]:
+        assert coll.is_credulous(a) == any(a in S for S in family)
+        assert coll.is_skeptical(a) == all(a in S for S in family)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_store_and_zdd(seed):
+    rnd = random.Random(seed)
+    af = af_of(rnd.randint(1, 20))
+    family = random_family(rnd, af)
+    store = store_of(af, family)
+    check(store, af, family)
+    check(ZDD(store), af, family)
+
+
+def test_ids_constructor_and_order():
+    af = af_of(3)
+    ids = [[af.index["a0"], af.index["a2"]], [], [af.index["a1"]]]
+    store = ExtensionStore(af, ids)
+    assert list(store) == [{"a0", "a2"}, set(), {"a1"}]      # Ordre d'ajout.
+    with pytest.raises(ValueError):
+        store.add({"inconnu"})
+
+
+def test_empty_families():
+    af = af_of(4)
+    for family in (set(), {frozenset()}):
+        store = store_of(af, family)
+        check(store, af, family)
+        check(ZDD(store), af, family)
+
+
+def test_unaligned_row_not_member():
+    """
+    Les octets d'un masque peuvent apparaître à cheval sur deux lignes : ce n'est pas une extension.
+    """
+    af = af_of(16)                  # Deux octets par ligne.
+    a, b = {af.names[8]}, {af.names[0]}
+    store = store_of(af, [a, b])    # Lignes 00 01 | 01 00 : "01 01" apparaît en position 1.
+    assert store.rows.find(bytes([1, 1])) == 1
+    assert a | b not in store
+    assert a in store and b in store
+
+
+def test_compact():
+    """
+    Les sous-ensembles de 9 arguments, chacun complété par les mêmes 190 autres : 512 lignes de 25 octets
+    pour la matrice, une chaîne de 199 noeuds pour le ZDD.
+    """
+    af = af_of(199)
+    names = sorted(af.index)
+    free, common = names[:9], frozenset(names[9:])
+    family = {frozenset(a for i, a in enumerate(free) if k >> i & 1) | common for k in range(1 << len(free))}
+    store = store_of(af, family)
+    petit = store_of(af, list(family)[:SHARE_MIN - 1])
+    assert compact(petit) is petit          # Trop peu d'extensions : le ZDD n'est pas essayé.
+    zdd = compact(store)
+    assert isinstance(zdd, ZDD) and zdd.nbytes() < store.nbytes()
+    check(zdd, af, family)
+    assert compact(zdd) is zdd